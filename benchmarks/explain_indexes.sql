@@ -0,0 +1,92 @@
+-- EXPLAIN ANALYZE before/after for the V20 composite indexes.
+--
+-- Run against a scratch database migrated to V20 (never production):
+--   psql -d medTech_bench -v ON_ERROR_STOP=1 -f benchmarks/explain_indexes.sql > benchmarks/explain_indexes.out
+--
+-- Everything runs in one transaction that is rolled back at the end: the synthetic dataset
+-- is inserted, the "before" plans are taken with the V20 indexes swapped back to the V1 ones
+-- (rolled back to a savepoint), then the "after" plans are taken with the indexes as migrated.
+
+\set sectors 40
+\set months 60
+\set events_per_period 25
+\set notifications_per_period 40
+
+BEGIN;
+
+-- Synthetic dataset ---------------------------------------------------------------------------
+
+CREATE TEMP TABLE bench_sectors ON COMMIT DROP AS
+SELECT gen_random_uuid() AS id, s AS n FROM generate_series(1, :sectors) s;
+
+INSERT INTO sectors (id, name, code, active)
+SELECT id, 'Bench sector ' || n, 'BENCH-' || n, TRUE FROM bench_sectors;
+
+CREATE TEMP TABLE bench_periods ON COMMIT DROP AS
+SELECT gen_random_uuid() AS id, s.id AS sector_id,
+       2021 + (m - 1) / 12 AS year, 1 + (m - 1) % 12 AS month
+FROM bench_sectors s, generate_series(1, :months) m;
+
+INSERT INTO periods (id, month, year, sector_id, status)
+SELECT id, month, year, sector_id, 'CLOSED' FROM bench_periods;
+
+INSERT INTO compliance_indicators (period_id, sector_id, complete_wristband, patient_communication,
+    medication_identified, hand_hygiene_adherence, fall_risk_assessment, pressure_injury_risk_assessment)
+SELECT id, sector_id, 90, 85, 80, 75, 70, 65 FROM bench_periods;
+
+INSERT INTO hand_hygiene_assessments (period_id, sector_id, compliance_percentage)
+SELECT id, sector_id, 88 FROM bench_periods;
+
+INSERT INTO fall_risk_assessments (period_id, sector_id, total_patients, assessed_on_admission, assessment_percentage,
+    high_risk, medium_risk, low_risk, not_assessed,
+    high_risk_percentage, medium_risk_percentage, low_risk_percentage, not_assessed_percentage)
+SELECT id, sector_id, 100, 90, 90, 20, 30, 40, 10, 20, 30, 40, 10 FROM bench_periods;
+
+INSERT INTO pressure_injury_risk_assessments (period_id, sector_id, total_patients, assessed_on_admission,
+    assessment_percentage, high_risk, medium_risk, low_risk, not_assessed,
+    high_risk_percentage, medium_risk_percentage, low_risk_percentage, not_assessed_percentage)
+SELECT id, sector_id, 100, 90, 90, 20, 30, 40, 10, 20, 30, 40, 10 FROM bench_periods;
+
+INSERT INTO adverse_events (period_id, sector_id, event_date, event_type, description, quantity_cases, quantity_notifications)
+SELECT p.id, p.sector_id, make_date(p.year, p.month, 1 + (e % 28)), 'FALL', 'Bench event ' || e, 1, 1
+FROM bench_periods p, generate_series(1, :events_per_period) e;
+
+INSERT INTO notifications (period_id, sector_id, description, quantity_classification, quantity_category,
+    quantity_professional, quantity)
+SELECT p.id, p.sector_id, 'Bench notification ' || n, 1, 1, 1, 1
+FROM bench_periods p, generate_series(1, :notifications_per_period) n;
+
+ANALYZE sectors, periods, compliance_indicators, hand_hygiene_assessments, fall_risk_assessments,
+    pressure_injury_risk_assessments, adverse_events, notifications;
+
+-- Probe values: a sector in the middle, one of its periods and a two-year window
+SELECT id AS probe_sector FROM bench_sectors WHERE n = :sectors / 2 \gset
+SELECT id AS probe_period FROM bench_periods
+WHERE sector_id = :'probe_sector' AND year = 2023 AND month = 6 \gset
+
+-- Queries under test ---------------------------------------------------------------------------
+-- Each one mirrors the SQL Hibernate generates for the repository method named above it.
+
+\set explain 'EXPLAIN (ANALYZE, BUFFERS, COSTS OFF, SUMMARY ON)'
+
+\o
+\echo '==================== BEFORE (V1 single-column indexes) ===================='
+SAVEPOINT before_indexes;
+
+DROP INDEX idx_periods_sector_year_month;
+DROP INDEX idx_periods_sector_period_key;
+DROP INDEX idx_adverse_events_period_sector_date;
+DROP INDEX idx_notifications_period_sector;
+CREATE INDEX idx_periods_sector_id ON periods(sector_id);
+CREATE INDEX idx_adverse_events_period_id ON adverse_events(period_id);
+CREATE INDEX idx_notifications_period_id ON notifications(period_id);
+ANALYZE periods, adverse_events, notifications;
+
+\ir explain_indexes_queries.sql
+
+ROLLBACK TO SAVEPOINT before_indexes;
+
+\echo '==================== AFTER (V20 composite indexes) ===================='
+\ir explain_indexes_queries.sql
+
+ROLLBACK;
@@ -0,0 +1,42 @@
+-- Included twice by explain_indexes.sql (before and after the V20 indexes).
+
+\echo '--- PeriodRepository.search(sectorId, null, null)'
+:explain
+SELECT * FROM periods p WHERE p.sector_id = :'probe_sector' ORDER BY p.year DESC, p.month DESC;
+
+\echo '--- PeriodRepository.search(sectorId, CLOSED, 2023)'
+:explain
+SELECT * FROM periods p WHERE p.sector_id = :'probe_sector' AND p.status = 'CLOSED' AND p.year = 2023
+ORDER BY p.year DESC, p.month DESC;
+
+\echo '--- AdverseEventRepository.findByPeriodIdAndSectorId'
+:explain
+SELECT * FROM adverse_events a WHERE a.period_id = :'probe_period' AND a.sector_id = :'probe_sector';
+
+\echo '--- AdverseEventRepository.findByPeriodIdAndSectorIdAndEventDateBetween'
+:explain
+SELECT * FROM adverse_events a WHERE a.period_id = :'probe_period' AND a.sector_id = :'probe_sector'
+AND a.event_date BETWEEN DATE '2023-06-01' AND DATE '2023-06-15';
+
+\echo '--- NotificationRepository.findByPeriodIdAndSectorId'
+:explain
+SELECT * FROM notifications n WHERE n.period_id = :'probe_period' AND n.sector_id = :'probe_sector';
+
+\echo '--- HandHygieneAssessmentRepository.findByPeriodId (UNIQUE index, unchanged)'
+:explain
+SELECT * FROM hand_hygiene_assessments h WHERE h.period_id = :'probe_period';
+
+\echo '--- AdverseEventRepository.findBySectorIdInAndPeriodRange (2 years)'
+:explain
+SELECT * FROM adverse_events a WHERE a.sector_id IN (:'probe_sector') AND a.period_id IN (
+    SELECT p.id FROM periods p WHERE p.sector_id IN (:'probe_sector')
+    AND (p.year * 12 + p.month) BETWEEN 2022 * 12 + 1 AND 2023 * 12 + 12)
+ORDER BY a.event_date DESC;
+
+\echo '--- FallRiskAssessmentRepository.aggregateByPeriodRange (2 years)'
+:explain
+SELECT p.sector_id, SUM(f.total_patients), SUM(f.high_risk)
+FROM fall_risk_assessments f, periods p
+WHERE p.id = f.period_id AND p.sector_id IN (:'probe_sector')
+AND (p.year * 12 + p.month) BETWEEN 2022 * 12 + 1 AND 2023 * 12 + 12
+GROUP BY p.sector_id;
@@ -0,0 +1,294 @@
+"""
+HTTP load benchmark for the API.
+
+Runs concurrent scenarios against a running instance (ideally loaded with the
+synthetic-data profile) and reports latency percentiles and throughput per scenario.
+Results are written as JSON so runs can be compared with --compare.
+
+    python benchmarks/load_test.py --scenarios login,dashboard --concurrency 16 --duration 60
+    python benchmarks/load_test.py --output after.json --compare before.json
+"""
+import argparse
+import datetime
+import json
+import random
+import statistics
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BASE_URL = "http://localhost:8080/api/v1"
+ADMIN_EMAIL = "admin@douglas.com"
+ADMIN_PASSWORD = "admin123"
+
+
+def log(msg, status=None):
+    if status:
+        print(f"[{status}] {msg}")
+    else:
+        print(f"{msg}")
+
+
+def login(session, base_url, email, password):
+    res = session.post(f"{base_url}/auth/login", json={"email": email, "password": password})
+    if res.status_code != 200:
+        raise RuntimeError(f"Login failed ({res.status_code}): {res.text}")
+    return res.json()["data"]["token"]
+
+
+# --- Seed data ---
+def load_fixtures(base_url, token, max_sectors):
+    """Reads the ids the scenarios pick from: sectors, their open periods and classifications."""
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {token}"})
+
+    res = session.get(f"{base_url}/sectors")
+    res.raise_for_status()
+    sectors = [s["id"] for s in res.json()["data"]][:max_sectors]
+    if not sectors:
+        raise RuntimeError("No sectors found; run the app once with the synthetic-data profile first")
+
+    open_periods = []
+    for sector_id in sectors:
+        res = session.get(f"{base_url}/periods", params={"sectorId": sector_id, "status": "OPEN"})
+        if res.status_code == 200:
+            open_periods += [(sector_id, p["id"]) for p in res.json()["data"]]
+
+    res = session.get(f"{base_url}/notification-classifications")
+    classifications = [c["id"] for c in res.json()["data"]] if res.status_code == 200 else []
+
+    return {"sectors": sectors, "open_periods": open_periods, "classifications": classifications}
+
+
+# --- Scenarios ---
+# Each scenario is called repeatedly by one worker; it performs one request and returns the response.
+
+def scenario_login(ctx, session):
+    return session.post(f"{ctx['base_url']}/auth/login",
+                        json={"email": ctx["email"], "password": ctx["password"]})
+
+
+def scenario_dashboard(ctx, session):
+    # Same request the dashboard issues on refresh: a cumulative panel over a recent window
+    year = datetime.date.today().year - random.randint(0, ctx["years"] - 1)
+    return session.get(f"{ctx['base_url']}/reports/panel/cumulative", params={
+        "sectorId": random.choice(ctx["fixtures"]["sectors"]),
+        "periodicity": random.choice(["ANNUAL", "SEMESTRAL", "QUARTERLY"]),
+        "year": year,
+        "period": 1,
+    })
+
+
+def scenario_notification_entry(ctx, session):
+    sector_id, period_id = random.choice(ctx["fixtures"]["open_periods"])
+    classifications = ctx["fixtures"]["classifications"]
+    quantity = random.randint(1, 5)
+    return session.post(f"{ctx['base_url']}/notifications", json={
+        "periodId": period_id,
+        "sectorId": sector_id,
+        "classificationId": random.choice(classifications) if classifications else None,
+        "classificationText": None if classifications else "Benchmark",
+        "description": f"Load test {uuid.uuid4().hex[:8]}",
+        "professionalCategoryId": None,
+        "professionalCategoryText": "Benchmark",
+        "quantityClassification": quantity,
+        "quantityCategory": quantity,
+        "quantityProfessional": quantity,
+        "quantity": quantity,
+    })
+
+
+def scenario_audit_browse(ctx, session):
+    # Follows the keyset cursor for a few pages, like a user scrolling the audit screen
+    cursor = session.audit_cursor if session.audit_pages < 5 else None
+    params = {"size": 50}
+    if cursor:
+        params["cursor"] = cursor
+    res = session.get(f"{ctx['base_url']}/audit-logs", params=params)
+    if res.status_code == 200:
+        session.audit_cursor = res.json().get("nextCursor")
+        session.audit_pages = session.audit_pages + 1 if cursor else 1
+    return res
+
+
+SCENARIOS = {
+    "login": scenario_login,
+    "dashboard": scenario_dashboard,
+    "notifications": scenario_notification_entry,
+    "audit": scenario_audit_browse,
+}
+
+
+# --- Runner ---
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_scenario(name, ctx, concurrency, duration, warmup):
+    fn = SCENARIOS[name]
+    latencies = []
+    status_codes = {}
+    errors = 0
+    lock = threading.Lock()
+
+    def worker():
+        nonlocal errors
+        session = requests.Session()
+        session.headers.update({"Authorization": f"Bearer {ctx['token']}"})
+        session.audit_cursor = None
+        session.audit_pages = 0
+
+        warmup_end = time.monotonic() + warmup
+        while time.monotonic() < warmup_end:
+            try:
+                fn(ctx, session)
+            except requests.RequestException:
+                pass
+
+        local_latencies = []
+        local_codes = {}
+        local_errors = 0
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            start = time.perf_counter()
+            try:
+                res = fn(ctx, session)
+                elapsed = (time.perf_counter() - start) * 1000
+                local_codes[res.status_code] = local_codes.get(res.status_code, 0) + 1
+                if res.status_code >= 400:
+                    local_errors += 1
+                else:
+                    local_latencies.append(elapsed)
+            except requests.RequestException:
+                local_errors += 1
+
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+            for code, count in local_codes.items():
+                status_codes[code] = status_codes.get(code, 0) + count
+
+    log(f"Running '{name}' with {concurrency} workers for {duration}s (+{warmup}s warmup)...")
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+
+    latencies.sort()
+    result = {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "status_codes": {str(k): v for k, v in sorted(status_codes.items())},
+        "throughput_rps": round(len(latencies) / duration, 2),
+        "latency_ms": {
+            "min": round(latencies[0], 2) if latencies else None,
+            "mean": round(statistics.fmean(latencies), 2) if latencies else None,
+            "p50": round(percentile(latencies, 50), 2) if latencies else None,
+            "p95": round(percentile(latencies, 95), 2) if latencies else None,
+            "p99": round(percentile(latencies, 99), 2) if latencies else None,
+            "max": round(latencies[-1], 2) if latencies else None,
+        },
+    }
+    lat = result["latency_ms"]
+    log(f"{name}: {result['throughput_rps']} req/s, p50={lat['p50']} p95={lat['p95']} p99={lat['p99']} ms, "
+        f"errors={errors}", "OK" if errors == 0 else "WARN")
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    log(f"\n--- Compared with {baseline_path} ({baseline.get('commit')}) ---")
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        parts = []
+        for key in ("p50", "p95", "p99"):
+            old, new = before["latency_ms"].get(key), result["latency_ms"].get(key)
+            if old and new:
+                parts.append(f"{key} {old} -> {new} ms ({(new - old) / old * 100:+.1f}%)")
+        old_rps, new_rps = before["throughput_rps"], result["throughput_rps"]
+        if old_rps:
+            parts.append(f"throughput {old_rps} -> {new_rps} req/s ({(new_rps - old_rps) / old_rps * 100:+.1f}%)")
+        log(f"{name}: " + ", ".join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load benchmark for the API")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--email", default=ADMIN_EMAIL)
+    parser.add_argument("--password", default=ADMIN_PASSWORD)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"Comma separated, any of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=int, default=30, help="Measured seconds per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured seconds per scenario")
+    parser.add_argument("--years", type=int, default=3, help="How many past years the dashboard scenario picks from")
+    parser.add_argument("--max-sectors", type=int, default=50, help="Sectors the scenarios pick from")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="JSON file (default: load_test_<timestamp>.json)")
+    parser.add_argument("--compare", default=None, help="Previous result file to compare against")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in names if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+    token = login(requests.Session(), args.base_url, args.email, args.password)
+    fixtures = load_fixtures(args.base_url, token, args.max_sectors)
+    log(f"Fixtures: {len(fixtures['sectors'])} sectors, {len(fixtures['open_periods'])} open periods")
+    if "notifications" in names and not fixtures["open_periods"]:
+        log("No open periods, skipping 'notifications'", "WARN")
+        names.remove("notifications")
+
+    ctx = {
+        "base_url": args.base_url,
+        "email": args.email,
+        "password": args.password,
+        "token": token,
+        "years": args.years,
+        "fixtures": fixtures,
+    }
+
+    started = datetime.datetime.now()
+    results = {
+        "started_at": started.isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "config": {
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+        },
+        "scenarios": {name: run_scenario(name, ctx, args.concurrency, args.duration, args.warmup) for name in names},
+    }
+
+    output = args.output or f"load_test_{started.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    log(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ plugins {
 	id("org.springframework.boot") version "3.4.1"
 	id("io.spring.dependency-management") version "1.1.7"
 	kotlin("plugin.jpa") version "1.9.25"
+	id("me.champeau.jmh") version "0.7.3"
 }
 
 group = "com.medTech"
@@ -25,8 +26,11 @@ dependencies {
 	implementation("org.springframework.boot:spring-boot-starter-security")
 	implementation("org.springframework.boot:spring-boot-starter-validation")
 	implementation("org.springframework.boot:spring-boot-starter-web")
+	implementation("org.springframework.boot:spring-boot-starter-actuator")
+	implementation("org.springframework.boot:spring-boot-starter-aop")
 	implementation("org.jetbrains.kotlin:kotlin-reflect")
 	implementation("com.fasterxml.jackson.module:jackson-module-kotlin")
+	implementation("com.github.ben-manes.caffeine:caffeine")
 	
 	// JWT
 	implementation("io.jsonwebtoken:jjwt-api:0.12.3")
@@ -37,10 +41,22 @@ dependencies {
 	implementation("org.flywaydb:flyway-core")
 	implementation("org.flywaydb:flyway-database-postgresql")
 	
+	// Spreadsheet export (streaming SXSSF workbook)
+	implementation("org.apache.poi:poi-ooxml:5.3.0")
+
+	// Metrics (Prometheus scrape endpoint, Hibernate statistics)
+	implementation("io.micrometer:micrometer-registry-prometheus")
+	implementation("org.hibernate.orm:hibernate-micrometer")
+
+	// Statement counting and slow-query log (wraps the DataSource)
+	implementation("net.ttddyy:datasource-proxy:1.10")
+
 	// OpenAPI/Swagger
 	implementation("org.springdoc:springdoc-openapi-starter-webmvc-ui:2.8.3")
 
-	runtimeOnly("org.postgresql:postgresql")
+	// PostgreSQL driver (compile scope for CopyManager, used to archive audit partitions)
+	implementation("org.postgresql:postgresql")
+
 	testImplementation("org.springframework.boot:spring-boot-starter-test")
 	testImplementation("org.springframework.security:spring-security-test")
 	testImplementation("org.jetbrains.kotlin:kotlin-test-junit5")
@@ -59,6 +75,17 @@ allOpen {
 	annotation("jakarta.persistence.Embeddable")
 }
 
+// Microbenchmarks live in src/jmh; run with ./gradlew jmh (results in build/reports/jmh).
+// The gc profiler adds allocation rates (gc.alloc.rate.norm = bytes per operation) to every result.
+jmh {
+	warmupIterations = 3
+	iterations = 5
+	fork = 1
+	profilers = listOf("gc")
+	resultFormat = "JSON"
+	includes = listOfNotNull(project.findProperty("jmhInclude") as String?)
+}
+
 tasks.withType<Test> {
 	useJUnitPlatform()
 }
@@ -0,0 +1,144 @@
+package com.medTech.Douglas.benchmark
+
+import com.medTech.Douglas.api.dto.report.*
+import com.medTech.Douglas.domain.entity.*
+import com.medTech.Douglas.domain.enums.EventType
+import com.medTech.Douglas.domain.enums.JobTitle
+import java.lang.reflect.Proxy
+import java.math.BigDecimal
+import java.math.RoundingMode
+import java.time.LocalDate
+import java.util.Random
+import java.util.UUID
+
+/**
+ * Deterministic inputs shaped like the synthetic-data profile: one sector/period with
+ * fully initialized entities (as after a fetch join), so mappers never reach a repository.
+ */
+object BenchmarkFixtures {
+
+    val sectorId: UUID = UUID.fromString("00000000-0000-0000-0000-000000000001")
+    val periodId: UUID = UUID.fromString("00000000-0000-0000-0000-000000000002")
+
+    /** Repositories the mapped path never calls; any call fails the benchmark loudly. */
+    inline fun <reified T> unused(): T =
+        Proxy.newProxyInstance(T::class.java.classLoader, arrayOf(T::class.java)) { _, method, _ ->
+            throw UnsupportedOperationException("${T::class.simpleName}.${method.name} is not part of the benchmark")
+        } as T
+
+    fun users(count: Int): Map<UUID, User> = (1..count).associate { n ->
+        val user = User(
+            email = "user$n@douglas.com",
+            name = "Usuário $n",
+            passwordHash = "hash",
+            jobTitle = JobTitle.values()[n % JobTitle.values().size]
+        )
+        user.id to user
+    }
+
+    fun notifications(count: Int, seed: Long = 42): List<Notification> {
+        val random = Random(seed)
+        val classifications = (1..4).map { NotificationClassification(name = "Classificação $it") }
+        val categories = (1..5).map { ProfessionalCategory(name = "Categoria $it") }
+        return (1..count).map { n ->
+            val quantity = 1 + random.nextInt(5)
+            Notification(
+                periodId = periodId,
+                sectorId = sectorId,
+                classification = classifications[random.nextInt(classifications.size)],
+                description = "Notificação $n",
+                professionalCategory = categories[random.nextInt(categories.size)],
+                quantityClassification = quantity,
+                quantityCategory = quantity,
+                quantityProfessional = quantity,
+                quantity = quantity
+            )
+        }
+    }
+
+    fun adverseEvents(count: Int, users: Map<UUID, User>, seed: Long = 42): List<AdverseEvent> {
+        val random = Random(seed)
+        val userIds = users.keys.toList()
+        val types = EventType.values()
+        return (1..count).map { n ->
+            AdverseEvent(
+                periodId = periodId,
+                sectorId = sectorId,
+                eventDate = LocalDate.of(2025, 1 + random.nextInt(12), 1 + random.nextInt(28)),
+                eventType = types[random.nextInt(types.size)],
+                description = "Evento adverso $n",
+                quantityCases = 1 + random.nextInt(3),
+                quantityNotifications = random.nextInt(3),
+                createdBy = if (userIds.isEmpty()) null else userIds[random.nextInt(userIds.size)]
+            )
+        }
+    }
+
+    fun complianceIndicator() = ComplianceIndicator(
+        periodId = periodId,
+        sectorId = sectorId,
+        completeWristband = BigDecimal("91.50"),
+        patientCommunication = BigDecimal("84.25"),
+        medicationIdentified = BigDecimal("88.00"),
+        handHygieneAdherence = BigDecimal("76.40"),
+        fallRiskAssessment = BigDecimal("70.10"),
+        pressureInjuryRiskAssessment = BigDecimal("72.35"),
+        observations = "Observação do período"
+    )
+
+    fun handHygiene() = HandHygieneAssessment(periodId = periodId, sectorId = sectorId, compliancePercentage = BigDecimal("78.90"))
+
+    fun fallRisk() = FallRiskAssessment(
+        periodId = periodId, sectorId = sectorId, totalPatients = 80, assessedOnAdmission = 74,
+        assessmentPercentage = BigDecimal("92.50"), highRisk = 20, mediumRisk = 30, lowRisk = 24, notAssessed = 6,
+        highRiskPercentage = BigDecimal("25.00"), mediumRiskPercentage = BigDecimal("37.50"),
+        lowRiskPercentage = BigDecimal("30.00"), notAssessedPercentage = BigDecimal("7.50")
+    )
+
+    fun pressureInjury() = PressureInjuryRiskAssessment(
+        periodId = periodId, sectorId = sectorId, totalPatients = 80, assessedOnAdmission = 74,
+        assessmentPercentage = BigDecimal("92.50"), veryHigh = 8, highRisk = 12, mediumRisk = 30, lowRisk = 24,
+        notAssessed = 6, veryHighPercentage = BigDecimal("10.00"), highRiskPercentage = BigDecimal("15.00"),
+        mediumRiskPercentage = BigDecimal("37.50"), lowRiskPercentage = BigDecimal("30.00"),
+        notAssessedPercentage = BigDecimal("7.50")
+    )
+
+    fun selfNotification() = SelfNotification(periodId = periodId, sectorId = sectorId, quantity = 12, percentage = BigDecimal("64.00"))
+
+    fun metaCompliance() = MetaCompliance(periodId = periodId, sectorId = sectorId, goalValue = BigDecimal("100.00"), percentage = BigDecimal("93.00"))
+
+    fun medicationCompliance() = MedicationCompliance(periodId = periodId, sectorId = sectorId, percentage = BigDecimal("97.00"))
+
+    /** Per-sector sums as the GROUP BY queries return them for [months] monthly periods. */
+    class SectorTotals(
+        val compliance: ComplianceTotals,
+        val observations: List<String>,
+        val handHygiene: HandHygieneTotals,
+        val fallRisk: FallRiskTotals,
+        val pressureInjury: PressureInjuryTotals,
+        val selfNotification: SelfNotificationTotals,
+        val metaCompliance: MetaComplianceTotals,
+        val medicationCompliance: MedicationComplianceTotals
+    )
+
+    fun sectorTotals(sectors: Int, months: Int, seed: Long = 42): List<SectorTotals> {
+        val random = Random(seed)
+        fun sum(mean: Int) = BigDecimal.valueOf((mean + random.nextGaussian() * 5) * months).setScale(2, RoundingMode.HALF_UP)
+        fun count(mean: Int) = (mean + random.nextInt(mean)).toLong() * months
+        val rows = months.toLong()
+
+        return (1..sectors).map { n ->
+            val id = UUID(0L, n.toLong())
+            SectorTotals(
+                compliance = ComplianceTotals(id, rows, sum(90), sum(85), sum(88), sum(76), sum(70), sum(72)),
+                observations = (1..months / 3).map { "Observação $it do setor $n" },
+                handHygiene = HandHygieneTotals(id, rows, sum(78)),
+                fallRisk = FallRiskTotals(id, count(80), count(70), count(20), count(25), count(20), count(5)),
+                pressureInjury = PressureInjuryTotals(id, count(80), count(70), count(8), count(12), count(25), count(20), count(5)),
+                selfNotification = SelfNotificationTotals(id, count(12), sum(64 * 12)),
+                metaCompliance = MetaComplianceTotals(id, rows, sum(100), sum(93)),
+                medicationCompliance = MedicationComplianceTotals(id, rows, sum(97))
+            )
+        }
+    }
+}
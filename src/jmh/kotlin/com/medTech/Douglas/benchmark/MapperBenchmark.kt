@@ -0,0 +1,73 @@
+package com.medTech.Douglas.benchmark
+
+import com.medTech.Douglas.domain.entity.*
+import com.medTech.Douglas.service.ReferenceDataCache
+import com.medTech.Douglas.service.mapper.AdverseEventMapper
+import com.medTech.Douglas.service.mapper.IndicatorMapper
+import com.medTech.Douglas.service.mapper.NotificationMapper
+import org.openjdk.jmh.annotations.*
+import org.openjdk.jmh.infra.Blackhole
+import java.util.UUID
+import java.util.concurrent.TimeUnit
+
+/**
+ * Entity to DTO mapping for the row counts a panel report maps per request.
+ */
+@State(Scope.Benchmark)
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.MICROSECONDS)
+open class MapperBenchmark {
+
+    @Param("100", "1000", "10000")
+    @JvmField
+    var rows: Int = 0
+
+    private val indicatorMapper = IndicatorMapper()
+    private val adverseEventMapper = AdverseEventMapper(BenchmarkFixtures.unused())
+    private val notificationMapper = NotificationMapper(
+        BenchmarkFixtures.unused(),
+        BenchmarkFixtures.unused(),
+        ReferenceDataCache(BenchmarkFixtures.unused(), BenchmarkFixtures.unused())
+    )
+
+    private lateinit var notifications: List<Notification>
+    private lateinit var adverseEvents: List<AdverseEvent>
+    private lateinit var users: Map<UUID, User>
+    private lateinit var compliance: ComplianceIndicator
+    private lateinit var fallRisk: FallRiskAssessment
+    private lateinit var pressureInjury: PressureInjuryRiskAssessment
+
+    @Setup
+    fun setup() {
+        users = BenchmarkFixtures.users(20)
+        notifications = BenchmarkFixtures.notifications(rows)
+        adverseEvents = BenchmarkFixtures.adverseEvents(rows, users)
+        compliance = BenchmarkFixtures.complianceIndicator()
+        fallRisk = BenchmarkFixtures.fallRisk()
+        pressureInjury = BenchmarkFixtures.pressureInjury()
+    }
+
+    @Benchmark
+    fun notifications(blackhole: Blackhole) {
+        for (notification in notifications) {
+            blackhole.consume(notificationMapper.toResponse(notification))
+        }
+    }
+
+    @Benchmark
+    fun adverseEvents(blackhole: Blackhole) {
+        for (event in adverseEvents) {
+            blackhole.consume(adverseEventMapper.toResponse(event, users))
+        }
+    }
+
+    // One row per period: [rows] stands for the number of periods mapped
+    @Benchmark
+    fun indicators(blackhole: Blackhole) {
+        repeat(rows) {
+            blackhole.consume(indicatorMapper.toResponse(compliance))
+            blackhole.consume(indicatorMapper.toResponse(fallRisk))
+            blackhole.consume(indicatorMapper.toResponse(pressureInjury))
+        }
+    }
+}
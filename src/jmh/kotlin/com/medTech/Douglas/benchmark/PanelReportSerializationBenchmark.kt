@@ -0,0 +1,66 @@
+package com.medTech.Douglas.benchmark
+
+import com.fasterxml.jackson.databind.ObjectMapper
+import com.fasterxml.jackson.databind.SerializationFeature
+import com.fasterxml.jackson.module.kotlin.jacksonObjectMapper
+import com.medTech.Douglas.api.dto.ApiResponse
+import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
+import com.medTech.Douglas.service.ReferenceDataCache
+import com.medTech.Douglas.service.mapper.AdverseEventMapper
+import com.medTech.Douglas.service.mapper.IndicatorMapper
+import com.medTech.Douglas.service.mapper.NewComplianceMapper
+import com.medTech.Douglas.service.mapper.NotificationMapper
+import com.medTech.Douglas.service.mapper.SelfNotificationMapper
+import org.openjdk.jmh.annotations.*
+import java.util.concurrent.TimeUnit
+
+/**
+ * Jackson serialization of a complete panel report, wrapped in [ApiResponse] as the
+ * controller returns it, for small and large notification/adverse event lists.
+ */
+@State(Scope.Benchmark)
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.MICROSECONDS)
+open class PanelReportSerializationBenchmark {
+
+    @Param("10", "500", "5000")
+    @JvmField
+    var rows: Int = 0
+
+    // Same settings Spring Boot applies to its ObjectMapper (java.time as ISO strings)
+    private val objectMapper: ObjectMapper = jacksonObjectMapper()
+        .findAndRegisterModules()
+        .disable(SerializationFeature.WRITE_DATES_AS_TIMESTAMPS)
+
+    private lateinit var report: ApiResponse<CompletePanelReportResponse>
+
+    @Setup
+    fun setup() {
+        val indicatorMapper = IndicatorMapper()
+        val newComplianceMapper = NewComplianceMapper()
+        val notificationMapper = NotificationMapper(
+            BenchmarkFixtures.unused(),
+            BenchmarkFixtures.unused(),
+            ReferenceDataCache(BenchmarkFixtures.unused(), BenchmarkFixtures.unused())
+        )
+        val adverseEventMapper = AdverseEventMapper(BenchmarkFixtures.unused())
+        val users = BenchmarkFixtures.users(20)
+
+        report = ApiResponse.success(
+            CompletePanelReportResponse(
+                complianceIndicator = indicatorMapper.toResponse(BenchmarkFixtures.complianceIndicator()),
+                handHygieneAssessment = indicatorMapper.toResponse(BenchmarkFixtures.handHygiene()),
+                fallRiskAssessment = indicatorMapper.toResponse(BenchmarkFixtures.fallRisk()),
+                pressureInjuryRiskAssessment = indicatorMapper.toResponse(BenchmarkFixtures.pressureInjury()),
+                selfNotification = SelfNotificationMapper().toResponse(BenchmarkFixtures.selfNotification()),
+                metaCompliance = newComplianceMapper.toResponse(BenchmarkFixtures.metaCompliance()),
+                medicationCompliance = newComplianceMapper.toResponse(BenchmarkFixtures.medicationCompliance()),
+                adverseEvents = BenchmarkFixtures.adverseEvents(rows, users).map { adverseEventMapper.toResponse(it, users) },
+                notifications = BenchmarkFixtures.notifications(rows).map { notificationMapper.toResponse(it) }
+            )
+        )
+    }
+
+    @Benchmark
+    fun writeValueAsBytes(): ByteArray = objectMapper.writeValueAsBytes(report)
+}
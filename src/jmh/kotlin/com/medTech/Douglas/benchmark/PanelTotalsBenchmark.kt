@@ -0,0 +1,45 @@
+package com.medTech.Douglas.benchmark
+
+import com.medTech.Douglas.service.usecase.report.PanelTotalsAssembler
+import org.openjdk.jmh.annotations.*
+import org.openjdk.jmh.infra.Blackhole
+import java.util.concurrent.TimeUnit
+
+/**
+ * Division, percentage and rounding work done per sector when the cumulative panel is
+ * assembled from the GROUP BY totals (the part of the report that still runs in the JVM).
+ */
+@State(Scope.Benchmark)
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.MICROSECONDS)
+open class PanelTotalsBenchmark {
+
+    @Param("1", "20", "100")
+    @JvmField
+    var sectors: Int = 0
+
+    @Param("12")
+    @JvmField
+    var months: Int = 0
+
+    private val assembler = PanelTotalsAssembler()
+    private lateinit var totals: List<BenchmarkFixtures.SectorTotals>
+
+    @Setup
+    fun setup() {
+        totals = BenchmarkFixtures.sectorTotals(sectors, months)
+    }
+
+    @Benchmark
+    fun assembleSectors(blackhole: Blackhole) {
+        for (sector in totals) {
+            blackhole.consume(assembler.toCompliance(sector.compliance, sector.observations))
+            blackhole.consume(assembler.toHandHygiene(sector.handHygiene))
+            blackhole.consume(assembler.toFallRisk(sector.fallRisk))
+            blackhole.consume(assembler.toPressureInjury(sector.pressureInjury))
+            blackhole.consume(assembler.toSelfNotification(sector.selfNotification))
+            blackhole.consume(assembler.toMetaCompliance(sector.metaCompliance))
+            blackhole.consume(assembler.toMedicationCompliance(sector.medicationCompliance))
+        }
+    }
+}
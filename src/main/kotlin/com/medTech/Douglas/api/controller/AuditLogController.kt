@@ -23,7 +23,7 @@ class AuditLogController(
 ) {
 
     @GetMapping
-    @Operation(summary = "Consultar logs de auditoria com filtros", description = "Permite filtrar logs por ação, recurso, email de usuário e intervalo de datas. Todos os filtros são opcionais.")
+    @Operation(summary = "Consultar logs de auditoria com filtros", description = "Permite filtrar logs por ação, recurso, email de usuário, texto dos detalhes e intervalo de datas. Todos os filtros são opcionais. Resultados paginados por cursor: envie o nextCursor da resposta para obter a próxima página.")
     @PreAuthorize("hasRole('ADMIN')")
     fun search(
         @Parameter(description = "Ação realizada (ex: CREATE, UPDATE, DELETE)", required = false)
@@ -35,13 +35,22 @@ class AuditLogController(
         @Parameter(description = "Email do usuário que realizou a ação (busca parcial)", required = false)
         @RequestParam(required = false) userEmail: String?,
 
+        @Parameter(description = "Texto contido nos detalhes do log (busca parcial, sem diferenciar maiúsculas)", required = false)
+        @RequestParam(required = false) details: String?,
+
         @Parameter(description = "Data de início para filtro (formato ISO Date Time)", required = false)
         @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE_TIME) startDate: LocalDateTime?,
 
         @Parameter(description = "Data de fim para filtro (formato ISO Date Time)", required = false)
-        @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE_TIME) endDate: LocalDateTime?
+        @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE_TIME) endDate: LocalDateTime?,
+
+        @Parameter(description = "Cursor retornado em nextCursor pela página anterior", required = false)
+        @RequestParam(required = false) cursor: String?,
+
+        @Parameter(description = "Quantidade de registros por página (máximo 200)", required = false)
+        @RequestParam(defaultValue = "50") size: Int
     ): ResponseEntity<ApiResponse<List<AuditLog>>> {
-        val logs = auditLogService.search(action, resource, userEmail, startDate, endDate)
-        return ResponseEntity.ok(ApiResponse.success(logs))
+        val page = auditLogService.search(action, resource, userEmail, details, startDate, endDate, cursor, size)
+        return ResponseEntity.ok(ApiResponse.page(page))
     }
 }
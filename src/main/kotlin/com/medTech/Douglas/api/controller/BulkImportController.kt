@@ -0,0 +1,41 @@
+package com.medTech.Douglas.api.controller
+
+import com.medTech.Douglas.api.dto.ApiResponse
+import com.medTech.Douglas.api.dto.bulk.BulkImportResponse
+import com.medTech.Douglas.service.BulkImportService
+import io.swagger.v3.oas.annotations.Operation
+import io.swagger.v3.oas.annotations.responses.ApiResponses
+import io.swagger.v3.oas.annotations.responses.ApiResponse as SwaggerApiResponse
+import io.swagger.v3.oas.annotations.tags.Tag
+import jakarta.servlet.http.HttpServletRequest
+import org.springframework.http.MediaType
+import org.springframework.http.ResponseEntity
+import org.springframework.security.access.prepost.PreAuthorize
+import org.springframework.web.bind.annotation.PostMapping
+import org.springframework.web.bind.annotation.RequestMapping
+import org.springframework.web.bind.annotation.RestController
+
+@RestController
+@RequestMapping("/api/v1/bulk-import")
+@Tag(name = "Importação em Lote", description = "APIs de Importação em Lote de Indicadores, Notificações e Eventos Adversos")
+class BulkImportController(
+    private val bulkImportService: BulkImportService
+) {
+
+    @PostMapping(consumes = [MediaType.APPLICATION_JSON_VALUE, MediaType.APPLICATION_NDJSON_VALUE])
+    @Operation(
+        summary = "Importar registros em lote",
+        description = "Recebe um array JSON ou NDJSON (um registro por linha) no formato {\"type\": \"...\", \"data\": {...}}. " +
+            "Tipos: COMPLIANCE_INDICATOR, HAND_HYGIENE, FALL_RISK, PRESSURE_INJURY_RISK, NOTIFICATION, ADVERSE_EVENT. " +
+            "O campo data segue o mesmo formato do POST individual. Retorna o resultado de cada linha."
+    )
+    @ApiResponses(value = [
+        SwaggerApiResponse(responseCode = "200", description = "Importação processada; verifique o resultado de cada linha")
+    ])
+    @PreAuthorize("hasRole('ADMIN') or hasRole('MANAGER')")
+    fun import(request: HttpServletRequest): ResponseEntity<ApiResponse<BulkImportResponse>> {
+        // Read the body as a stream so large imports are never held in memory as a whole
+        val response = bulkImportService.import(request.inputStream)
+        return ResponseEntity.ok(ApiResponse.success(response, "Importação processada"))
+    }
+}
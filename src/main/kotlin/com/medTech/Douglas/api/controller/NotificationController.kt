@@ -1,8 +1,10 @@
 package com.medTech.Douglas.api.controller
 
 import com.medTech.Douglas.api.dto.ApiResponse
+import com.medTech.Douglas.api.dto.PageResponse
 import com.medTech.Douglas.api.dto.notification.CreateNotificationRequest
 import com.medTech.Douglas.api.dto.notification.NotificationResponse
+import com.medTech.Douglas.api.dto.notification.NotificationSummaryResponse
 import com.medTech.Douglas.api.dto.notification.UpdateNotificationRequest
 import com.medTech.Douglas.service.NotificationService
 import io.swagger.v3.oas.annotations.Operation
@@ -111,6 +113,49 @@ class NotificationController(
         }
     }
 
+    @GetMapping("/page")
+    @Operation(summary = "Listar notificações paginadas", description = "Lista paginada e ordenada de notificações por período (com filtro opcional de classificação) ou por setor. Retorna uma projeção resumida. O total de registros só é calculado quando includeTotal=true.")
+    @ApiResponses(value = [
+        SwaggerApiResponse(responseCode = "200", description = "Página retornada com sucesso"),
+        SwaggerApiResponse(responseCode = "400", description = "Parâmetros inválidos (deve fornecer periodId ou sectorId)")
+    ])
+    @PreAuthorize("hasRole('ADMIN')")
+    fun listPaged(
+        @Parameter(description = "ID do período (Obrigatório se sectorId não informado)", required = false)
+        @RequestParam(required = false) periodId: UUID?,
+
+        @Parameter(description = "ID do setor (Obrigatório se periodId não informado)", required = false)
+        @RequestParam(required = false) sectorId: UUID?,
+
+        @Parameter(description = "ID da Classificação (apenas para filtro por período)", required = false)
+        @RequestParam(required = false) classificationId: UUID?,
+
+        @Parameter(description = "Número da página (começa em 0)", required = false)
+        @RequestParam(defaultValue = "0") page: Int,
+
+        @Parameter(description = "Quantidade de registros por página (máximo 200)", required = false)
+        @RequestParam(defaultValue = "50") size: Int,
+
+        @Parameter(description = "Campo de ordenação (createdAt, updatedAt, quantity, quantityProfessional)", required = false)
+        @RequestParam(defaultValue = "createdAt") sort: String,
+
+        @Parameter(description = "Direção da ordenação (ASC ou DESC)", required = false)
+        @RequestParam(defaultValue = "DESC") direction: String,
+
+        @Parameter(description = "Calcula o total de registros e páginas (consulta adicional)", required = false)
+        @RequestParam(defaultValue = "false") includeTotal: Boolean
+    ): ResponseEntity<ApiResponse<PageResponse<NotificationSummaryResponse>>> {
+        if (periodId != null) {
+            val response = notificationService.pageByPeriod(periodId, classificationId, page, size, sort, direction, includeTotal)
+            return ResponseEntity.ok(ApiResponse.success(response))
+        } else if (sectorId != null) {
+            val response = notificationService.pageBySector(sectorId, page, size, sort, direction, includeTotal)
+            return ResponseEntity.ok(ApiResponse.success(response))
+        } else {
+            return ResponseEntity.badRequest().body(ApiResponse.error("Deve fornecer periodId ou sectorId"))
+        }
+    }
+
     @GetMapping("/ranking/professional-category")
     @Operation(summary = "Ranking de categorias profissionais", description = "Retorna um ranking de categorias profissionais com base na quantidade de notificações. Pode ser filtrado por período ou setor.")
     @PreAuthorize("hasRole('ADMIN')")
@@ -124,4 +169,12 @@ class NotificationController(
         val response = notificationService.getProfessionalCategoryRanking(periodId, sectorId)
         return ResponseEntity.ok(ApiResponse.success(response))
     }
+
+    @PostMapping("/ranking/professional-category/rebuild")
+    @Operation(summary = "Recalcular ranking de categorias profissionais", description = "Recalcula a tabela de agregação do ranking a partir de todas as notificações. Necessário apenas após cargas feitas diretamente no banco.")
+    @PreAuthorize("hasRole('ADMIN')")
+    fun rebuildRanking(): ResponseEntity<ApiResponse<Long>> {
+        val rows = notificationService.rebuildProfessionalCategoryRanking()
+        return ResponseEntity.ok(ApiResponse.success(rows, "Ranking recalculado com sucesso"))
+    }
 }
@@ -2,19 +2,28 @@ package com.medTech.Douglas.api.controller
 
 import com.medTech.Douglas.api.dto.ApiResponse
 import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
+import com.medTech.Douglas.api.dto.report.SectorPanelReportResponse
+import com.medTech.Douglas.domain.enums.ExportFormat
 import com.medTech.Douglas.domain.enums.ReportPeriodicity
+import com.medTech.Douglas.service.usecase.report.ExportPanelReportUseCase
 import com.medTech.Douglas.service.usecase.report.GenerateCompletePanelReportUseCase
 import com.medTech.Douglas.service.usecase.report.GenerateCumulativePanelReportUseCase
+import com.medTech.Douglas.service.usecase.report.GenerateDashboardReportUseCase
 import com.medTech.Douglas.service.usecase.report.GeneratePanelReportByRangeUseCase
 import io.swagger.v3.oas.annotations.Operation
 import io.swagger.v3.oas.annotations.Parameter
 import io.swagger.v3.oas.annotations.tags.Tag
+import jakarta.servlet.http.HttpServletResponse
+import org.springframework.beans.factory.annotation.Qualifier
+import org.springframework.http.HttpHeaders
 import org.springframework.format.annotation.DateTimeFormat
 import org.springframework.http.ResponseEntity
 import org.springframework.security.access.prepost.PreAuthorize
 import org.springframework.web.bind.annotation.*
 import java.time.LocalDate
 import java.util.UUID
+import java.util.concurrent.CompletableFuture
+import java.util.concurrent.Executor
 
 @RestController
 @RequestMapping("/api/v1/reports")
@@ -22,7 +31,10 @@ import java.util.UUID
 class ReportController(
     private val generateCompletePanelReportUseCase: GenerateCompletePanelReportUseCase,
     private val generatePanelReportByRangeUseCase: GeneratePanelReportByRangeUseCase,
-    private val generateCumulativePanelReportUseCase: GenerateCumulativePanelReportUseCase
+    private val generateCumulativePanelReportUseCase: GenerateCumulativePanelReportUseCase,
+    private val exportPanelReportUseCase: ExportPanelReportUseCase,
+    private val generateDashboardReportUseCase: GenerateDashboardReportUseCase,
+    @Qualifier("reportRequestExecutor") private val reportRequestExecutor: Executor
 ) {
 
     @GetMapping("/panel")
@@ -33,9 +45,9 @@ class ReportController(
         @RequestParam sectorId: UUID,
         @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) startDate: LocalDate?,
         @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) endDate: LocalDate?
-    ): ResponseEntity<ApiResponse<CompletePanelReportResponse>> {
+    ): CompletableFuture<ResponseEntity<ApiResponse<CompletePanelReportResponse>>> = runReport {
         val response = generateCompletePanelReportUseCase.execute(periodId, sectorId, startDate, endDate)
-        return ResponseEntity.ok(ApiResponse.success(response))
+        ResponseEntity.ok(ApiResponse.success(response))
     }
 
     @GetMapping("/panel/cumulative")
@@ -62,11 +74,42 @@ class ReportController(
 
         @Parameter(description = "Data de fim (se Periodicidade = CUSTOM)", required = false)
         @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) endDate: LocalDate?
-    ): ResponseEntity<ApiResponse<CompletePanelReportResponse>> {
+    ): CompletableFuture<ResponseEntity<ApiResponse<CompletePanelReportResponse>>> = runReport {
         val response = generateCumulativePanelReportUseCase.execute(
             sectorId, periodicity, year, period, startDate, endDate
         )
-        return ResponseEntity.ok(ApiResponse.success(response))
+        ResponseEntity.ok(ApiResponse.success(response))
+    }
+
+    @GetMapping("/panel/dashboard")
+    @Operation(
+        summary = "Gerar painel acumulativo de vários setores",
+        description = "Gera o relatório acumulativo de cada setor informado (ou de todos os setores ativos, se nenhum for informado) em uma única requisição."
+    )
+    @PreAuthorize("hasRole('ADMIN')")
+    fun generateDashboardReport(
+        @Parameter(description = "IDs dos setores (se omitido, todos os setores ativos)", required = false)
+        @RequestParam(required = false) sectorIds: List<UUID>?,
+
+        @Parameter(description = "Periodicidade (CUSTOM, MONTHLY, QUARTERLY, SEMESTRAL, ANNUAL)", required = false)
+        @RequestParam(defaultValue = "CUSTOM") periodicity: ReportPeriodicity,
+
+        @Parameter(description = "Ano de referência (necessário para periodicidades pré-definidas)", required = false)
+        @RequestParam(required = false) year: Int?,
+
+        @Parameter(description = "Período numérico (Mês 1-12, Trimestre 1-4, Semestre 1-2)", required = false)
+        @RequestParam(required = false) period: Int?,
+
+        @Parameter(description = "Data de início (se Periodicidade = CUSTOM)", required = false)
+        @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) startDate: LocalDate?,
+
+        @Parameter(description = "Data de fim (se Periodicidade = CUSTOM)", required = false)
+        @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) endDate: LocalDate?
+    ): CompletableFuture<ResponseEntity<ApiResponse<List<SectorPanelReportResponse>>>> = runReport {
+        val response = generateDashboardReportUseCase.execute(
+            sectorIds, periodicity, year, period, startDate, endDate
+        )
+        ResponseEntity.ok(ApiResponse.success(response))
     }
 
     @GetMapping("/panel/range")
@@ -76,8 +119,43 @@ class ReportController(
         @RequestParam sectorId: UUID,
         @RequestParam @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) startDate: LocalDate,
         @RequestParam @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) endDate: LocalDate
-    ): ResponseEntity<ApiResponse<List<CompletePanelReportResponse>>> {
+    ): CompletableFuture<ResponseEntity<ApiResponse<List<CompletePanelReportResponse>>>> = runReport {
         val response = generatePanelReportByRangeUseCase.execute(sectorId, startDate, endDate)
-        return ResponseEntity.ok(ApiResponse.success(response))
+        ResponseEntity.ok(ApiResponse.success(response))
+    }
+
+    @GetMapping("/panel/export")
+    @Operation(
+        summary = "Exportar painel mensal (CSV/XLSX)",
+        description = "Exporta uma linha por período e setor no intervalo informado. O arquivo é gerado em streaming, direto do banco para a resposta."
+    )
+    @PreAuthorize("hasRole('ADMIN')")
+    fun exportPanelReport(
+        @Parameter(description = "IDs dos setores", required = true)
+        @RequestParam sectorIds: List<UUID>,
+
+        @Parameter(description = "Data de início", required = true)
+        @RequestParam @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) startDate: LocalDate,
+
+        @Parameter(description = "Data de fim", required = true)
+        @RequestParam @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) endDate: LocalDate,
+
+        @Parameter(description = "Formato do arquivo (CSV ou XLSX)", required = false)
+        @RequestParam(defaultValue = "CSV") format: ExportFormat,
+
+        response: HttpServletResponse
+    ) {
+        response.contentType = format.contentType
+        response.setHeader(
+            HttpHeaders.CONTENT_DISPOSITION,
+            "attachment; filename=\"painel_${startDate}_${endDate}.${format.extension}\""
+        )
+        exportPanelReportUseCase.execute(sectorIds, startDate, endDate, format, response.outputStream)
     }
+
+    // Runs on the executor chosen by report.executor.request-mode. With SYNC the future is
+    // already complete when returned; otherwise the servlet thread is released meanwhile.
+    // Failures reach the exception handler unwrapped.
+    private fun <T> runReport(block: () -> T): CompletableFuture<T> =
+        CompletableFuture.supplyAsync({ block() }, reportRequestExecutor)
 }
@@ -0,0 +1,48 @@
+package com.medTech.Douglas.api.controller
+
+import com.medTech.Douglas.api.dto.ApiResponse
+import com.medTech.Douglas.api.dto.sync.SyncChangesResponse
+import com.medTech.Douglas.service.usecase.sync.GetChangesSinceUseCase
+import io.swagger.v3.oas.annotations.Operation
+import io.swagger.v3.oas.annotations.Parameter
+import io.swagger.v3.oas.annotations.tags.Tag
+import org.springframework.format.annotation.DateTimeFormat
+import org.springframework.http.ResponseEntity
+import org.springframework.security.access.prepost.PreAuthorize
+import org.springframework.web.bind.annotation.GetMapping
+import org.springframework.web.bind.annotation.RequestMapping
+import org.springframework.web.bind.annotation.RequestParam
+import org.springframework.web.bind.annotation.RestController
+import java.time.LocalDateTime
+import java.util.UUID
+
+@RestController
+@RequestMapping("/api/v1/sync")
+@Tag(name = "Sincronização", description = "APIs de Sincronização Incremental para Dashboards")
+class SyncController(
+    private val getChangesSinceUseCase: GetChangesSinceUseCase
+) {
+
+    @GetMapping("/changes")
+    @Operation(
+        summary = "Alterações desde um watermark",
+        description = "Retorna notificações, eventos adversos e indicadores do setor criados ou alterados desde 'since', " +
+            "além dos registros excluídos. Envie o watermark da resposta como 'since' na próxima consulta e aplique " +
+            "as exclusões depois das alterações. Sem 'since' (ou com resetRequired na resposta), obtenha o watermark, " +
+            "recarregue as listas completas e continue a partir dele."
+    )
+    @PreAuthorize("hasRole('ADMIN')")
+    fun changes(
+        @Parameter(description = "ID do setor", required = true)
+        @RequestParam sectorId: UUID,
+
+        @Parameter(description = "Restringe a um período do setor", required = false)
+        @RequestParam(required = false) periodId: UUID?,
+
+        @Parameter(description = "Watermark retornado pela consulta anterior (formato ISO Date Time)", required = false)
+        @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE_TIME) since: LocalDateTime?
+    ): ResponseEntity<ApiResponse<SyncChangesResponse>> {
+        val response = getChangesSinceUseCase.execute(sectorId, periodId, since)
+        return ResponseEntity.ok(ApiResponse.success(response))
+    }
+}
@@ -1,15 +1,23 @@
 package com.medTech.Douglas.api.dto
 
+import com.fasterxml.jackson.annotation.JsonInclude
+
 data class ApiResponse<T>(
     val data: T? = null,
     val message: String? = null,
-    val success: Boolean = true
+    val success: Boolean = true,
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    val nextCursor: String? = null
 ) {
     companion object {
         fun <T> success(data: T?, message: String? = null): ApiResponse<T> {
             return ApiResponse(data, message, true)
         }
-        
+
+        fun <T> page(page: CursorPage<T>, message: String? = null): ApiResponse<List<T>> {
+            return ApiResponse(page.items, message, true, page.nextCursor)
+        }
+
         fun <T> error(message: String?): ApiResponse<T> {
             return ApiResponse(null, message, false)
         }
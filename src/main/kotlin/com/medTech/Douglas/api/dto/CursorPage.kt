@@ -0,0 +1,6 @@
+package com.medTech.Douglas.api.dto
+
+data class CursorPage<T>(
+    val items: List<T>,
+    val nextCursor: String?
+)
@@ -0,0 +1,15 @@
+package com.medTech.Douglas.api.dto
+
+import com.fasterxml.jackson.annotation.JsonInclude
+
+data class PageResponse<T>(
+    val items: List<T>,
+    val page: Int,
+    val size: Int,
+    val hasNext: Boolean,
+    // Only filled when the caller asked for the total; counting is a second query
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    val totalElements: Long? = null,
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    val totalPages: Int? = null
+)
@@ -0,0 +1,37 @@
+package com.medTech.Douglas.api.dto.bulk
+
+import com.fasterxml.jackson.annotation.JsonInclude
+import com.fasterxml.jackson.databind.JsonNode
+import java.util.UUID
+
+enum class BulkRecordType {
+    COMPLIANCE_INDICATOR,
+    HAND_HYGIENE,
+    FALL_RISK,
+    PRESSURE_INJURY_RISK,
+    NOTIFICATION,
+    ADVERSE_EVENT
+}
+
+// One element of the import body; data has the same shape as the single-record POST request
+data class BulkImportRecord(
+    val type: BulkRecordType,
+    val data: JsonNode
+)
+
+data class BulkImportRowResult(
+    val index: Int,
+    val type: BulkRecordType?,
+    val success: Boolean,
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    val id: UUID? = null,
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    val error: String? = null
+)
+
+data class BulkImportResponse(
+    val total: Int,
+    val created: Int,
+    val failed: Int,
+    val results: List<BulkImportRowResult>
+)
@@ -0,0 +1,25 @@
+package com.medTech.Douglas.api.dto.notification
+
+import java.time.LocalDateTime
+import java.util.UUID
+
+// Flat row for paged listings, built directly by the query so the
+// classification and category entities are never loaded.
+data class NotificationSummaryResponse(
+    val id: UUID,
+    val periodId: UUID,
+    val sectorId: UUID,
+    val classificationId: UUID?,
+    val classificationName: String?,
+    val classificationText: String?,
+    val description: String,
+    val professionalCategoryId: UUID?,
+    val professionalCategoryName: String?,
+    val professionalCategoryText: String?,
+    val quantityClassification: Int,
+    val quantityCategory: Int,
+    val quantityProfessional: Int,
+    val quantity: Int,
+    val createdAt: LocalDateTime,
+    val updatedAt: LocalDateTime
+)
@@ -0,0 +1,10 @@
+package com.medTech.Douglas.api.dto.report
+
+import java.util.UUID
+
+data class SectorPanelReportResponse(
+    val sectorId: UUID,
+    val sectorName: String,
+    val sectorCode: String,
+    val report: CompletePanelReportResponse
+)
@@ -0,0 +1,69 @@
+package com.medTech.Douglas.api.dto.report
+
+import java.math.BigDecimal
+import java.util.UUID
+
+// Row shapes returned by the GROUP BY sector queries used for cumulative panels.
+// Sums are nullable because SUM over an empty group yields NULL in SQL.
+
+data class ComplianceTotals(
+    val sectorId: UUID,
+    val rows: Long,
+    val completeWristband: BigDecimal?,
+    val patientCommunication: BigDecimal?,
+    val medicationIdentified: BigDecimal?,
+    val handHygieneAdherence: BigDecimal?,
+    val fallRiskAssessment: BigDecimal?,
+    val pressureInjuryRiskAssessment: BigDecimal?
+)
+
+data class SectorObservation(
+    val sectorId: UUID,
+    val observations: String
+)
+
+data class HandHygieneTotals(
+    val sectorId: UUID,
+    val rows: Long,
+    val compliancePercentage: BigDecimal?
+)
+
+data class FallRiskTotals(
+    val sectorId: UUID,
+    val totalPatients: Long?,
+    val assessedOnAdmission: Long?,
+    val highRisk: Long?,
+    val mediumRisk: Long?,
+    val lowRisk: Long?,
+    val notAssessed: Long?
+)
+
+data class PressureInjuryTotals(
+    val sectorId: UUID,
+    val totalPatients: Long?,
+    val assessedOnAdmission: Long?,
+    val veryHigh: Long?,
+    val highRisk: Long?,
+    val mediumRisk: Long?,
+    val lowRisk: Long?,
+    val notAssessed: Long?
+)
+
+data class SelfNotificationTotals(
+    val sectorId: UUID,
+    val quantity: Long?,
+    val weightedPercentage: BigDecimal?
+)
+
+data class MetaComplianceTotals(
+    val sectorId: UUID,
+    val rows: Long,
+    val goalValue: BigDecimal?,
+    val percentage: BigDecimal?
+)
+
+data class MedicationComplianceTotals(
+    val sectorId: UUID,
+    val rows: Long,
+    val percentage: BigDecimal?
+)
@@ -0,0 +1,43 @@
+package com.medTech.Douglas.api.dto.sync
+
+import com.medTech.Douglas.api.dto.adverseevent.AdverseEventResponse
+import com.medTech.Douglas.api.dto.compliance.MedicationComplianceResponse
+import com.medTech.Douglas.api.dto.compliance.MetaComplianceResponse
+import com.medTech.Douglas.api.dto.indicator.ComplianceIndicatorResponse
+import com.medTech.Douglas.api.dto.indicator.FallRiskResponse
+import com.medTech.Douglas.api.dto.indicator.HandHygieneResponse
+import com.medTech.Douglas.api.dto.indicator.PressureInjuryRiskResponse
+import com.medTech.Douglas.api.dto.notification.NotificationResponse
+import com.medTech.Douglas.api.dto.selfnotification.SelfNotificationResponse
+import io.swagger.v3.oas.annotations.media.Schema
+import java.time.LocalDateTime
+import java.util.UUID
+
+data class SyncChangesResponse(
+    @field:Schema(description = "Valor a enviar como 'since' na próxima consulta")
+    val watermark: LocalDateTime,
+
+    @field:Schema(description = "Quando verdadeiro, as listas vêm vazias e o cliente deve recarregar os dados completos")
+    val resetRequired: Boolean = false,
+
+    val notifications: List<NotificationResponse> = emptyList(),
+    val adverseEvents: List<AdverseEventResponse> = emptyList(),
+    val complianceIndicators: List<ComplianceIndicatorResponse> = emptyList(),
+    val handHygieneAssessments: List<HandHygieneResponse> = emptyList(),
+    val fallRiskAssessments: List<FallRiskResponse> = emptyList(),
+    val pressureInjuryRiskAssessments: List<PressureInjuryRiskResponse> = emptyList(),
+    val selfNotifications: List<SelfNotificationResponse> = emptyList(),
+    val metaCompliance: List<MetaComplianceResponse> = emptyList(),
+    val medicationCompliance: List<MedicationComplianceResponse> = emptyList(),
+
+    @field:Schema(description = "Registros excluídos desde 'since'")
+    val deleted: List<SyncTombstone> = emptyList()
+)
+
+data class SyncTombstone(
+    @field:Schema(description = "Tipo do registro (ex: Notification, AdverseEvent)")
+    val resource: String,
+    val id: UUID,
+    val periodId: UUID,
+    val deletedAt: LocalDateTime
+)
@@ -0,0 +1,14 @@
+package com.medTech.Douglas.config
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "audit.partitions")
+class AuditPartitionProperties {
+    var enabled: Boolean = true
+    var monthsAhead: Int = 3 // Monthly partitions created in advance of the current month
+    var retentionMonths: Int = 0 // Months kept in the database before archiving; 0 keeps everything
+    var archiveDir: String = "archive/audit-logs"
+    var checkIntervalMs: Long = 21600000
+}
@@ -0,0 +1,16 @@
+package com.medTech.Douglas.config
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "audit.writer")
+class AuditWriterProperties {
+    var queueCapacity: Int = 10000
+    var batchSize: Int = 200
+    var flushIntervalMs: Long = 500
+    var offerTimeoutMs: Long = 50 // How long a request waits for room before handing the entry to the retry queue
+    var shutdownTimeoutMs: Long = 10000
+    var maxAttempts: Int = 20 // Flushes a failing entry is retried in before it is logged in full and dropped
+    var retryCapacity: Int = 10000 // Entries held for retry; beyond that they are logged in full and dropped
+}
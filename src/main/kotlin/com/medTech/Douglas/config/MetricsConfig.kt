@@ -0,0 +1,27 @@
+package com.medTech.Douglas.config
+
+import io.micrometer.core.instrument.binder.MeterBinder
+import jakarta.persistence.EntityManagerFactory
+import org.hibernate.SessionFactory
+import org.hibernate.stat.HibernateQueryMetrics
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+
+/**
+ * Metrics not covered by Spring Boot's auto-configuration.
+ *
+ * Boot already publishes `http.server.requests` (per controller endpoint),
+ * `spring.data.repository.invocations` (per repository method), `hibernate.*` session
+ * statistics and `hikaricp.*` pool metrics. This adds Hibernate's per-query statistics:
+ * `hibernate.query.executions`, `hibernate.query.execution.rows` and
+ * `hibernate.query.execution.total` tagged by the HQL/SQL text.
+ */
+@Configuration
+class MetricsConfig {
+
+    @Bean
+    fun hibernateQueryMetrics(entityManagerFactory: EntityManagerFactory): MeterBinder {
+        val sessionFactory = entityManagerFactory.unwrap(SessionFactory::class.java)
+        return HibernateQueryMetrics(sessionFactory, "entityManagerFactory", emptyList())
+    }
+}
@@ -0,0 +1,12 @@
+package com.medTech.Douglas.config
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "period-status-cache")
+class PeriodStatusCacheProperties {
+    // Upper bound on how long a close/reopen done on another instance can go unseen here
+    var ttlMs: Long = 5000
+    var maxSize: Long = 10000
+}
@@ -0,0 +1,63 @@
+package com.medTech.Douglas.config
+
+import com.medTech.Douglas.config.sql.RequestQueryStats
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+import org.springframework.core.task.SyncTaskExecutor
+import org.springframework.core.task.TaskDecorator
+import org.springframework.core.task.TaskExecutor
+import org.springframework.scheduling.concurrent.ThreadPoolTaskExecutor
+import org.springframework.security.core.context.SecurityContextHolder
+import java.util.concurrent.ThreadPoolExecutor
+
+@Configuration
+@ConfigurationProperties(prefix = "report.executor")
+class ReportExecutorConfig {
+    // Where the report endpoints run. SYNC: on the servlet thread. ASYNC: on a bounded pool
+    // while the servlet thread is released; when it is saturated the request thread runs the
+    // report itself, which throttles callers instead of failing them.
+    var requestMode: RequestMode = RequestMode.ASYNC
+    var requestConcurrency: Int = 6
+    var requestQueueCapacity: Int = 50
+
+    enum class RequestMode { SYNC, ASYNC }
+
+    // Runs the report endpoints. The pool size is the number of reports holding a connection
+    // at once, so it must stay well below the Hikari maximum to leave connections for the
+    // write endpoints.
+    @Bean(name = ["reportRequestExecutor"])
+    fun reportRequestExecutor(): TaskExecutor {
+        return when (requestMode) {
+            RequestMode.SYNC -> SyncTaskExecutor()
+            RequestMode.ASYNC -> ThreadPoolTaskExecutor().apply {
+                corePoolSize = requestConcurrency
+                maxPoolSize = requestConcurrency
+                queueCapacity = requestQueueCapacity
+                setThreadNamePrefix("report-request-")
+                setRejectedExecutionHandler(ThreadPoolExecutor.CallerRunsPolicy())
+                setWaitForTasksToCompleteOnShutdown(true)
+                setTaskDecorator(requestContextPropagation())
+            }
+        }
+    }
+
+    // Carries the caller's security context and SQL counters to the worker thread, and
+    // restores the worker's own afterwards (with CallerRunsPolicy the worker is the caller).
+    private fun requestContextPropagation() = TaskDecorator { task ->
+        val securityContext = SecurityContextHolder.getContext()
+        val queryStats = RequestQueryStats.current()
+        Runnable {
+            val previousSecurityContext = SecurityContextHolder.getContext()
+            val previousQueryStats = RequestQueryStats.current()
+            SecurityContextHolder.setContext(securityContext)
+            RequestQueryStats.bind(queryStats)
+            try {
+                task.run()
+            } finally {
+                SecurityContextHolder.setContext(previousSecurityContext)
+                RequestQueryStats.bind(previousQueryStats)
+            }
+        }
+    }
+}
@@ -0,0 +1,10 @@
+package com.medTech.Douglas.config
+
+import org.springframework.context.annotation.Configuration
+import org.springframework.scheduling.annotation.EnableScheduling
+
+// Background jobs run as @Scheduled methods on Boot's task scheduler; its pool size is set
+// under spring.task.scheduling.
+@Configuration
+@EnableScheduling
+class SchedulingConfig
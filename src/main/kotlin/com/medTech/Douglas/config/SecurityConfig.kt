@@ -2,6 +2,7 @@ package com.medTech.Douglas.config
 
 import com.medTech.Douglas.config.security.jwt.JwtAuthenticationFilter
 import com.medTech.Douglas.service.CustomUserDetailsService
+import jakarta.servlet.DispatcherType
 import org.springframework.context.annotation.Bean
 import org.springframework.context.annotation.Configuration
 import org.springframework.security.authentication.AuthenticationManager
@@ -35,13 +36,17 @@ class SecurityConfig(
             .cors { it.configurationSource(corsConfigurationSource()) }
             .sessionManagement { it.sessionCreationPolicy(SessionCreationPolicy.STATELESS) }
             .authorizeHttpRequests {
+                // Async report results are dispatched again; the original request was already authorized
+                it.dispatcherTypeMatchers(DispatcherType.ASYNC).permitAll()
                 it.requestMatchers(
                     "/api/v1/auth/login",
                     "/v3/api-docs/**",
                     "/swagger-ui/**",
                     "/swagger-ui.html",
                     "/swagger-resources/**",
-                    "/webjars/**"
+                    "/webjars/**",
+                    "/actuator/health/**",
+                    "/actuator/prometheus"
                 ).permitAll()
                 it.requestMatchers("/api/v1/auth/register").hasRole("ADMIN")
                 it.anyRequest().authenticated()
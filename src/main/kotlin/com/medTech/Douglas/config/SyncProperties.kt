@@ -0,0 +1,16 @@
+package com.medTech.Douglas.config
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "sync")
+class SyncProperties {
+    // The watermark trails the clock by this much so rows written by transactions that have not
+    // committed yet (or not reached the read replica) are not skipped. Keep it above
+    // replica.max-lag-ms plus the longest write transaction.
+    var commitLagMs: Long = 15000
+    var maxChanges: Int = 2000 // Above this a client is told to reload instead
+    var tombstoneRetentionDays: Long = 30
+    var purgeIntervalMs: Long = 3600000
+}
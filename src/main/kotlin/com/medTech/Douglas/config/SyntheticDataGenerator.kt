@@ -0,0 +1,303 @@
+package com.medTech.Douglas.config
+
+import com.medTech.Douglas.domain.enums.EventType
+import com.medTech.Douglas.service.PanelReportSnapshotBackfill
+import org.slf4j.LoggerFactory
+import org.springframework.boot.CommandLineRunner
+import org.springframework.boot.SpringApplication
+import org.springframework.context.ApplicationContext
+import org.springframework.context.annotation.Profile
+import org.springframework.core.Ordered
+import org.springframework.core.annotation.Order
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+import java.math.BigDecimal
+import java.math.RoundingMode
+import java.time.LocalDate
+import java.time.LocalDateTime
+import java.time.YearMonth
+import java.util.Random
+import java.util.UUID
+import kotlin.random.asKotlinRandom
+import kotlin.system.exitProcess
+
+/**
+ * Fills the database with a production-sized dataset for local benchmarking.
+ *
+ * Only active with the `synthetic-data` profile, e.g.
+ * `./gradlew bootRun --args='--spring.profiles.active=synthetic-data --synthetic-data.sectors=200'`.
+ * Rows go straight through JDBC batches (the datasource already rewrites them into
+ * multi-row INSERTs), bypassing JPA, audit and cache side effects; the panel snapshots of the
+ * closed periods are backfilled at the end. Each run creates its own sectors, so it can be
+ * repeated on top of existing data.
+ */
+@Component
+@Profile("synthetic-data")
+@Order(Ordered.LOWEST_PRECEDENCE)
+class SyntheticDataGenerator(
+    private val jdbcTemplate: JdbcTemplate,
+    private val properties: SyntheticDataProperties,
+    private val snapshotBackfill: PanelReportSnapshotBackfill,
+    private val context: ApplicationContext
+) : CommandLineRunner {
+
+    private val logger = LoggerFactory.getLogger(SyntheticDataGenerator::class.java)
+    private val random = Random(properties.seed)
+    private val picker = random.asKotlinRandom()
+
+    private inner class Batch(private val sql: String) {
+        private val rows = ArrayList<Array<Any?>>(properties.batchSize)
+        var total = 0L
+            private set
+
+        fun add(vararg values: Any?) {
+            rows.add(arrayOf(*values))
+            if (rows.size >= properties.batchSize) flush()
+        }
+
+        fun flush() {
+            if (rows.isEmpty()) return
+            jdbcTemplate.batchUpdate(sql, rows)
+            total += rows.size
+            rows.clear()
+        }
+    }
+
+    override fun run(vararg args: String?) {
+        val started = System.currentTimeMillis()
+        val months = months()
+        val runTag = java.lang.Long.toString(System.currentTimeMillis(), 36).uppercase()
+        val classificationIds = referenceIds("notification_classifications", CLASSIFICATIONS)
+        val categoryIds = referenceIds("professional_categories", PROFESSIONAL_CATEGORIES)
+        val users = jdbcTemplate.query("SELECT id, email FROM users") { rs, _ ->
+            rs.getObject("id", UUID::class.java) to rs.getString("email")
+        }
+
+        logger.info(
+            "Generating synthetic data: {} sectors x {} periods (run {})",
+            properties.sectors, months.size, runTag
+        )
+
+        // audit_logs is partitioned by month; backfilled months would otherwise all land in the default partition
+        months.forEach { month ->
+            jdbcTemplate.queryForObject("SELECT ensure_audit_log_partition(?)", String::class.java, month.atDay(1))
+        }
+
+        val sectors = Batch("INSERT INTO sectors (id, name, code, active) VALUES (?, ?, ?, TRUE)")
+        val periods = Batch("INSERT INTO periods (id, month, year, sector_id, status) VALUES (?, ?, ?, ?, ?)")
+        val compliance = Batch(
+            """INSERT INTO compliance_indicators (period_id, sector_id, complete_wristband, patient_communication,
+               medication_identified, hand_hygiene_adherence, fall_risk_assessment, pressure_injury_risk_assessment)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+        )
+        val handHygiene = Batch(
+            "INSERT INTO hand_hygiene_assessments (period_id, sector_id, compliance_percentage) VALUES (?, ?, ?)"
+        )
+        val fallRisk = Batch(
+            """INSERT INTO fall_risk_assessments (period_id, sector_id, total_patients, assessed_on_admission,
+               assessment_percentage, high_risk, medium_risk, low_risk, not_assessed, high_risk_percentage,
+               medium_risk_percentage, low_risk_percentage, not_assessed_percentage)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        )
+        val pressureInjury = Batch(
+            """INSERT INTO pressure_injury_risk_assessments (period_id, sector_id, total_patients, assessed_on_admission,
+               assessment_percentage, very_high, high_risk, medium_risk, low_risk, not_assessed, very_high_percentage,
+               high_risk_percentage, medium_risk_percentage, low_risk_percentage, not_assessed_percentage)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        )
+        val selfNotifications = Batch(
+            "INSERT INTO self_notifications (period_id, sector_id, quantity, percentage, created_by) VALUES (?, ?, ?, ?, ?)"
+        )
+        val metaCompliance = Batch(
+            "INSERT INTO meta_compliance (period_id, sector_id, goal_value, percentage, created_by) VALUES (?, ?, ?, ?, ?)"
+        )
+        val medicationCompliance = Batch(
+            "INSERT INTO medication_compliance (period_id, sector_id, percentage, created_by) VALUES (?, ?, ?, ?)"
+        )
+        val notifications = Batch(
+            """INSERT INTO notifications (id, period_id, sector_id, classification_id, description, professional_category_id,
+               quantity_classification, quantity_category, quantity_professional, quantity, created_by, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        )
+        val adverseEvents = Batch(
+            """INSERT INTO adverse_events (id, period_id, sector_id, event_date, event_type, description, quantity_cases,
+               quantity_notifications, was_notified, created_by, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        )
+        val auditLogs = Batch(
+            """INSERT INTO audit_logs (user_id, user_email, action, resource, resource_id, details, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)"""
+        )
+        val children = listOf(
+            compliance, handHygiene, fallRisk, pressureInjury, selfNotifications, metaCompliance,
+            medicationCompliance, notifications, adverseEvents, auditLogs
+        )
+
+        val current = YearMonth.now()
+        for (s in 1..properties.sectors) {
+            val sectorId = UUID.randomUUID()
+            sectors.add(sectorId, "Setor Sintético $s", "SYN-$runTag-$s")
+            sectors.flush()
+
+            val sectorPeriods = months.map { month ->
+                val periodId = UUID.randomUUID()
+                val status = if (month == current) "OPEN" else "CLOSED"
+                periods.add(periodId, month.monthValue, month.year, sectorId, status)
+                periodId to month
+            }
+            // Children reference the periods, so they must be in the table before any child batch flushes
+            periods.flush()
+
+            for ((periodId, month) in sectorPeriods) {
+                val user = users.randomOrNull(picker)
+                val userId = user?.first
+
+                compliance.add(periodId, sectorId, pct(85), pct(80), pct(88), pct(75), pct(70), pct(72))
+                handHygiene.add(periodId, sectorId, pct(78))
+                addRiskAssessment(fallRisk, periodId, sectorId, levels = 4)
+                addRiskAssessment(pressureInjury, periodId, sectorId, levels = 5)
+                selfNotifications.add(periodId, sectorId, random.nextInt(30), pct(60), userId)
+                metaCompliance.add(periodId, sectorId, BigDecimal("100.00"), pct(90), userId)
+                medicationCompliance.add(periodId, sectorId, pct(95), userId)
+
+                repeat(count(properties.notificationsPerPeriod)) { n ->
+                    val id = UUID.randomUUID()
+                    val createdAt = timestampIn(month)
+                    val quantity = 1 + random.nextInt(5)
+                    notifications.add(
+                        id, periodId, sectorId, classificationIds.random(picker), "Notificação sintética $n",
+                        categoryIds.random(picker), quantity, quantity, quantity, quantity, userId, createdAt, createdAt
+                    )
+                    auditLog(auditLogs, user, "CREATE", "Notification", id, "Created Notification", createdAt)
+                }
+
+                repeat(count(properties.adverseEventsPerPeriod)) { n ->
+                    val id = UUID.randomUUID()
+                    val createdAt = timestampIn(month)
+                    val cases = 1 + random.nextInt(3)
+                    val notified = random.nextInt(cases + 1)
+                    adverseEvents.add(
+                        id, periodId, sectorId, createdAt.toLocalDate(), EVENT_TYPES.random(picker).name,
+                        "Evento adverso sintético $n", cases, notified, notified > 0, userId, createdAt, createdAt
+                    )
+                    auditLog(auditLogs, user, "CREATE", "AdverseEvent", id, "Created Adverse Event", createdAt)
+                }
+
+                repeat(count(properties.auditLogsPerPeriod)) {
+                    val (action, resource) = AUDIT_ACTIONS.random(picker)
+                    auditLog(auditLogs, users.randomOrNull(picker), action, resource, UUID.randomUUID(),
+                        "$action $resource", timestampIn(month))
+                }
+            }
+
+            if (s % 10 == 0 || s == properties.sectors) {
+                logger.info(
+                    "Sector {}/{} done: {} notifications, {} adverse events, {} audit logs so far ({} ms)",
+                    s, properties.sectors, notifications.total, adverseEvents.total, auditLogs.total,
+                    System.currentTimeMillis() - started
+                )
+            }
+        }
+        children.forEach { it.flush() }
+
+        jdbcTemplate.execute("ANALYZE")
+        snapshotBackfill.backfill()
+        logger.info(
+            "Synthetic data done in {} ms: {} sectors, {} periods, {} notifications, {} adverse events, {} audit logs",
+            System.currentTimeMillis() - started, sectors.total, periods.total,
+            notifications.total, adverseEvents.total, auditLogs.total
+        )
+
+        if (properties.exitWhenDone) {
+            exitProcess(SpringApplication.exit(context))
+        }
+    }
+
+    private fun months(): List<YearMonth> {
+        val end = YearMonth.now()
+        var start = end.minusYears(properties.years.toLong()).plusMonths(1)
+        if (start.year < MIN_YEAR) {
+            // periods.year has a CHECK constraint starting at 2020
+            logger.warn("Clamping synthetic periods to start at {}-01", MIN_YEAR)
+            start = YearMonth.of(MIN_YEAR, 1)
+        }
+        return generateSequence(start) { it.plusMonths(1) }.takeWhile { !it.isAfter(end) }.toList()
+    }
+
+    private fun referenceIds(table: String, defaults: List<String>): List<UUID> {
+        val existing = jdbcTemplate.queryForList("SELECT id FROM $table WHERE active", UUID::class.java)
+        if (existing.isNotEmpty()) return existing
+
+        logger.info("No active rows in {}, creating defaults", table)
+        return defaults.map { name ->
+            UUID.randomUUID().also { jdbcTemplate.update("INSERT INTO $table (id, name, active) VALUES (?, ?, TRUE)", it, name) }
+        }
+    }
+
+    private fun addRiskAssessment(batch: Batch, periodId: UUID, sectorId: UUID, levels: Int) {
+        val total = 20 + random.nextInt(80)
+        val notAssessed = random.nextInt(total / 10 + 1)
+        val assessed = total - notAssessed
+        // Split the assessed patients across the risk levels, highest first
+        val split = IntArray(levels - 1)
+        var remaining = assessed
+        for (i in 0 until levels - 2) {
+            split[i] = random.nextInt(remaining / 2 + 1)
+            remaining -= split[i]
+        }
+        split[levels - 2] = remaining
+
+        val values = mutableListOf<Any?>(periodId, sectorId, total, assessed, ratio(assessed, total))
+        split.forEach { values.add(it) }
+        values.add(notAssessed)
+        split.forEach { values.add(ratio(it, total)) }
+        values.add(ratio(notAssessed, total))
+        batch.add(*values.toTypedArray())
+    }
+
+    private fun auditLog(
+        batch: Batch, user: Pair<UUID, String>?, action: String, resource: String, resourceId: UUID,
+        details: String, createdAt: LocalDateTime
+    ) {
+        batch.add(user?.first, user?.second ?: "SYSTEM", action, resource, resourceId.toString(), details, createdAt)
+    }
+
+    // Volumes vary +-50% around the configured mean so sectors are not all the same size
+    private fun count(mean: Int): Int = if (mean <= 0) 0 else mean / 2 + random.nextInt(mean + 1)
+
+    private fun pct(mean: Int): BigDecimal {
+        val value = (mean + random.nextGaussian() * 8).coerceIn(0.0, 100.0)
+        return BigDecimal.valueOf(value).setScale(2, RoundingMode.HALF_UP)
+    }
+
+    private fun ratio(part: Int, total: Int): BigDecimal =
+        if (total == 0) BigDecimal.ZERO.setScale(2)
+        else BigDecimal(part * 100).divide(BigDecimal(total), 2, RoundingMode.HALF_UP)
+
+    private fun timestampIn(month: YearMonth): LocalDateTime {
+        val lastDay = if (month == YearMonth.now()) LocalDate.now().dayOfMonth else month.lengthOfMonth()
+        return month.atDay(1 + random.nextInt(lastDay))
+            .atTime(random.nextInt(24), random.nextInt(60), random.nextInt(60))
+    }
+
+    companion object {
+        private const val MIN_YEAR = 2020
+
+        private val EVENT_TYPES = EventType.values().toList()
+
+        private val CLASSIFICATIONS = listOf("Incidente sem dano", "Incidente com dano", "Quase erro", "Circunstância notificável")
+
+        private val PROFESSIONAL_CATEGORIES = listOf("Enfermeiro", "Técnico de Enfermagem", "Médico", "Fisioterapeuta", "Farmacêutico")
+
+        private val AUDIT_ACTIONS = listOf(
+            "UPDATE" to "Notification",
+            "UPDATE" to "AdverseEvent",
+            "CREATE" to "ComplianceIndicator",
+            "UPDATE" to "ComplianceIndicator",
+            "UPDATE" to "HandHygieneAssessment",
+            "UPDATE" to "FallRiskAssessment",
+            "DELETE" to "Notification",
+            "UPDATE" to "Period"
+        )
+    }
+}
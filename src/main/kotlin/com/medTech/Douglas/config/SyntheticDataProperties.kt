@@ -0,0 +1,19 @@
+package com.medTech.Douglas.config
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "synthetic-data")
+class SyntheticDataProperties {
+    var sectors: Int = 50
+    // Monthly periods are generated for the last `years` years, up to the current month
+    var years: Int = 3
+    var notificationsPerPeriod: Int = 40
+    var adverseEventsPerPeriod: Int = 15
+    var auditLogsPerPeriod: Int = 200
+    var batchSize: Int = 1000
+    // Fixed seed so two runs with the same settings produce the same distribution
+    var seed: Long = 42
+    var exitWhenDone: Boolean = true
+}
@@ -0,0 +1,69 @@
+package com.medTech.Douglas.config.datasource
+
+import com.zaxxer.hikari.HikariDataSource
+import org.springframework.beans.factory.annotation.Qualifier
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.boot.autoconfigure.flyway.FlywayDataSource
+import org.springframework.boot.autoconfigure.jdbc.DataSourceProperties
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+import org.springframework.context.annotation.Primary
+import org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy
+import javax.sql.DataSource
+
+/**
+ * Sends `@Transactional(readOnly = true)` work to a replica (`replica.enabled=true`).
+ *
+ * The application DataSource is a [LazyConnectionDataSourceProxy]: the physical connection is
+ * only fetched at the first statement, after the transaction manager has marked it read-only,
+ * so read-only transactions get a replica connection and everything else the primary. Reads
+ * right after a write may be up to `replica.max-lag-ms` stale; beyond that they fall back to the
+ * primary. Flyway always migrates the primary.
+ *
+ * Routing per transaction needs `spring.jpa.open-in-view` off, otherwise the request's first
+ * connection is reused by every later transaction; [ReplicaOpenInViewPostProcessor] sets it.
+ */
+@Configuration
+@ConditionalOnProperty(prefix = "replica", name = ["enabled"], havingValue = "true")
+class ReplicaDataSourceConfig {
+
+    @Bean
+    @FlywayDataSource
+    @ConfigurationProperties(prefix = "spring.datasource.hikari")
+    fun primaryDataSource(properties: DataSourceProperties): HikariDataSource {
+        return properties.initializeDataSourceBuilder().type(HikariDataSource::class.java).build().apply {
+            poolName = "primary"
+        }
+    }
+
+    @Bean
+    fun replicaDataSource(properties: DataSourceProperties, replica: ReplicaDataSourceProperties): HikariDataSource {
+        return HikariDataSource().apply {
+            poolName = "replica"
+            jdbcUrl = replica.url
+            username = replica.username
+            password = replica.password
+            driverClassName = properties.driverClassName
+            maximumPoolSize = replica.maximumPoolSize
+            isReadOnly = true
+        }
+    }
+
+    @Bean
+    fun replicaLagMonitor(@Qualifier("replicaDataSource") replicaDataSource: HikariDataSource, replica: ReplicaDataSourceProperties): ReplicaLagMonitor {
+        return ReplicaLagMonitor(replicaDataSource, replica)
+    }
+
+    @Bean
+    @Primary
+    fun dataSource(
+        @Qualifier("primaryDataSource") primaryDataSource: HikariDataSource,
+        @Qualifier("replicaDataSource") replicaDataSource: HikariDataSource,
+        replicaLagMonitor: ReplicaLagMonitor
+    ): DataSource {
+        return LazyConnectionDataSourceProxy(primaryDataSource).apply {
+            setReadOnlyDataSource(ReplicaFallbackDataSource(replicaDataSource, primaryDataSource, replicaLagMonitor))
+        }
+    }
+}
@@ -0,0 +1,17 @@
+package com.medTech.Douglas.config.datasource
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "replica")
+class ReplicaDataSourceProperties {
+    var enabled: Boolean = false
+    var url: String = ""
+    var username: String = ""
+    var password: String = ""
+    var maximumPoolSize: Int = 20
+    // Read-only transactions go back to the primary while the replica is further behind than this
+    var maxLagMs: Long = 5000
+    var lagCheckIntervalMs: Long = 2000
+}
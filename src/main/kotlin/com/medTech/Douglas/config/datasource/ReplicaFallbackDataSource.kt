@@ -0,0 +1,22 @@
+package com.medTech.Douglas.config.datasource
+
+import org.springframework.jdbc.datasource.AbstractDataSource
+import java.sql.Connection
+import javax.sql.DataSource
+
+/**
+ * Read-only connections: from the replica while [ReplicaLagMonitor] considers it usable,
+ * otherwise from the primary.
+ */
+class ReplicaFallbackDataSource(
+    private val replica: DataSource,
+    private val primary: DataSource,
+    private val lagMonitor: ReplicaLagMonitor
+) : AbstractDataSource() {
+
+    override fun getConnection(): Connection = target().connection
+
+    override fun getConnection(username: String?, password: String?): Connection = target().getConnection(username, password)
+
+    private fun target(): DataSource = if (lagMonitor.usable) replica else primary
+}
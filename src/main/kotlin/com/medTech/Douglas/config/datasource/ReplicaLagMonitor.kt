@@ -0,0 +1,80 @@
+package com.medTech.Douglas.config.datasource
+
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.binder.MeterBinder
+import jakarta.annotation.PostConstruct
+import org.slf4j.LoggerFactory
+import org.springframework.scheduling.annotation.Scheduled
+import javax.sql.DataSource
+
+/**
+ * Polls the replica's replay lag and decides whether read-only transactions may use it.
+ *
+ * A replica that has replayed everything it received reports no lag, so an idle primary
+ * does not look like a lagging replica. A server that is not in recovery (e.g. a second
+ * standalone instance used for local testing) also reports none. Any failure to read the lag
+ * marks the replica unusable until the next successful check.
+ */
+class ReplicaLagMonitor(
+    private val replica: DataSource,
+    private val properties: ReplicaDataSourceProperties
+) : MeterBinder {
+
+    private val logger = LoggerFactory.getLogger(ReplicaLagMonitor::class.java)
+
+    @Volatile
+    var lagMs: Long = -1
+        private set
+
+    @Volatile
+    var usable: Boolean = false
+        private set
+
+    // First check before the routing DataSource is handed out, so startup reads already know
+    @PostConstruct
+    fun start() {
+        check()
+    }
+
+    @Scheduled(
+        initialDelayString = "\${replica.lag-check-interval-ms:2000}",
+        fixedDelayString = "\${replica.lag-check-interval-ms:2000}"
+    )
+    fun check() {
+        val wasUsable = usable
+        try {
+            lagMs = replica.connection.use { connection ->
+                connection.createStatement().use { statement ->
+                    statement.executeQuery(LAG_SQL).use { rs -> if (rs.next()) rs.getLong(1) else 0L }
+                }
+            }
+            usable = lagMs <= properties.maxLagMs
+        } catch (e: Exception) {
+            lagMs = -1
+            usable = false
+            if (wasUsable) logger.warn("Replica lag check failed, routing reads to the primary", e)
+        }
+
+        if (wasUsable && !usable && lagMs >= 0) {
+            logger.warn("Replica is {} ms behind (limit {} ms), routing reads to the primary", lagMs, properties.maxLagMs)
+        } else if (!wasUsable && usable) {
+            logger.info("Replica is {} ms behind, routing read-only transactions to it", lagMs)
+        }
+    }
+
+    override fun bindTo(registry: MeterRegistry) {
+        Gauge.builder("replica.lag", this) { it.lagMs.toDouble() }.baseUnit("milliseconds").register(registry)
+        Gauge.builder("replica.usable", this) { if (it.usable) 1.0 else 0.0 }.register(registry)
+    }
+
+    companion object {
+        private const val LAG_SQL = """
+            SELECT CASE
+                WHEN NOT pg_is_in_recovery() THEN 0
+                WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                ELSE COALESCE((EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) * 1000)::bigint, 0)
+            END
+        """
+    }
+}
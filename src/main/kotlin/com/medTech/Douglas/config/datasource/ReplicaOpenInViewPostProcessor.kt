@@ -0,0 +1,27 @@
+package com.medTech.Douglas.config.datasource
+
+import org.springframework.boot.SpringApplication
+import org.springframework.boot.env.EnvironmentPostProcessor
+import org.springframework.core.env.ConfigurableEnvironment
+import org.springframework.core.env.MapPropertySource
+
+/**
+ * Turns off `spring.jpa.open-in-view` when `replica.enabled` is true.
+ *
+ * With open-in-view the request keeps one EntityManager, and Hibernate holds its first physical
+ * connection until the request ends. The [LazyConnectionDataSourceProxy][org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy]
+ * would then route on the first transaction only: a read-only call followed by a write in the
+ * same request would write through the replica connection. Without it every transaction gets
+ * its own connection and is routed on its own read-only flag. Runs after application.yaml is
+ * loaded and takes precedence over it, so the two settings cannot be combined by mistake.
+ */
+class ReplicaOpenInViewPostProcessor : EnvironmentPostProcessor {
+
+    override fun postProcessEnvironment(environment: ConfigurableEnvironment, application: SpringApplication) {
+        if (environment.getProperty("replica.enabled", Boolean::class.java, false)) {
+            environment.propertySources.addFirst(
+                MapPropertySource("replicaRouting", mapOf("spring.jpa.open-in-view" to "false"))
+            )
+        }
+    }
+}
@@ -0,0 +1,56 @@
+package com.medTech.Douglas.config.security
+
+import com.github.benmanes.caffeine.cache.Cache
+import com.github.benmanes.caffeine.cache.Caffeine
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.binder.MeterBinder
+import io.micrometer.core.instrument.binder.cache.CaffeineCacheMetrics
+import org.springframework.security.core.userdetails.UserDetails
+import org.springframework.security.core.userdetails.UserDetailsService
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.time.Duration
+
+/**
+ * Caches the principals loaded for JWT-authenticated requests, keyed by email.
+ *
+ * Only the token filter goes through this cache; login keeps using [UserDetailsService]
+ * directly so password checks always see the stored hash. Use cases that change a user
+ * must call [evict] so role or status changes apply on the next request instead of after
+ * the TTL.
+ */
+@Component
+class PrincipalCache(
+    private val userDetailsService: UserDetailsService,
+    properties: PrincipalCacheProperties
+) : MeterBinder {
+
+    private val cache: Cache<String, UserDetails> = Caffeine.newBuilder()
+        .expireAfterWrite(Duration.ofMillis(properties.ttlMs))
+        .maximumSize(properties.maxSize)
+        .recordStats()
+        .build()
+
+    fun get(email: String): UserDetails {
+        return cache.get(email) { userDetailsService.loadUserByUsername(it) }
+    }
+
+    fun evict(email: String) {
+        cache.invalidate(email)
+
+        // A request that reads the user before our transaction commits would cache the old
+        // state again, so evict once more after commit.
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+                override fun afterCommit() {
+                    cache.invalidate(email)
+                }
+            })
+        }
+    }
+
+    override fun bindTo(registry: MeterRegistry) {
+        CaffeineCacheMetrics.monitor(registry, cache, "principal")
+    }
+}
@@ -0,0 +1,11 @@
+package com.medTech.Douglas.config.security
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "security.principal-cache")
+class PrincipalCacheProperties {
+    var ttlMs: Long = 300000 // 5 minutes
+    var maxSize: Long = 10000
+}
@@ -20,8 +20,10 @@ class JwtAuthenticationFilter(
     ) {
         val jwt = getJwtFromRequest(request)
 
-        if (StringUtils.hasText(jwt) && tokenProvider.validateToken(jwt!!)) {
-            val authentication = tokenProvider.getAuthentication(jwt)
+        // Parse once and reuse the claims; the principal comes from the cache, not the database
+        val claims = if (StringUtils.hasText(jwt)) tokenProvider.parseClaims(jwt!!) else null
+        if (claims != null) {
+            val authentication = tokenProvider.getAuthentication(claims)
             SecurityContextHolder.getContext().authentication = authentication
         }
 
@@ -1,12 +1,13 @@
 package com.medTech.Douglas.config.security.jwt
 
+import com.medTech.Douglas.config.security.PrincipalCache
+import io.jsonwebtoken.Claims
 import io.jsonwebtoken.Jwts
 import io.jsonwebtoken.security.Keys
 import jakarta.annotation.PostConstruct
 import org.springframework.security.authentication.UsernamePasswordAuthenticationToken
 import org.springframework.security.core.Authentication
 import org.springframework.security.core.userdetails.UserDetails
-import org.springframework.security.core.userdetails.UserDetailsService
 import org.springframework.stereotype.Component
 import java.nio.charset.StandardCharsets
 import java.util.*
@@ -15,7 +16,7 @@ import javax.crypto.SecretKey
 @Component
 class JwtTokenProvider(
     private val jwtProperties: JwtProperties,
-    private val userDetailsService: UserDetailsService
+    private val principalCache: PrincipalCache
 ) {
 
     private lateinit var key: SecretKey
@@ -39,11 +40,30 @@ class JwtTokenProvider(
             .compact()
     }
 
-    fun getAuthentication(token: String): Authentication {
-        val userDetails = userDetailsService.loadUserByUsername(getUsername(token))
+    fun getAuthentication(claims: Claims): Authentication {
+        val userDetails = principalCache.get(claims.subject)
         return UsernamePasswordAuthenticationToken(userDetails, "", userDetails.authorities)
     }
 
+    fun getAuthentication(token: String): Authentication {
+        return getAuthentication(parseClaims(token) ?: throw IllegalArgumentException("Invalid JWT token"))
+    }
+
+    /**
+     * Verifies the token and returns its claims, or null when it is invalid or expired.
+     */
+    fun parseClaims(token: String): Claims? {
+        return try {
+            Jwts.parser()
+                .verifyWith(key)
+                .build()
+                .parseSignedClaims(token)
+                .payload
+        } catch (e: Exception) {
+            null
+        }
+    }
+
     fun getUsername(token: String): String {
         return Jwts.parser()
             .verifyWith(key)
@@ -54,14 +74,6 @@ class JwtTokenProvider(
     }
 
     fun validateToken(token: String): Boolean {
-        try {
-            Jwts.parser()
-                .verifyWith(key)
-                .build()
-                .parseSignedClaims(token)
-            return true
-        } catch (e: Exception) {
-            return false
-        }
+        return parseClaims(token) != null
     }
 }
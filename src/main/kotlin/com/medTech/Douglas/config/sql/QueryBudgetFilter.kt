@@ -0,0 +1,83 @@
+package com.medTech.Douglas.config.sql
+
+import io.micrometer.core.instrument.DistributionSummary
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.Timer
+import jakarta.servlet.FilterChain
+import jakarta.servlet.http.HttpServletRequest
+import jakarta.servlet.http.HttpServletResponse
+import org.slf4j.LoggerFactory
+import org.springframework.core.Ordered
+import org.springframework.core.annotation.Order
+import org.springframework.stereotype.Component
+import org.springframework.web.filter.OncePerRequestFilter
+import org.springframework.web.servlet.HandlerMapping
+import java.util.concurrent.TimeUnit
+
+/**
+ * Counts the SQL statements and database time of each request and warns when an endpoint
+ * goes over its query budget, which is how N+1 regressions show up.
+ *
+ * Runs before the security chain so the principal lookup is counted too. Per-endpoint
+ * totals are also published as `http.server.requests.queries` and `http.server.requests.db`.
+ */
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE + 2)
+class QueryBudgetFilter(
+    private val properties: SqlInstrumentationProperties,
+    private val meterRegistry: MeterRegistry
+) : OncePerRequestFilter() {
+
+    private val budgetLogger = LoggerFactory.getLogger("sql.budget")
+
+    override fun shouldNotFilter(request: HttpServletRequest): Boolean = !properties.enabled
+
+    // Async report endpoints finish on a second (ASYNC) dispatch; the totals are reported there
+    override fun shouldNotFilterAsyncDispatch(): Boolean = false
+
+    override fun doFilterInternal(
+        request: HttpServletRequest,
+        response: HttpServletResponse,
+        filterChain: FilterChain
+    ) {
+        val stats = request.getAttribute(STATS_ATTRIBUTE) as? RequestQueryStats
+            ?: RequestQueryStats().also { request.setAttribute(STATS_ATTRIBUTE, it) }
+        RequestQueryStats.bind(stats)
+        try {
+            filterChain.doFilter(request, response)
+        } finally {
+            RequestQueryStats.end()
+            if (!request.isAsyncStarted) {
+                report(request, stats)
+            }
+        }
+    }
+
+    private fun report(request: HttpServletRequest, stats: RequestQueryStats) {
+        // Set by Spring MVC once the handler is resolved; unmatched requests share one tag
+        val endpoint = request.getAttribute(HandlerMapping.BEST_MATCHING_PATTERN_ATTRIBUTE)?.toString() ?: "UNKNOWN"
+
+        DistributionSummary.builder("http.server.requests.queries")
+            .tag("uri", endpoint)
+            .tag("method", request.method)
+            .register(meterRegistry)
+            .record(stats.statements.toDouble())
+        Timer.builder("http.server.requests.db")
+            .tag("uri", endpoint)
+            .tag("method", request.method)
+            .register(meterRegistry)
+            .record(stats.elapsedMs, TimeUnit.MILLISECONDS)
+
+        val budget = properties.queryBudgets[endpoint] ?: properties.defaultQueryBudget
+        if (stats.statements > budget) {
+            budgetLogger.warn(
+                "{} {} ran {} statements ({} ms in the database), budget is {}",
+                request.method, request.requestURI, stats.statements, stats.elapsedMs, budget
+            )
+        }
+    }
+
+    companion object {
+        private val STATS_ATTRIBUTE = RequestQueryStats::class.java.name
+    }
+}
@@ -0,0 +1,37 @@
+package com.medTech.Douglas.config.sql
+
+import java.util.concurrent.atomic.AtomicInteger
+import java.util.concurrent.atomic.AtomicLong
+
+/**
+ * Statements executed by the current HTTP request, bound to the request thread by
+ * [QueryBudgetFilter]. Executors that run request work elsewhere (report executors) bind
+ * the same instance on their worker thread, so the counters are thread-safe.
+ */
+class RequestQueryStats {
+    private val statementCount = AtomicInteger()
+    private val elapsed = AtomicLong()
+
+    val statements: Int
+        get() = statementCount.get()
+    val elapsedMs: Long
+        get() = elapsed.get()
+
+    fun record(elapsedMs: Long) {
+        statementCount.incrementAndGet()
+        elapsed.addAndGet(elapsedMs)
+    }
+
+    companion object {
+        private val holder = ThreadLocal<RequestQueryStats>()
+
+        fun current(): RequestQueryStats? = holder.get()
+
+        fun end() = holder.remove()
+
+        /** Binds [stats] to the calling thread, or clears it when null. */
+        fun bind(stats: RequestQueryStats?) {
+            if (stats == null) holder.remove() else holder.set(stats)
+        }
+    }
+}
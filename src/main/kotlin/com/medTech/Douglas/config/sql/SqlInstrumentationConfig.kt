@@ -0,0 +1,41 @@
+package com.medTech.Douglas.config.sql
+
+import net.ttddyy.dsproxy.support.ProxyDataSource
+import net.ttddyy.dsproxy.support.ProxyDataSourceBuilder
+import org.springframework.beans.factory.ObjectProvider
+import org.springframework.beans.factory.config.BeanPostProcessor
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+import javax.sql.DataSource
+
+/**
+ * Wraps the application DataSource in a datasource-proxy so every statement, whether it
+ * comes from Hibernate or a JdbcTemplate, goes through [SqlInstrumentationListener].
+ */
+@Configuration
+class SqlInstrumentationConfig {
+
+    companion object {
+        private const val APPLICATION_DATA_SOURCE = "dataSource"
+
+        // Static so the post-processor does not force this configuration to load early
+        @JvmStatic
+        @Bean
+        fun sqlInstrumentationPostProcessor(properties: ObjectProvider<SqlInstrumentationProperties>): BeanPostProcessor {
+            return object : BeanPostProcessor {
+                override fun postProcessAfterInitialization(bean: Any, beanName: String): Any {
+                    // Only the application DataSource: with a read replica the pools behind it are
+                    // beans too, and wrapping them as well would count every statement twice
+                    if (bean !is DataSource || bean is ProxyDataSource || beanName != APPLICATION_DATA_SOURCE) return bean
+                    val settings = properties.getObject()
+                    if (!settings.enabled) return bean
+
+                    return ProxyDataSourceBuilder.create(bean)
+                        .name(beanName)
+                        .listener(SqlInstrumentationListener(settings))
+                        .build()
+                }
+            }
+        }
+    }
+}
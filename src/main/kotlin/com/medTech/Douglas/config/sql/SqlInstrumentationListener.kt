@@ -0,0 +1,37 @@
+package com.medTech.Douglas.config.sql
+
+import net.ttddyy.dsproxy.ExecutionInfo
+import net.ttddyy.dsproxy.QueryInfo
+import net.ttddyy.dsproxy.listener.QueryExecutionListener
+import org.slf4j.LoggerFactory
+
+/**
+ * Counts every statement against the current request and logs the slow ones.
+ * A JDBC batch counts as one statement, since it is one round trip.
+ */
+class SqlInstrumentationListener(
+    private val properties: SqlInstrumentationProperties
+) : QueryExecutionListener {
+
+    private val logger = LoggerFactory.getLogger("sql.slow")
+
+    override fun beforeQuery(execInfo: ExecutionInfo, queryInfoList: List<QueryInfo>) = Unit
+
+    override fun afterQuery(execInfo: ExecutionInfo, queryInfoList: List<QueryInfo>) {
+        RequestQueryStats.current()?.record(execInfo.elapsedTime)
+
+        if (execInfo.elapsedTime >= properties.slowQueryThresholdMs) {
+            val sql = queryInfoList.joinToString("; ") { it.query }
+            logger.warn(
+                "Slow query ({} ms{}): {}",
+                execInfo.elapsedTime,
+                if (execInfo.isBatch) ", batch of ${execInfo.batchSize}" else "",
+                if (sql.length > MAX_SQL_LENGTH) sql.take(MAX_SQL_LENGTH) + "..." else sql
+            )
+        }
+    }
+
+    companion object {
+        private const val MAX_SQL_LENGTH = 2000
+    }
+}
@@ -0,0 +1,16 @@
+package com.medTech.Douglas.config.sql
+
+import org.springframework.boot.context.properties.ConfigurationProperties
+import org.springframework.context.annotation.Configuration
+
+@Configuration
+@ConfigurationProperties(prefix = "sql-instrumentation")
+class SqlInstrumentationProperties {
+    var enabled: Boolean = true
+    // Statements slower than this are logged with their SQL
+    var slowQueryThresholdMs: Long = 200
+    // Statements allowed per request when the endpoint has no entry in queryBudgets
+    var defaultQueryBudget: Int = 30
+    // Endpoint pattern (as mapped in the controller, e.g. /api/v1/reports/panel/range) -> budget
+    var queryBudgets: Map<String, Int> = emptyMap()
+}
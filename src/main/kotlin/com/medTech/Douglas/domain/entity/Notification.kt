@@ -16,7 +16,7 @@ class Notification(
     @Column(name = "sector_id", nullable = false)
     val sectorId: UUID,
 
-    @ManyToOne(fetch = FetchType.EAGER)
+    @ManyToOne(fetch = FetchType.LAZY)
     @JoinColumn(name = "classification_id", nullable = true)
     var classification: NotificationClassification? = null,
 
@@ -26,7 +26,7 @@ class Notification(
     @Column(nullable = false)
     var description: String,
 
-    @ManyToOne(fetch = FetchType.EAGER)
+    @ManyToOne(fetch = FetchType.LAZY)
     @JoinColumn(name = "professional_category_id", nullable = true)
     var professionalCategory: ProfessionalCategory? = null,
 
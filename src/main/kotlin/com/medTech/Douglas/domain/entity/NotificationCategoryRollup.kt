@@ -0,0 +1,43 @@
+package com.medTech.Douglas.domain.entity
+
+import jakarta.persistence.*
+import org.hibernate.annotations.Immutable
+import java.io.Serializable
+import java.util.UUID
+
+// Maintained by database triggers on notifications (V23); read-only on this side.
+@Entity
+@Immutable
+@Table(name = "notification_category_rollup")
+@IdClass(NotificationCategoryRollup.Key::class)
+class NotificationCategoryRollup(
+    @Id
+    @Column(name = "period_id")
+    val periodId: UUID,
+
+    @Id
+    @Column(name = "sector_id")
+    val sectorId: UUID,
+
+    @Id
+    @Column(name = "category_key", insertable = false, updatable = false)
+    val categoryKey: String,
+
+    @Column(name = "professional_category_id")
+    val professionalCategoryId: UUID?,
+
+    @Column(name = "category_text")
+    val categoryText: String?,
+
+    @Column(nullable = false)
+    val total: Long,
+
+    @Column(nullable = false)
+    val notifications: Long
+) {
+    data class Key(
+        val periodId: UUID? = null,
+        val sectorId: UUID? = null,
+        val categoryKey: String? = null
+    ) : Serializable
+}
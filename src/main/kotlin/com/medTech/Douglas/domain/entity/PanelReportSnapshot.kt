@@ -0,0 +1,22 @@
+package com.medTech.Douglas.domain.entity
+
+import jakarta.persistence.*
+import java.time.LocalDateTime
+import java.util.UUID
+
+@Entity
+@Table(name = "panel_report_snapshots")
+class PanelReportSnapshot(
+    @Id
+    @Column(name = "period_id")
+    val periodId: UUID,
+
+    @Column(name = "sector_id", nullable = false)
+    val sectorId: UUID,
+
+    @Column(nullable = false, columnDefinition = "TEXT")
+    var payload: String,
+
+    @Column(name = "created_at", nullable = false)
+    var createdAt: LocalDateTime = LocalDateTime.now()
+)
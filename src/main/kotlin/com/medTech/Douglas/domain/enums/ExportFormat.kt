@@ -0,0 +1,6 @@
+package com.medTech.Douglas.domain.enums
+
+enum class ExportFormat(val contentType: String, val extension: String) {
+    CSV("text/csv; charset=UTF-8", "csv"),
+    XLSX("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx")
+}
@@ -5,6 +5,7 @@ import com.medTech.Douglas.domain.enums.EventType
 import org.springframework.data.jpa.repository.JpaRepository
 import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
@@ -12,6 +13,7 @@ interface AdverseEventRepository : JpaRepository<AdverseEvent, UUID> {
     fun findByPeriodId(periodId: UUID): List<AdverseEvent>
     fun findBySectorId(sectorId: UUID): List<AdverseEvent>
     fun findByPeriodIdAndSectorId(periodId: UUID, sectorId: UUID): List<AdverseEvent>
+    fun findByPeriodIdInAndSectorId(periodIds: Collection<UUID>, sectorId: UUID): List<AdverseEvent>
     fun findByPeriodIdAndSectorIdAndEventDateBetween(periodId: UUID, sectorId: UUID, startDate: java.time.LocalDate, endDate: java.time.LocalDate): List<AdverseEvent>
     fun findByEventDateBetween(startDate: java.time.LocalDate, endDate: java.time.LocalDate): List<AdverseEvent>
     fun findByCreatedBy(userId: UUID): List<AdverseEvent>
@@ -20,4 +22,17 @@ interface AdverseEventRepository : JpaRepository<AdverseEvent, UUID> {
            "AND (cast(:eventType as text) IS NULL OR a.eventType = :eventType) " +
            "ORDER BY a.eventDate DESC")
     fun search(periodId: UUID, eventType: EventType?): List<AdverseEvent>
+
+    @Query("SELECT a FROM AdverseEvent a " +
+           "WHERE a.sectorId IN :sectorIds AND a.periodId IN (" +
+           "SELECT p.id FROM Period p WHERE p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey) " +
+           "ORDER BY a.eventDate DESC")
+    fun findBySectorIdInAndPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<AdverseEvent>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT a FROM AdverseEvent a " +
+           "WHERE a.sectorId = :sectorId AND a.updatedAt > :since AND a.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR a.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<AdverseEvent>
 }
@@ -1,12 +1,41 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.report.ComplianceTotals
+import com.medTech.Douglas.api.dto.report.SectorObservation
 import com.medTech.Douglas.domain.entity.ComplianceIndicator
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface ComplianceIndicatorRepository : JpaRepository<ComplianceIndicator, UUID> {
     fun findByPeriodId(periodId: UUID): ComplianceIndicator?
+    fun findByPeriodIdIn(periodIds: Collection<UUID>): List<ComplianceIndicator>
     fun findBySectorId(sectorId: UUID): List<ComplianceIndicator>
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.ComplianceTotals(" +
+           "p.sectorId, COUNT(c), SUM(c.completeWristband), SUM(c.patientCommunication), " +
+           "SUM(c.medicationIdentified), SUM(c.handHygieneAdherence), SUM(c.fallRiskAssessment), " +
+           "SUM(c.pressureInjuryRiskAssessment)) " +
+           "FROM ComplianceIndicator c, Period p WHERE p.id = c.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "GROUP BY p.sectorId")
+    fun aggregateByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<ComplianceTotals>
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.SectorObservation(p.sectorId, c.observations) " +
+           "FROM ComplianceIndicator c, Period p WHERE p.id = c.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "AND c.observations IS NOT NULL " +
+           "ORDER BY p.year, p.month")
+    fun findObservationsByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<SectorObservation>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT c FROM ComplianceIndicator c " +
+           "WHERE c.sectorId = :sectorId AND c.updatedAt > :since AND c.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR c.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<ComplianceIndicator>
 }
@@ -1,12 +1,31 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.report.FallRiskTotals
 import com.medTech.Douglas.domain.entity.FallRiskAssessment
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface FallRiskAssessmentRepository : JpaRepository<FallRiskAssessment, UUID> {
     fun findByPeriodId(periodId: UUID): FallRiskAssessment?
+    fun findByPeriodIdIn(periodIds: Collection<UUID>): List<FallRiskAssessment>
     fun findBySectorId(sectorId: UUID): List<FallRiskAssessment>
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.FallRiskTotals(" +
+           "p.sectorId, SUM(f.totalPatients), SUM(f.assessedOnAdmission), " +
+           "SUM(f.highRisk), SUM(f.mediumRisk), SUM(f.lowRisk), SUM(f.notAssessed)) " +
+           "FROM FallRiskAssessment f, Period p WHERE p.id = f.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "GROUP BY p.sectorId")
+    fun aggregateByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<FallRiskTotals>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT f FROM FallRiskAssessment f " +
+           "WHERE f.sectorId = :sectorId AND f.updatedAt > :since AND f.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR f.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<FallRiskAssessment>
 }
@@ -1,12 +1,30 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.report.HandHygieneTotals
 import com.medTech.Douglas.domain.entity.HandHygieneAssessment
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface HandHygieneAssessmentRepository : JpaRepository<HandHygieneAssessment, UUID> {
     fun findByPeriodId(periodId: UUID): HandHygieneAssessment?
+    fun findByPeriodIdIn(periodIds: Collection<UUID>): List<HandHygieneAssessment>
     fun findBySectorId(sectorId: UUID): List<HandHygieneAssessment>
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.HandHygieneTotals(" +
+           "p.sectorId, COUNT(h), SUM(h.compliancePercentage)) " +
+           "FROM HandHygieneAssessment h, Period p WHERE p.id = h.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "GROUP BY p.sectorId")
+    fun aggregateByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<HandHygieneTotals>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT h FROM HandHygieneAssessment h " +
+           "WHERE h.sectorId = :sectorId AND h.updatedAt > :since AND h.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR h.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<HandHygieneAssessment>
 }
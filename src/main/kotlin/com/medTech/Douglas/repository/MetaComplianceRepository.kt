@@ -1,11 +1,29 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.report.MetaComplianceTotals
 import com.medTech.Douglas.domain.entity.MetaCompliance
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface MetaComplianceRepository : JpaRepository<MetaCompliance, UUID> {
     fun findByPeriodId(periodId: UUID): MetaCompliance?
+    fun findByPeriodIdIn(periodIds: Collection<UUID>): List<MetaCompliance>
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.MetaComplianceTotals(" +
+           "p.sectorId, COUNT(m), SUM(m.goalValue), SUM(m.percentage)) " +
+           "FROM MetaCompliance m, Period p WHERE p.id = m.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "GROUP BY p.sectorId")
+    fun aggregateByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<MetaComplianceTotals>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT m FROM MetaCompliance m " +
+           "WHERE m.sectorId = :sectorId AND m.updatedAt > :since AND m.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR m.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<MetaCompliance>
 }
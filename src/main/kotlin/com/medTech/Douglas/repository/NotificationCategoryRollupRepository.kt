@@ -0,0 +1,26 @@
+package com.medTech.Douglas.repository
+
+import com.medTech.Douglas.api.dto.notification.ProfessionalCategoryRankingResponse
+import com.medTech.Douglas.domain.entity.NotificationCategoryRollup
+import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
+import org.springframework.stereotype.Repository
+import java.util.UUID
+
+@Repository
+interface NotificationCategoryRollupRepository : JpaRepository<NotificationCategoryRollup, NotificationCategoryRollup.Key> {
+
+    // Category names are resolved here rather than stored, so renames show up immediately
+    @Query("SELECT new com.medTech.Douglas.api.dto.notification.ProfessionalCategoryRankingResponse(" +
+           "COALESCE(pc.name, r.categoryText, 'Não Informado'), SUM(r.total)) " +
+           "FROM NotificationCategoryRollup r LEFT JOIN ProfessionalCategory pc ON pc.id = r.professionalCategoryId " +
+           "WHERE (:periodId IS NULL OR r.periodId = :periodId) " +
+           "AND (:sectorId IS NULL OR r.sectorId = :sectorId) " +
+           "GROUP BY COALESCE(pc.name, r.categoryText, 'Não Informado') " +
+           "ORDER BY SUM(r.total) DESC")
+    fun getProfessionalCategoryRanking(periodId: UUID?, sectorId: UUID?): List<ProfessionalCategoryRankingResponse>
+
+    // Returns the number of rollup rows written
+    @Query(value = "SELECT rebuild_notification_category_rollup()", nativeQuery = true)
+    fun rebuild(): Long
+}
@@ -1,28 +1,94 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.notification.NotificationSummaryResponse
 import com.medTech.Douglas.domain.entity.Notification
+import org.springframework.data.domain.Page
+import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.data.jpa.repository.EntityGraph
 import org.springframework.data.jpa.repository.JpaRepository
 import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.util.Optional
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface NotificationRepository : JpaRepository<Notification, UUID> {
+    // classification and professionalCategory are LAZY; every finder whose result reaches
+    // NotificationMapper.toResponse loads them in the same select.
+
+    @EntityGraph(attributePaths = ["classification", "professionalCategory"])
+    override fun findById(id: UUID): Optional<Notification>
+
+    @EntityGraph(attributePaths = ["classification", "professionalCategory"])
     fun findByPeriodId(periodId: UUID): List<Notification>
+
+    @EntityGraph(attributePaths = ["classification", "professionalCategory"])
     fun findBySectorId(sectorId: UUID): List<Notification>
+
+    @EntityGraph(attributePaths = ["classification", "professionalCategory"])
     fun findByPeriodIdAndSectorId(periodId: UUID, sectorId: UUID): List<Notification>
+
+    @EntityGraph(attributePaths = ["classification", "professionalCategory"])
     fun findByCreatedBy(userId: UUID): List<Notification>
 
-    @Query("SELECT n FROM Notification n WHERE n.periodId = :periodId " +
-           "AND (cast(:classificationId as text) IS NULL OR n.classification.id = :classificationId) ")
+    @Query("SELECT n FROM Notification n " +
+           "LEFT JOIN FETCH n.classification " +
+           "LEFT JOIN FETCH n.professionalCategory " +
+           "WHERE n.periodId IN :periodIds AND n.sectorId = :sectorId")
+    fun findByPeriodIdInAndSectorId(periodIds: Collection<UUID>, sectorId: UUID): List<Notification>
+
+    @Query("SELECT n FROM Notification n " +
+           "LEFT JOIN FETCH n.classification c " +
+           "LEFT JOIN FETCH n.professionalCategory " +
+           "WHERE n.periodId = :periodId " +
+           "AND (cast(:classificationId as text) IS NULL OR c.id = :classificationId) ")
     fun search(periodId: UUID, classificationId: UUID?): List<Notification>
 
-    @Query("SELECT new com.medTech.Douglas.api.dto.notification.ProfessionalCategoryRankingResponse(" +
-           "COALESCE(pc.name, n.professionalCategoryText, 'Não Informado'), SUM(n.quantityProfessional)) " +
-           "FROM Notification n LEFT JOIN n.professionalCategory pc " +
-           "WHERE (:periodId IS NULL OR n.periodId = :periodId) " +
-           "AND (:sectorId IS NULL OR n.sectorId = :sectorId) " +
-           "GROUP BY COALESCE(pc.name, n.professionalCategoryText, 'Não Informado') " +
-           "ORDER BY SUM(n.quantityProfessional) DESC")
-    fun getProfessionalCategoryRanking(periodId: UUID?, sectorId: UUID?): List<com.medTech.Douglas.api.dto.notification.ProfessionalCategoryRankingResponse>
+    @Query("SELECT n FROM Notification n " +
+           "LEFT JOIN FETCH n.classification " +
+           "LEFT JOIN FETCH n.professionalCategory " +
+           "WHERE n.sectorId IN :sectorIds AND n.periodId IN (" +
+           "SELECT p.id FROM Period p WHERE p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey) " +
+           "ORDER BY n.createdAt DESC")
+    fun findBySectorIdInAndPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<Notification>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT n FROM Notification n " +
+           "LEFT JOIN FETCH n.classification " +
+           "LEFT JOIN FETCH n.professionalCategory " +
+           "WHERE n.sectorId = :sectorId AND n.updatedAt > :since AND n.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR n.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<Notification>
+
+    // Paged summaries: the Page variants also run the count query, the Slice variants only
+    // fetch one extra row to know whether there is a next page.
+
+    @Query(value = SUMMARY_SELECT + "WHERE n.periodId = :periodId " +
+           "AND (cast(:classificationId as text) IS NULL OR c.id = :classificationId)",
+           countQuery = "SELECT COUNT(n) FROM Notification n WHERE n.periodId = :periodId " +
+           "AND (cast(:classificationId as text) IS NULL OR n.classification.id = :classificationId)")
+    fun pageSummariesByPeriod(periodId: UUID, classificationId: UUID?, pageable: Pageable): Page<NotificationSummaryResponse>
+
+    @Query(SUMMARY_SELECT + "WHERE n.periodId = :periodId " +
+           "AND (cast(:classificationId as text) IS NULL OR c.id = :classificationId)")
+    fun sliceSummariesByPeriod(periodId: UUID, classificationId: UUID?, pageable: Pageable): Slice<NotificationSummaryResponse>
+
+    @Query(value = SUMMARY_SELECT + "WHERE n.sectorId = :sectorId",
+           countQuery = "SELECT COUNT(n) FROM Notification n WHERE n.sectorId = :sectorId")
+    fun pageSummariesBySector(sectorId: UUID, pageable: Pageable): Page<NotificationSummaryResponse>
+
+    @Query(SUMMARY_SELECT + "WHERE n.sectorId = :sectorId")
+    fun sliceSummariesBySector(sectorId: UUID, pageable: Pageable): Slice<NotificationSummaryResponse>
+
+    companion object {
+        const val SUMMARY_SELECT =
+            "SELECT new com.medTech.Douglas.api.dto.notification.NotificationSummaryResponse(" +
+            "n.id, n.periodId, n.sectorId, c.id, c.name, n.classificationText, n.description, " +
+            "pc.id, pc.name, n.professionalCategoryText, n.quantityClassification, n.quantityCategory, " +
+            "n.quantityProfessional, n.quantity, n.createdAt, n.updatedAt) " +
+            "FROM Notification n LEFT JOIN n.classification c LEFT JOIN n.professionalCategory pc "
+    }
 }
@@ -0,0 +1,16 @@
+package com.medTech.Douglas.repository
+
+import com.medTech.Douglas.domain.entity.PanelReportSnapshot
+import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
+import org.springframework.stereotype.Repository
+import java.util.UUID
+
+@Repository
+interface PanelReportSnapshotRepository : JpaRepository<PanelReportSnapshot, UUID> {
+    fun findByPeriodIdAndSectorId(periodId: UUID, sectorId: UUID): PanelReportSnapshot?
+    fun findByPeriodIdInAndSectorId(periodIds: Collection<UUID>, sectorId: UUID): List<PanelReportSnapshot>
+
+    @Query("SELECT s.periodId FROM PanelReportSnapshot s WHERE s.periodId IN :periodIds")
+    fun findExistingPeriodIds(periodIds: Collection<UUID>): List<UUID>
+}
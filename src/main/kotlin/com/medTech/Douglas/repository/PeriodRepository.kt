@@ -2,7 +2,9 @@ package com.medTech.Douglas.repository
 
 import com.medTech.Douglas.domain.entity.Period
 import com.medTech.Douglas.domain.enums.PeriodStatus
+import jakarta.persistence.LockModeType
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Lock
 import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
 import java.util.Optional
@@ -20,4 +22,19 @@ interface PeriodRepository : JpaRepository<Period, UUID> {
            "AND (cast(:year as integer) IS NULL OR p.year = :year) " +
            "ORDER BY p.year DESC, p.month DESC")
     fun search(sectorId: UUID, status: PeriodStatus?, year: Int?): List<Period>
+
+    // Writes share-lock the period they write to (PeriodValidator); status transitions and the
+    // snapshot backfill lock it exclusively, so neither can interleave with an in-flight write.
+    // Rows are locked in id order to keep multi-period lockers from deadlocking.
+    @Lock(LockModeType.PESSIMISTIC_READ)
+    @Query("SELECT p FROM Period p WHERE p.id IN :ids ORDER BY p.id")
+    fun findAllForShare(ids: Collection<UUID>): List<Period>
+
+    @Lock(LockModeType.PESSIMISTIC_WRITE)
+    @Query("SELECT p FROM Period p WHERE p.id IN :ids ORDER BY p.id")
+    fun findAllForUpdate(ids: Collection<UUID>): List<Period>
+
+    @Lock(LockModeType.PESSIMISTIC_WRITE)
+    @Query("SELECT p FROM Period p WHERE p.id = :id")
+    fun findByIdForUpdate(id: UUID): Period?
 }
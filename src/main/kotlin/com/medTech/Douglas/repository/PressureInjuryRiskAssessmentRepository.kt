@@ -1,12 +1,31 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.report.PressureInjuryTotals
 import com.medTech.Douglas.domain.entity.PressureInjuryRiskAssessment
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface PressureInjuryRiskAssessmentRepository : JpaRepository<PressureInjuryRiskAssessment, UUID> {
     fun findByPeriodId(periodId: UUID): PressureInjuryRiskAssessment?
+    fun findByPeriodIdIn(periodIds: Collection<UUID>): List<PressureInjuryRiskAssessment>
     fun findBySectorId(sectorId: UUID): List<PressureInjuryRiskAssessment>
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.PressureInjuryTotals(" +
+           "p.sectorId, SUM(r.totalPatients), SUM(r.assessedOnAdmission), SUM(r.veryHigh), " +
+           "SUM(r.highRisk), SUM(r.mediumRisk), SUM(r.lowRisk), SUM(r.notAssessed)) " +
+           "FROM PressureInjuryRiskAssessment r, Period p WHERE p.id = r.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "GROUP BY p.sectorId")
+    fun aggregateByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<PressureInjuryTotals>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT p FROM PressureInjuryRiskAssessment p " +
+           "WHERE p.sectorId = :sectorId AND p.updatedAt > :since AND p.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR p.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<PressureInjuryRiskAssessment>
 }
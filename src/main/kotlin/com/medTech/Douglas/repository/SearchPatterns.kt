@@ -0,0 +1,15 @@
+package com.medTech.Douglas.repository
+
+// Substring search helpers for Specification-based filters. The columns they are used on
+// have pg_trgm GIN indexes (V21), which serve LIKE '%term%' for terms of 3+ characters.
+
+const val LIKE_ESCAPE = '\\'
+
+/** `%term%` with the LIKE wildcards in [term] escaped, so they match literally. */
+fun containsPattern(term: String): String {
+    val escaped = term
+        .replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    return "%$escaped%"
+}
@@ -1,12 +1,30 @@
 package com.medTech.Douglas.repository
 
+import com.medTech.Douglas.api.dto.report.SelfNotificationTotals
 import com.medTech.Douglas.domain.entity.SelfNotification
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.UUID
 
 @Repository
 interface SelfNotificationRepository : JpaRepository<SelfNotification, UUID> {
     fun findByPeriodId(periodId: UUID): SelfNotification?
+    fun findByPeriodIdIn(periodIds: Collection<UUID>): List<SelfNotification>
     fun findByPeriodIdAndSectorId(periodId: UUID, sectorId: UUID): SelfNotification?
+
+    @Query("SELECT new com.medTech.Douglas.api.dto.report.SelfNotificationTotals(" +
+           "p.sectorId, SUM(s.quantity), SUM(s.percentage * s.quantity)) " +
+           "FROM SelfNotification s, Period p WHERE p.id = s.periodId " +
+           "AND p.sectorId IN :sectorIds " +
+           "AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey " +
+           "GROUP BY p.sectorId")
+    fun aggregateByPeriodRange(sectorIds: Collection<UUID>, startKey: Int, endKey: Int): List<SelfNotificationTotals>
+
+    // Delta sync: the sector's (or one period's) rows changed in (since, until]
+    @Query("SELECT s FROM SelfNotification s " +
+           "WHERE s.sectorId = :sectorId AND s.updatedAt > :since AND s.updatedAt <= :until " +
+           "AND (cast(:periodId as text) IS NULL OR s.periodId = :periodId)")
+    fun findChanged(sectorId: UUID, periodId: UUID?, since: LocalDateTime, until: LocalDateTime): List<SelfNotification>
 }
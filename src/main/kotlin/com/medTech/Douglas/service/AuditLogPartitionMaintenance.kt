@@ -0,0 +1,167 @@
+package com.medTech.Douglas.service
+
+import com.medTech.Douglas.config.AuditPartitionProperties
+import org.postgresql.PGConnection
+import org.slf4j.LoggerFactory
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.scheduling.annotation.Scheduled
+import org.springframework.stereotype.Component
+import java.io.BufferedOutputStream
+import java.nio.file.Files
+import java.nio.file.Paths
+import java.nio.file.StandardCopyOption
+import java.sql.Connection
+import java.time.LocalDate
+import java.time.YearMonth
+import java.time.format.DateTimeFormatter
+import java.util.zip.GZIPOutputStream
+import javax.sql.DataSource
+
+/**
+ * Keeps the monthly partitions of `audit_logs` (V22) in shape.
+ *
+ * Every [AuditPartitionProperties.checkIntervalMs], starting at boot, it creates the partitions
+ * for the current month and [AuditPartitionProperties.monthsAhead] months ahead, and moves any
+ * rows that ended up in the default partition into their own month. When
+ * [AuditPartitionProperties.retentionMonths] is set, older partitions are detached, written to
+ * `<archiveDir>/audit_logs_YYYY_MM.csv.gz` with COPY and then dropped. The archive file is
+ * complete before the table is dropped; a partition left detached by a failed run is picked up
+ * again on the next one. An advisory lock keeps several instances from running it at once.
+ */
+@Component
+@ConditionalOnProperty(prefix = "audit.partitions", name = ["enabled"], havingValue = "true", matchIfMissing = true)
+class AuditLogPartitionMaintenance(
+    private val dataSource: DataSource,
+    private val properties: AuditPartitionProperties
+) {
+
+    private val logger = LoggerFactory.getLogger(AuditLogPartitionMaintenance::class.java)
+
+    private class Partition(val name: String, val month: YearMonth, val attached: Boolean)
+
+    @Scheduled(fixedDelayString = "\${audit.partitions.check-interval-ms:21600000}")
+    fun runSafely() {
+        try {
+            run()
+        } catch (e: Exception) {
+            logger.error("Audit log partition maintenance failed", e)
+        }
+    }
+
+    fun run() {
+        dataSource.connection.use { connection ->
+            // Each statement commits on its own, so DETACH only holds its lock briefly
+            connection.autoCommit = true
+            if (!queryBoolean(connection, "SELECT pg_try_advisory_lock($LOCK_KEY)")) {
+                logger.debug("Audit log partition maintenance is running elsewhere, skipping")
+                return
+            }
+            try {
+                createPartitions(connection)
+                if (properties.retentionMonths > 0) {
+                    archiveExpired(connection)
+                }
+            } finally {
+                queryBoolean(connection, "SELECT pg_advisory_unlock($LOCK_KEY)")
+            }
+        }
+    }
+
+    private fun createPartitions(connection: Connection) {
+        val current = YearMonth.now()
+        val upcoming = (0..properties.monthsAhead).map { current.plusMonths(it.toLong()) }
+        val stray = monthsInDefaultPartition(connection)
+        if (stray.isNotEmpty()) {
+            logger.warn("Audit log rows found in the default partition for {}, moving them to monthly partitions", stray)
+        }
+
+        (upcoming + stray).distinct().forEach { month ->
+            connection.prepareStatement("SELECT ensure_audit_log_partition(?)").use { statement ->
+                statement.setObject(1, month.atDay(1))
+                statement.execute()
+            }
+        }
+    }
+
+    private fun archiveExpired(connection: Connection) {
+        val cutoff = YearMonth.now().minusMonths(properties.retentionMonths.toLong())
+        partitions(connection).filter { it.month < cutoff }.forEach { archive(connection, it) }
+    }
+
+    private fun archive(connection: Connection, partition: Partition) {
+        val started = System.currentTimeMillis()
+        if (partition.attached) {
+            execute(connection, "ALTER TABLE audit_logs DETACH PARTITION ${partition.name}")
+        }
+
+        val dir = Paths.get(properties.archiveDir)
+        Files.createDirectories(dir)
+        val target = dir.resolve("${partition.name}.csv.gz")
+        val temp = dir.resolve("${partition.name}.csv.gz.tmp")
+
+        val rows = GZIPOutputStream(BufferedOutputStream(Files.newOutputStream(temp))).use { out ->
+            connection.unwrap(PGConnection::class.java).copyAPI
+                .copyOut("COPY ${partition.name} TO STDOUT WITH (FORMAT csv, HEADER)", out)
+        }
+        Files.move(temp, target, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE)
+
+        execute(connection, "DROP TABLE ${partition.name}")
+        logger.info(
+            "Archived audit log partition {} ({} rows) to {} in {} ms",
+            partition.name, rows, target, System.currentTimeMillis() - started
+        )
+    }
+
+    // Attached partitions and ones a previous run detached but did not get to drop
+    private fun partitions(connection: Connection): List<Partition> =
+        connection.createStatement().use { statement ->
+            statement.executeQuery(PARTITIONS_SQL).use { rs ->
+                val result = mutableListOf<Partition>()
+                while (rs.next()) {
+                    val name = rs.getString("relname")
+                    val month = YearMonth.parse(name.removePrefix("audit_logs_"), PARTITION_MONTH)
+                    result.add(Partition(name, month, rs.getBoolean("attached")))
+                }
+                result
+            }
+        }
+
+    private fun monthsInDefaultPartition(connection: Connection): List<YearMonth> =
+        connection.createStatement().use { statement ->
+            statement.executeQuery(
+                "SELECT DISTINCT date_trunc('month', created_at)::date FROM audit_logs_default"
+            ).use { rs ->
+                val result = mutableListOf<YearMonth>()
+                while (rs.next()) {
+                    result.add(YearMonth.from(rs.getObject(1, LocalDate::class.java)))
+                }
+                result
+            }
+        }
+
+    private fun queryBoolean(connection: Connection, sql: String): Boolean =
+        connection.createStatement().use { statement ->
+            statement.executeQuery(sql).use { rs -> rs.next() && rs.getBoolean(1) }
+        }
+
+    private fun execute(connection: Connection, sql: String) {
+        connection.createStatement().use { it.execute(sql) }
+    }
+
+    companion object {
+        private const val LOCK_KEY = 7_310_034_000_022L
+        private val PARTITION_MONTH = DateTimeFormatter.ofPattern("yyyy_MM")
+
+        // Names are matched exactly, so they are safe to use unquoted in the DDL above
+        private const val PARTITIONS_SQL = """
+            SELECT c.relname,
+                   EXISTS (SELECT 1 FROM pg_inherits i
+                           WHERE i.inhrelid = c.oid AND i.inhparent = 'audit_logs'::regclass) AS attached
+            FROM pg_class c
+            WHERE c.relkind = 'r'
+              AND c.relnamespace = current_schema()::regnamespace
+              AND c.relname ~ '^audit_logs_[0-9]{4}_[0-9]{2}$'
+            ORDER BY c.relname
+        """
+    }
+}
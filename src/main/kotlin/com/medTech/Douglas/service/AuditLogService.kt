@@ -1,17 +1,28 @@
 package com.medTech.Douglas.service
 
+import com.medTech.Douglas.api.dto.CursorPage
+import com.medTech.Douglas.config.security.CustomUserDetails
 import com.medTech.Douglas.domain.entity.AuditLog
+import com.medTech.Douglas.exception.ValidationException
 import com.medTech.Douglas.repository.AuditLogRepository
+import com.medTech.Douglas.repository.LIKE_ESCAPE
+import com.medTech.Douglas.repository.containsPattern
+import jakarta.persistence.criteria.Predicate
+import org.springframework.data.domain.Sort
+import org.springframework.data.jpa.domain.Specification
+import org.springframework.data.repository.query.FluentQuery
 import org.springframework.security.core.context.SecurityContextHolder
 import org.springframework.stereotype.Service
-import org.springframework.transaction.annotation.Propagation
 import org.springframework.transaction.annotation.Transactional
-
+import java.nio.charset.StandardCharsets
 import java.time.LocalDateTime
+import java.util.Base64
+import java.util.UUID
 
 @Service
 class AuditLogService(
-    private val auditLogRepository: AuditLogRepository
+    private val auditLogRepository: AuditLogRepository,
+    private val auditLogWriter: AuditLogWriter
 ) {
 
     @Transactional(readOnly = true)
@@ -19,33 +30,109 @@ class AuditLogService(
         action: String?,
         resource: String?,
         userEmail: String?,
+        details: String?,
         startDate: LocalDateTime?,
-        endDate: LocalDateTime?
-    ): List<AuditLog> {
-        return auditLogRepository.search(action, resource, userEmail, startDate, endDate)
+        endDate: LocalDateTime?,
+        cursor: String? = null,
+        size: Int = DEFAULT_PAGE_SIZE
+    ): CursorPage<AuditLog> {
+        val pageSize = size.coerceIn(1, MAX_PAGE_SIZE)
+        val after = cursor?.let { decodeCursor(it) }
+
+        // Only the filters that were given become predicates, so each combination
+        // gets a plan that can range-scan the matching (..., created_at, id) index.
+        val spec = Specification<AuditLog> { root, _, cb ->
+            val predicates = mutableListOf<Predicate>()
+
+            if (!action.isNullOrBlank()) {
+                predicates.add(cb.equal(root.get<String>("action"), action))
+            }
+
+            if (!resource.isNullOrBlank()) {
+                predicates.add(cb.equal(root.get<String>("resource"), resource))
+            }
+
+            if (!userEmail.isNullOrBlank()) {
+                predicates.add(cb.like(root.get("userEmail"), containsPattern(userEmail), LIKE_ESCAPE))
+            }
+
+            if (!details.isNullOrBlank()) {
+                predicates.add(cb.like(cb.lower(root.get("details")), containsPattern(details.lowercase()), LIKE_ESCAPE))
+            }
+
+            if (startDate != null) {
+                predicates.add(cb.greaterThanOrEqualTo(root.get("createdAt"), startDate))
+            }
+
+            if (endDate != null) {
+                predicates.add(cb.lessThanOrEqualTo(root.get("createdAt"), endDate))
+            }
+
+            // (created_at, id) < cursor, written with a plain upper bound on created_at in front:
+            // audit_logs is partitioned by month and the OR alone would not let the planner
+            // skip the months after the cursor.
+            if (after != null) {
+                val createdAt = root.get<LocalDateTime>("createdAt")
+                predicates.add(cb.lessThanOrEqualTo(createdAt, after.first))
+                predicates.add(
+                    cb.or(
+                        cb.lessThan(createdAt, after.first),
+                        cb.lessThan(root.get<UUID>("id"), after.second)
+                    )
+                )
+            }
+
+            cb.and(*predicates.toTypedArray())
+        }
+
+        // Fetch one extra row to know whether another page exists
+        val rows = auditLogRepository.findBy(spec) { query: FluentQuery.FetchableFluentQuery<AuditLog> ->
+            query.sortBy(Sort.by(Sort.Order.desc("createdAt"), Sort.Order.desc("id")))
+                .limit(pageSize + 1)
+                .all()
+        }
+
+        val items = rows.take(pageSize)
+        val nextCursor = if (rows.size > pageSize) encodeCursor(items.last()) else null
+        return CursorPage(items, nextCursor)
     }
 
-    @Transactional(propagation = Propagation.REQUIRES_NEW)
+    // Runs on the request thread only to capture the principal; the insert itself is
+    // batched and written in the background by AuditLogWriter.
     fun log(action: String, resource: String, resourceId: String?, details: String?) {
         val auth = SecurityContextHolder.getContext().authentication
-        val email = if (auth != null && auth.isAuthenticated && auth.name != "anonymousUser") {
-            auth.name
-        } else {
-            "SYSTEM"
-        }
-        
-        // Note: Getting User ID would require looking up the user, which adds overhead. 
-        // For now, we store email which is readily available in the token/context.
-        // If ID is strictly required, we can inject UserRepository.
+        val authenticated = auth != null && auth.isAuthenticated && auth.name != "anonymousUser"
+        val email = if (authenticated) auth!!.name else "SYSTEM"
+        val userId = if (authenticated) (auth!!.principal as? CustomUserDetails)?.id else null
 
         val log = AuditLog(
-            userId = null, // Can be populated if we fetch user
+            userId = userId,
             userEmail = email,
             action = action,
             resource = resource,
             resourceId = resourceId,
             details = details
         )
-        auditLogRepository.save(log)
+        auditLogWriter.submit(log)
+    }
+
+    private fun encodeCursor(last: AuditLog): String {
+        val raw = "${last.createdAt}|${last.id}"
+        return Base64.getUrlEncoder().withoutPadding().encodeToString(raw.toByteArray(StandardCharsets.UTF_8))
+    }
+
+    private fun decodeCursor(cursor: String): Pair<LocalDateTime, UUID> {
+        try {
+            val raw = String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8)
+            val (createdAt, id) = raw.split("|", limit = 2)
+            return Pair(LocalDateTime.parse(createdAt), UUID.fromString(id))
+        } catch (e: Exception) {
+            throw ValidationException("Invalid cursor")
+        }
+    }
+
+    companion object {
+        const val DEFAULT_PAGE_SIZE = 50
+        const val MAX_PAGE_SIZE = 200
     }
 }
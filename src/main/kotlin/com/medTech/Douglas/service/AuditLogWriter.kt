@@ -0,0 +1,246 @@
+package com.medTech.Douglas.service
+
+import com.medTech.Douglas.config.AuditWriterProperties
+import com.medTech.Douglas.domain.entity.AuditLog
+import io.micrometer.core.instrument.Counter
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.Timer
+import jakarta.annotation.PostConstruct
+import jakarta.annotation.PreDestroy
+import org.slf4j.LoggerFactory
+import org.springframework.jdbc.CannotGetJdbcConnectionException
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+import java.sql.Timestamp
+import java.util.concurrent.ArrayBlockingQueue
+import java.util.concurrent.BlockingQueue
+import java.util.concurrent.LinkedBlockingQueue
+import java.util.concurrent.TimeUnit
+
+/**
+ * Writes audit entries off the request thread.
+ *
+ * Entries are buffered in a bounded queue and a single background thread flushes them with
+ * JDBC batch inserts, either when [AuditWriterProperties.batchSize] entries are pending or when
+ * [AuditWriterProperties.flushIntervalMs] has elapsed. When the queue is full the caller waits up
+ * to [AuditWriterProperties.offerTimeoutMs] and then hands the entry to the retry queue; the
+ * request thread never inserts itself, so a database outage does not stall requests.
+ *
+ * A failed batch is retried row by row, so one bad entry does not take the rest with it, and the
+ * rows that still fail ride along with the next flushes. While no connection can be obtained the
+ * whole batch is kept as is. Every failed flush counts as an attempt, and the retry queue holds at
+ * most [AuditWriterProperties.retryCapacity] entries. An entry that fails
+ * [AuditWriterProperties.maxAttempts] times, or finds the retry queue full, is given up on and
+ * logged in full on the `audit.dropped` logger. On shutdown the worker finishes its current
+ * flush and the queue and pending retries are written.
+ *
+ * Published metrics: `audit.log.submitted` (by path: queued or overflow), `audit.log.written`
+ * (by outcome), `audit.log.queue.size`, `audit.log.retry.size` and the `audit.log.flush` timer.
+ */
+@Component
+class AuditLogWriter(
+    private val jdbcTemplate: JdbcTemplate,
+    private val properties: AuditWriterProperties,
+    private val meterRegistry: MeterRegistry
+) {
+
+    private val logger = LoggerFactory.getLogger(AuditLogWriter::class.java)
+    private val droppedLogger = LoggerFactory.getLogger("audit.dropped")
+
+    private class Pending(val entry: AuditLog, var attempts: Int = 0)
+
+    private val queue: BlockingQueue<AuditLog> = ArrayBlockingQueue(properties.queueCapacity)
+
+    // Entries whose insert failed, and overflow from a full queue; written with the next flushes
+    private val retries: BlockingQueue<Pending> = LinkedBlockingQueue(properties.retryCapacity)
+
+    private val queuedCounter = Counter.builder("audit.log.submitted").tag("path", "queued").register(meterRegistry)
+    private val overflowCounter = Counter.builder("audit.log.submitted").tag("path", "overflow").register(meterRegistry)
+    private val writtenCounter = Counter.builder("audit.log.written").tag("outcome", "success").register(meterRegistry)
+    private val failedCounter = Counter.builder("audit.log.written").tag("outcome", "failure").register(meterRegistry)
+    private val flushTimer = Timer.builder("audit.log.flush").register(meterRegistry)
+
+    init {
+        Gauge.builder("audit.log.queue.size", queue) { it.size.toDouble() }.register(meterRegistry)
+        Gauge.builder("audit.log.retry.size", retries) { it.size.toDouble() }.register(meterRegistry)
+    }
+
+    @Volatile
+    private var running = false
+
+    private lateinit var worker: Thread
+
+    // stop() may only interrupt the worker while it waits on the queue: an interrupt that
+    // reaches an insert makes the pool refuse the connection and fails the batch.
+    private val pollLock = Any()
+    private var polling = false
+
+    // Set once stop() has made its last pass over the retries; later entries are dropped at once
+    private val shutdownLock = Any()
+    private var stopped = false
+
+    @PostConstruct
+    fun start() {
+        running = true
+        worker = Thread(::runLoop, "audit-log-writer").apply {
+            isDaemon = true
+            start()
+        }
+    }
+
+    fun submit(entry: AuditLog) {
+        if (running && queue.offer(entry, properties.offerTimeoutMs, TimeUnit.MILLISECONDS)) {
+            queuedCounter.increment()
+            return
+        }
+        // Queue full (or shutting down): park the entry with the retries instead of inserting it
+        // on the request thread, which would wait for a connection while the database is down
+        overflowCounter.increment()
+        val parked = synchronized(shutdownLock) { !stopped && retries.offer(Pending(entry)) }
+        if (!parked) {
+            drop(Pending(entry), if (stopped) "writer stopped" else "retry queue full", null)
+        }
+    }
+
+    @PreDestroy
+    fun stop() {
+        running = false
+        worker.join(properties.shutdownTimeoutMs)
+        if (worker.isAlive) {
+            synchronized(pollLock) {
+                if (polling) worker.interrupt()
+            }
+            worker.join(properties.shutdownTimeoutMs)
+        }
+
+        val remaining = mutableListOf<AuditLog>()
+        queue.drainTo(remaining)
+        remaining.chunked(properties.batchSize).forEach { chunk -> write(chunk.map { Pending(it) }) }
+
+        // Last attempt for earlier failures and overflow; whatever still fails is logged in full
+        val pending = generateSequence { retries.poll() }.toList()
+        pending.chunked(properties.batchSize).forEach { write(it) }
+        synchronized(shutdownLock) { stopped = true }
+        generateSequence { retries.poll() }.forEach { drop(it, "shutting down", null) }
+    }
+
+    private fun runLoop() {
+        val entries = ArrayList<AuditLog>(properties.batchSize)
+        while (running) {
+            collect(entries)
+            val batch = entries.map { Pending(it) } + drainRetries()
+            entries.clear()
+            if (batch.isNotEmpty()) {
+                write(batch)
+            }
+        }
+    }
+
+    private fun collect(batch: MutableList<AuditLog>) {
+        val first = pollQueue(TimeUnit.MILLISECONDS.toNanos(properties.flushIntervalMs)) ?: return
+        batch.add(first)
+
+        val deadline = System.nanoTime() + TimeUnit.MILLISECONDS.toNanos(properties.flushIntervalMs)
+        while (running && batch.size < properties.batchSize) {
+            queue.drainTo(batch, properties.batchSize - batch.size)
+            val remaining = deadline - System.nanoTime()
+            if (batch.size >= properties.batchSize || remaining <= 0) break
+            val next = pollQueue(remaining) ?: break
+            batch.add(next)
+        }
+    }
+
+    private fun pollQueue(timeoutNanos: Long): AuditLog? {
+        synchronized(pollLock) { polling = true }
+        try {
+            return queue.poll(timeoutNanos, TimeUnit.NANOSECONDS)
+        } catch (e: InterruptedException) {
+            // stop() wakes us up this way; the loop then sees running == false
+            return null
+        } finally {
+            synchronized(pollLock) { polling = false }
+            // An interrupt aimed at the poll that arrived just after it returned must not reach the insert
+            Thread.interrupted()
+        }
+    }
+
+    private fun drainRetries(): List<Pending> {
+        val result = ArrayList<Pending>()
+        while (result.size < properties.batchSize) {
+            result.add(retries.poll() ?: break)
+        }
+        return result
+    }
+
+    private fun write(batch: List<Pending>) {
+        if (batch.isEmpty()) return
+        val sample = Timer.start(meterRegistry)
+        try {
+            insert(batch.map { it.entry })
+            writtenCounter.increment(batch.size.toDouble())
+        } catch (e: CannotGetJdbcConnectionException) {
+            // Row by row would only wait on the pool once per entry
+            logger.warn("No connection for audit log entries, keeping {} for the next flush", batch.size, e)
+            batch.forEach { retry(it, e) }
+        } catch (e: Exception) {
+            logger.warn("Failed to write a batch of {} audit log entries, retrying them one by one", batch.size, e)
+            writeOneByOne(batch)
+        } finally {
+            sample.stop(flushTimer)
+        }
+    }
+
+    private fun writeOneByOne(batch: List<Pending>) {
+        for ((index, pending) in batch.withIndex()) {
+            try {
+                insert(listOf(pending.entry))
+                writtenCounter.increment()
+            } catch (e: CannotGetJdbcConnectionException) {
+                batch.subList(index, batch.size).forEach { retry(it, e) }
+                return
+            } catch (e: Exception) {
+                retry(pending, e)
+            }
+        }
+    }
+
+    private fun retry(pending: Pending, cause: Exception) {
+        pending.attempts++
+        when {
+            pending.attempts >= properties.maxAttempts -> drop(pending, "too many attempts", cause)
+            !retries.offer(pending) -> drop(pending, "retry queue full", cause)
+        }
+    }
+
+    private fun drop(pending: Pending, reason: String, cause: Exception?) {
+        failedCounter.increment()
+        val entry = pending.entry
+        droppedLogger.error(
+            "Audit log entry not written ({}, {} attempts): id={} userId={} userEmail={} action={} resource={} resourceId={} createdAt={} details={}",
+            reason, pending.attempts, entry.id, entry.userId, entry.userEmail, entry.action, entry.resource,
+            entry.resourceId, entry.createdAt, entry.details, cause
+        )
+    }
+
+    private fun insert(entries: List<AuditLog>) {
+        jdbcTemplate.batchUpdate(INSERT_SQL, entries, entries.size) { ps, entry ->
+            ps.setObject(1, entry.id)
+            ps.setObject(2, entry.userId)
+            ps.setString(3, entry.userEmail)
+            ps.setString(4, entry.action)
+            ps.setString(5, entry.resource)
+            ps.setString(6, entry.resourceId)
+            ps.setString(7, entry.details)
+            ps.setTimestamp(8, Timestamp.valueOf(entry.createdAt))
+        }
+    }
+
+    companion object {
+        // Rows of a failed batch may already be in (statements commit one by one), so a retry
+        // must be able to insert them again without tripping the primary key
+        private const val INSERT_SQL =
+            "INSERT INTO audit_logs (id, user_id, user_email, action, resource, resource_id, details, created_at) " +
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT DO NOTHING"
+    }
+}
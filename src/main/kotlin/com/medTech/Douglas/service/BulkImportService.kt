@@ -0,0 +1,200 @@
+package com.medTech.Douglas.service
+
+import com.fasterxml.jackson.core.JsonProcessingException
+import com.fasterxml.jackson.databind.JsonNode
+import com.fasterxml.jackson.databind.ObjectMapper
+import com.medTech.Douglas.api.dto.adverseevent.CreateAdverseEventRequest
+import com.medTech.Douglas.api.dto.bulk.BulkImportRecord
+import com.medTech.Douglas.api.dto.bulk.BulkImportResponse
+import com.medTech.Douglas.api.dto.bulk.BulkImportRowResult
+import com.medTech.Douglas.api.dto.bulk.BulkRecordType
+import com.medTech.Douglas.api.dto.indicator.ComplianceIndicatorRequest
+import com.medTech.Douglas.api.dto.indicator.FallRiskRequest
+import com.medTech.Douglas.api.dto.indicator.HandHygieneRequest
+import com.medTech.Douglas.api.dto.indicator.PressureInjuryRiskRequest
+import com.medTech.Douglas.api.dto.notification.CreateNotificationRequest
+import com.medTech.Douglas.config.security.CustomUserDetails
+import com.medTech.Douglas.service.mapper.AdverseEventMapper
+import com.medTech.Douglas.service.mapper.IndicatorMapper
+import com.medTech.Douglas.service.mapper.NotificationMapper
+import com.medTech.Douglas.service.validation.PeriodValidator
+import jakarta.persistence.EntityManager
+import org.springframework.core.NestedExceptionUtils
+import org.springframework.security.core.context.SecurityContextHolder
+import org.springframework.stereotype.Service
+import org.springframework.transaction.support.TransactionTemplate
+import java.io.InputStream
+import java.util.UUID
+
+/**
+ * Imports a stream of mixed records (JSON array or NDJSON).
+ *
+ * Records are read one at a time and written in chunks of [CHUNK_SIZE], each chunk in its
+ * own transaction. Every distinct period is validated once per import. Entities are persisted
+ * directly through the EntityManager: with hibernate.jdbc.batch_size set, the inserts go out
+ * as JDBC batches and the merge-select that repository.save does for assigned ids is skipped.
+ * If a chunk fails (for example on a unique constraint), its rows are retried one by one so
+ * that only the offending rows are reported as failed.
+ */
+@Service
+class BulkImportService(
+    private val objectMapper: ObjectMapper,
+    private val entityManager: EntityManager,
+    private val transactionTemplate: TransactionTemplate,
+    private val periodValidator: PeriodValidator,
+    private val auditLogService: AuditLogService,
+    private val indicatorMapper: IndicatorMapper,
+    private val notificationMapper: NotificationMapper,
+    private val adverseEventMapper: AdverseEventMapper
+) {
+
+    private class PendingRow(
+        val index: Int,
+        val type: BulkRecordType,
+        val periodId: UUID,
+        val id: UUID,
+        val entity: Any,
+        val resource: String,
+        val details: String
+    )
+
+    fun import(input: InputStream): BulkImportResponse {
+        val userId = currentUserId()
+        val results = ArrayList<BulkImportRowResult>()
+        val periodErrors = HashMap<UUID, String?>()
+        val chunk = ArrayList<PendingRow>(CHUNK_SIZE)
+        var index = 0
+
+        // readValues iterates the elements of a root-level array as well as a sequence of
+        // root-level values, so the same loop reads both JSON arrays and NDJSON.
+        val records = objectMapper.readerFor(JsonNode::class.java).readValues<JsonNode>(input)
+        try {
+            while (records.hasNextValue()) {
+                val node = records.nextValue()
+                val rowIndex = index++
+                try {
+                    chunk.add(prepare(rowIndex, node, userId))
+                } catch (e: Exception) {
+                    results.add(BulkImportRowResult(rowIndex, typeOf(node), false, error = errorMessage(e)))
+                }
+
+                if (chunk.size >= CHUNK_SIZE) {
+                    results.addAll(writeChunk(chunk, periodErrors))
+                    chunk.clear()
+                }
+            }
+        } catch (e: JsonProcessingException) {
+            // Malformed JSON cannot be resynchronized; report it and keep what was already read
+            results.add(BulkImportRowResult(index, null, false, error = "Malformed input: ${e.originalMessage}"))
+        } finally {
+            records.close()
+        }
+        results.addAll(writeChunk(chunk, periodErrors))
+
+        results.sortBy { it.index }
+        val created = results.count { it.success }
+        return BulkImportResponse(
+            total = results.size,
+            created = created,
+            failed = results.size - created,
+            results = results
+        )
+    }
+
+    private fun prepare(index: Int, node: JsonNode, userId: UUID?): PendingRow {
+        val record = objectMapper.treeToValue(node, BulkImportRecord::class.java)
+        val data = record.data
+
+        return when (record.type) {
+            BulkRecordType.COMPLIANCE_INDICATOR -> {
+                val entity = indicatorMapper.toDomain(objectMapper.treeToValue(data, ComplianceIndicatorRequest::class.java))
+                PendingRow(index, record.type, entity.periodId, entity.id, entity, "ComplianceIndicator", "Created Compliance Indicator")
+            }
+            BulkRecordType.HAND_HYGIENE -> {
+                val entity = indicatorMapper.toDomain(objectMapper.treeToValue(data, HandHygieneRequest::class.java))
+                PendingRow(index, record.type, entity.periodId, entity.id, entity, "HandHygieneAssessment", "Created Hand Hygiene Assessment")
+            }
+            BulkRecordType.FALL_RISK -> {
+                val entity = indicatorMapper.toDomain(objectMapper.treeToValue(data, FallRiskRequest::class.java))
+                PendingRow(index, record.type, entity.periodId, entity.id, entity, "FallRiskAssessment", "Created Fall Risk Assessment")
+            }
+            BulkRecordType.PRESSURE_INJURY_RISK -> {
+                val entity = indicatorMapper.toDomain(objectMapper.treeToValue(data, PressureInjuryRiskRequest::class.java))
+                PendingRow(index, record.type, entity.periodId, entity.id, entity, "PressureInjuryRiskAssessment", "Created Pressure Injury Risk Assessment")
+            }
+            BulkRecordType.NOTIFICATION -> {
+                val entity = notificationMapper.toDomain(objectMapper.treeToValue(data, CreateNotificationRequest::class.java), userId)
+                PendingRow(index, record.type, entity.periodId, entity.id, entity, "Notification", "Created Notification")
+            }
+            BulkRecordType.ADVERSE_EVENT -> {
+                val entity = adverseEventMapper.toDomain(objectMapper.treeToValue(data, CreateAdverseEventRequest::class.java), userId)
+                PendingRow(index, record.type, entity.periodId, entity.id, entity, "AdverseEvent", "Created Adverse Event")
+            }
+        }
+    }
+
+    private fun writeChunk(chunk: List<PendingRow>, periodErrors: MutableMap<UUID, String?>): List<BulkImportRowResult> {
+        if (chunk.isEmpty()) return emptyList()
+
+        val unchecked = chunk.map { it.periodId }.distinct().filterNot { periodErrors.containsKey(it) }
+        if (unchecked.isNotEmpty()) {
+            val invalid = periodValidator.findPeriodsNotOpen(unchecked)
+            unchecked.forEach { periodErrors[it] = invalid[it] }
+        }
+
+        val results = ArrayList<BulkImportRowResult>(chunk.size)
+        val (valid, rejected) = chunk.partition { periodErrors[it.periodId] == null }
+        rejected.forEach { results.add(BulkImportRowResult(it.index, it.type, false, error = periodErrors[it.periodId])) }
+
+        val written = try {
+            persist(valid)
+            valid
+        } catch (e: Exception) {
+            valid.filter { row ->
+                try {
+                    persist(listOf(row))
+                    true
+                } catch (rowError: Exception) {
+                    results.add(BulkImportRowResult(row.index, row.type, false, error = errorMessage(rowError)))
+                    false
+                }
+            }
+        }
+
+        written.forEach {
+            auditLogService.log("CREATE", it.resource, it.id.toString(), "${it.details} (bulk import)")
+            results.add(BulkImportRowResult(it.index, it.type, true, id = it.id))
+        }
+        return results
+    }
+
+    private fun persist(rows: List<PendingRow>) {
+        if (rows.isEmpty()) return
+
+        transactionTemplate.executeWithoutResult {
+            // Holds the periods open until commit; a period closed since the check above fails
+            // the chunk, and the row-by-row retry then reports it on each of its rows
+            periodValidator.lockOpenPeriods(rows.map { it.periodId })
+            rows.forEach { entityManager.persist(it.entity) }
+            entityManager.flush()
+            entityManager.clear()
+        }
+    }
+
+    private fun typeOf(node: JsonNode): BulkRecordType? {
+        val type = node.path("type").asText(null) ?: return null
+        return BulkRecordType.entries.firstOrNull { it.name == type }
+    }
+
+    private fun errorMessage(e: Exception): String {
+        return NestedExceptionUtils.getMostSpecificCause(e).message ?: e.javaClass.simpleName
+    }
+
+    private fun currentUserId(): UUID? {
+        return (SecurityContextHolder.getContext().authentication?.principal as? CustomUserDetails)?.id
+    }
+
+    companion object {
+        const val CHUNK_SIZE = 500
+    }
+}
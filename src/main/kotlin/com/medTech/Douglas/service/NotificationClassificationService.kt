@@ -12,22 +12,22 @@ import java.util.UUID
 
 @Service
 class NotificationClassificationService(
-    private val repository: NotificationClassificationRepository
+    private val repository: NotificationClassificationRepository,
+    private val referenceDataCache: ReferenceDataCache
 ) {
-    @Transactional(readOnly = true)
     fun listAll(): List<ClassificationResponse> {
-        return repository.findAll().map { toResponse(it) }
+        return referenceDataCache.allClassifications()
     }
 
-    @Transactional(readOnly = true)
     fun listActive(): List<ClassificationResponse> {
-        return repository.findAllByActiveTrue().map { toResponse(it) }
+        return referenceDataCache.allClassifications().filter { it.active }
     }
 
     @Transactional
     fun create(request: CreateClassificationRequest): ClassificationResponse {
         val entity = NotificationClassification(name = request.name)
         val saved = repository.save(entity)
+        referenceDataCache.invalidateClassifications()
         return toResponse(saved)
     }
 
@@ -40,6 +40,7 @@ class NotificationClassificationService(
         request.active?.let { entity.active = it }
         
         val saved = repository.save(entity)
+        referenceDataCache.invalidateClassifications()
         return toResponse(saved)
     }
 
@@ -49,6 +50,7 @@ class NotificationClassificationService(
             throw ResourceNotFoundException("Classification not found with id: $id")
         }
         repository.deleteById(id)
+        referenceDataCache.invalidateClassifications()
     }
 
     private fun toResponse(entity: NotificationClassification) = ClassificationResponse(
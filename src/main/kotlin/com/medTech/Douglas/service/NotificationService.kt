@@ -1,15 +1,22 @@
 package com.medTech.Douglas.service
 
 import com.medTech.Douglas.api.dto.notification.CreateNotificationRequest
+import com.medTech.Douglas.api.dto.PageResponse
 import com.medTech.Douglas.api.dto.notification.NotificationResponse
+import com.medTech.Douglas.api.dto.notification.NotificationSummaryResponse
 import com.medTech.Douglas.api.dto.notification.UpdateNotificationRequest
 import com.medTech.Douglas.exception.ResourceNotFoundException
-import com.medTech.Douglas.repository.NotificationClassificationRepository
+import com.medTech.Douglas.exception.ValidationException
+import com.medTech.Douglas.repository.NotificationCategoryRollupRepository
 import com.medTech.Douglas.repository.NotificationRepository
-import com.medTech.Douglas.repository.ProfessionalCategoryRepository
 import com.medTech.Douglas.repository.UserRepository
 import com.medTech.Douglas.service.mapper.NotificationMapper
 import com.medTech.Douglas.service.validation.PeriodValidator
+import org.springframework.data.domain.Page
+import org.springframework.data.domain.PageRequest
+import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.data.domain.Sort
 import org.springframework.security.core.context.SecurityContextHolder
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
@@ -18,9 +25,8 @@ import java.util.UUID
 @Service
 class NotificationService(
     private val repository: NotificationRepository,
+    private val rankingRollupRepository: NotificationCategoryRollupRepository,
     private val userRepository: UserRepository,
-    private val classificationRepository: NotificationClassificationRepository,
-    private val professionalCategoryRepository: ProfessionalCategoryRepository,
     private val periodValidator: PeriodValidator,
     private val auditLogService: AuditLogService,
     private val mapper: NotificationMapper
@@ -51,6 +57,64 @@ class NotificationService(
         return notifications.map { mapper.toResponse(it) }
     }
 
+    @Transactional(readOnly = true)
+    fun pageByPeriod(
+        periodId: UUID,
+        classificationId: UUID?,
+        page: Int,
+        size: Int,
+        sort: String,
+        direction: String,
+        includeTotal: Boolean
+    ): PageResponse<NotificationSummaryResponse> {
+        val pageable = pageable(page, size, sort, direction)
+        return if (includeTotal) {
+            toPageResponse(repository.pageSummariesByPeriod(periodId, classificationId, pageable))
+        } else {
+            toPageResponse(repository.sliceSummariesByPeriod(periodId, classificationId, pageable))
+        }
+    }
+
+    @Transactional(readOnly = true)
+    fun pageBySector(
+        sectorId: UUID,
+        page: Int,
+        size: Int,
+        sort: String,
+        direction: String,
+        includeTotal: Boolean
+    ): PageResponse<NotificationSummaryResponse> {
+        val pageable = pageable(page, size, sort, direction)
+        return if (includeTotal) {
+            toPageResponse(repository.pageSummariesBySector(sectorId, pageable))
+        } else {
+            toPageResponse(repository.sliceSummariesBySector(sectorId, pageable))
+        }
+    }
+
+    private fun pageable(page: Int, size: Int, sort: String, direction: String): Pageable {
+        val property = SORT_PROPERTIES[sort]
+            ?: throw ValidationException("Invalid sort: $sort. Allowed: ${SORT_PROPERTIES.keys.joinToString()}")
+        val dir = Sort.Direction.fromOptionalString(direction)
+            .orElseThrow { ValidationException("Invalid direction: $direction") }
+
+        // id as tie-breaker keeps pages stable when the sort key has duplicates
+        val order = Sort.by(dir, property).and(Sort.by(dir, "id"))
+        return PageRequest.of(page.coerceAtLeast(0), size.coerceIn(1, MAX_PAGE_SIZE), order)
+    }
+
+    private fun <T> toPageResponse(slice: Slice<T>): PageResponse<T> {
+        val page = slice as? Page<T>
+        return PageResponse(
+            items = slice.content,
+            page = slice.number,
+            size = slice.size,
+            hasNext = slice.hasNext(),
+            totalElements = page?.totalElements,
+            totalPages = page?.totalPages
+        )
+    }
+
     @Transactional
     fun update(id: UUID, request: UpdateNotificationRequest): NotificationResponse {
         val notification = repository.findById(id)
@@ -58,15 +122,8 @@ class NotificationService(
 
         periodValidator.validatePeriodIsOpen(notification.periodId)
 
-        val classification = request.classificationId?.let {
-            classificationRepository.findById(it)
-                .orElseThrow { ResourceNotFoundException("Classification not found") }
-        }
-        
-        val professionalCategory = request.professionalCategoryId?.let {
-            professionalCategoryRepository.findById(it)
-                .orElseThrow { ResourceNotFoundException("Professional Category not found") }
-        }
+        val classification = request.classificationId?.let { mapper.classificationReference(it) }
+        val professionalCategory = request.professionalCategoryId?.let { mapper.professionalCategoryReference(it) }
 
         notification.classification = classification
         notification.classificationText = request.classificationText
@@ -106,8 +163,30 @@ class NotificationService(
         return mapper.toResponse(notification)
     }
 
+    // Reads the per period/sector/category rollup that triggers on notifications keep current,
+    // so create, update and delete (including bulk imports) need no extra work here.
     @Transactional(readOnly = true)
     fun getProfessionalCategoryRanking(periodId: UUID?, sectorId: UUID?): List<com.medTech.Douglas.api.dto.notification.ProfessionalCategoryRankingResponse> {
-        return repository.getProfessionalCategoryRanking(periodId, sectorId)
+        return rankingRollupRepository.getProfessionalCategoryRanking(periodId, sectorId)
+    }
+
+    @Transactional
+    fun rebuildProfessionalCategoryRanking(): Long {
+        val rows = rankingRollupRepository.rebuild()
+
+        auditLogService.log("REBUILD", "NotificationCategoryRollup", null, "Rebuilt professional category ranking ($rows rows)")
+
+        return rows
+    }
+
+    companion object {
+        const val MAX_PAGE_SIZE = 200
+
+        private val SORT_PROPERTIES = mapOf(
+            "createdAt" to "createdAt",
+            "updatedAt" to "updatedAt",
+            "quantity" to "quantity",
+            "quantityProfessional" to "quantityProfessional"
+        )
     }
 }
@@ -0,0 +1,82 @@
+package com.medTech.Douglas.service
+
+import com.medTech.Douglas.domain.enums.PeriodStatus
+import com.medTech.Douglas.repository.PeriodRepository
+import com.medTech.Douglas.service.usecase.report.PanelReportBatchLoader
+import org.slf4j.LoggerFactory
+import org.springframework.boot.CommandLineRunner
+import org.springframework.core.Ordered
+import org.springframework.core.annotation.Order
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionTemplate
+import java.util.UUID
+
+/**
+ * Writes the panel snapshots missing for closed and validated periods: those closed before
+ * snapshots existed (V17) and those inserted as CLOSED without going through
+ * PeriodService.close, such as the synthetic data.
+ *
+ * Runs at startup, before the synthetic data generator, which calls it again once its rows are
+ * in. Each sector is handled in its own transaction with its periods locked and re-checked, so
+ * it cannot race a reopen or another instance backfilling the same periods.
+ */
+@Component
+@Order(Ordered.LOWEST_PRECEDENCE - 1)
+class PanelReportSnapshotBackfill(
+    private val periodRepository: PeriodRepository,
+    private val snapshotService: PanelReportSnapshotService,
+    private val batchLoader: PanelReportBatchLoader,
+    private val transactionTemplate: TransactionTemplate,
+    private val jdbcTemplate: JdbcTemplate
+) : CommandLineRunner {
+
+    private val logger = LoggerFactory.getLogger(PanelReportSnapshotBackfill::class.java)
+
+    override fun run(vararg args: String?) {
+        backfill()
+    }
+
+    fun backfill(): Int {
+        val missing = jdbcTemplate.query(MISSING_SQL) { rs, _ ->
+            rs.getObject("sector_id", UUID::class.java) to rs.getObject("id", UUID::class.java)
+        }.groupBy({ it.first }, { it.second })
+        if (missing.isEmpty()) return 0
+
+        val started = System.currentTimeMillis()
+        var written = 0
+        missing.forEach { (sectorId, periodIds) ->
+            try {
+                written += transactionTemplate.execute { backfillSector(sectorId, periodIds) } ?: 0
+            } catch (e: Exception) {
+                logger.error("Panel snapshot backfill failed for sector {}", sectorId, e)
+            }
+        }
+        logger.info(
+            "Backfilled {} panel snapshots of closed periods in {} ms",
+            written, System.currentTimeMillis() - started
+        )
+        return written
+    }
+
+    private fun backfillSector(sectorId: UUID, periodIds: List<UUID>): Int {
+        val closed = periodRepository.findAllForUpdate(periodIds)
+            .filter { it.status != PeriodStatus.OPEN }
+            .map { it.id }
+        val pending = snapshotService.findMissing(closed)
+
+        batchLoader.load(pending, sectorId).forEachIndexed { i, report ->
+            snapshotService.save(pending[i], sectorId, report)
+        }
+        return pending.size
+    }
+
+    companion object {
+        private const val MISSING_SQL = """
+            SELECT p.id, p.sector_id
+            FROM periods p
+            WHERE p.status IN ('CLOSED', 'VALIDATED')
+              AND NOT EXISTS (SELECT 1 FROM panel_report_snapshots s WHERE s.period_id = p.id)
+        """
+    }
+}
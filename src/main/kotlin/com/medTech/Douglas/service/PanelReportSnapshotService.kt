@@ -0,0 +1,61 @@
+package com.medTech.Douglas.service
+
+import com.fasterxml.jackson.databind.ObjectMapper
+import com.fasterxml.jackson.module.kotlin.readValue
+import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
+import com.medTech.Douglas.domain.entity.PanelReportSnapshot
+import com.medTech.Douglas.repository.PanelReportSnapshotRepository
+import org.springframework.stereotype.Service
+import org.springframework.transaction.annotation.Transactional
+import java.time.LocalDateTime
+import java.util.UUID
+
+@Service
+class PanelReportSnapshotService(
+    private val repository: PanelReportSnapshotRepository,
+    private val objectMapper: ObjectMapper
+) {
+
+    @Transactional(readOnly = true)
+    fun find(periodId: UUID, sectorId: UUID): CompletePanelReportResponse? {
+        return repository.findByPeriodIdAndSectorId(periodId, sectorId)?.let { deserialize(it) }
+    }
+
+    @Transactional(readOnly = true)
+    fun findAll(periodIds: Collection<UUID>, sectorId: UUID): Map<UUID, CompletePanelReportResponse> {
+        if (periodIds.isEmpty()) return emptyMap()
+        return repository.findByPeriodIdInAndSectorId(periodIds, sectorId)
+            .associate { it.periodId to deserialize(it) }
+    }
+
+    @Transactional(readOnly = true)
+    fun findMissing(periodIds: Collection<UUID>): List<UUID> {
+        if (periodIds.isEmpty()) return emptyList()
+        val existing = repository.findExistingPeriodIds(periodIds).toSet()
+        return periodIds.filterNot { it in existing }
+    }
+
+    @Transactional
+    fun save(periodId: UUID, sectorId: UUID, report: CompletePanelReportResponse) {
+        val payload = objectMapper.writeValueAsString(report)
+        val snapshot = repository.findById(periodId).orElse(null)
+            ?.also {
+                it.payload = payload
+                it.createdAt = LocalDateTime.now()
+            }
+            ?: PanelReportSnapshot(periodId = periodId, sectorId = sectorId, payload = payload)
+
+        repository.save(snapshot)
+    }
+
+    @Transactional
+    fun delete(periodId: UUID) {
+        if (repository.existsById(periodId)) {
+            repository.deleteById(periodId)
+        }
+    }
+
+    private fun deserialize(snapshot: PanelReportSnapshot): CompletePanelReportResponse {
+        return objectMapper.readValue(snapshot.payload)
+    }
+}
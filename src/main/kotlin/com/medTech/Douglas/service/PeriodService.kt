@@ -7,6 +7,8 @@ import com.medTech.Douglas.exception.BusinessRuleException
 import com.medTech.Douglas.exception.PeriodNotFoundException
 import com.medTech.Douglas.repository.PeriodRepository
 import com.medTech.Douglas.service.mapper.PeriodMapper
+import com.medTech.Douglas.service.usecase.report.GenerateCompletePanelReportUseCase
+import com.medTech.Douglas.service.validation.PeriodStatusCache
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
 import java.util.UUID
@@ -14,7 +16,10 @@ import java.util.UUID
 @Service
 class PeriodService(
     private val repository: PeriodRepository,
-    private val mapper: PeriodMapper
+    private val mapper: PeriodMapper,
+    private val snapshotService: PanelReportSnapshotService,
+    private val generateCompletePanelReportUseCase: GenerateCompletePanelReportUseCase,
+    private val periodStatusCache: PeriodStatusCache
 ) {
 
     @Transactional
@@ -33,23 +38,34 @@ class PeriodService(
 
     @Transactional
     fun close(id: UUID): PeriodResponse {
-        val period = repository.findById(id)
-            .orElseThrow { PeriodNotFoundException("Period with id $id not found") }
+        // Waits for writes that already passed validation (they share-lock the period), so the
+        // snapshot below sees them, and keeps new ones out until the status change commits
+        val period = repository.findByIdForUpdate(id)
+            ?: throw PeriodNotFoundException("Period with id $id not found")
 
         period.close()
         
         val savedPeriod = repository.save(period)
+        periodStatusCache.statusChanged(savedPeriod.id, savedPeriod.status)
+
+        // Data can no longer change, so freeze the monthly panel for the report endpoints
+        val report = generateCompletePanelReportUseCase.execute(savedPeriod.id, savedPeriod.sectorId, useSnapshot = false)
+        snapshotService.save(savedPeriod.id, savedPeriod.sectorId, report)
+
         return mapper.toResponse(savedPeriod)
     }
 
     @Transactional
     fun reopen(id: UUID): PeriodResponse {
-        val period = repository.findById(id)
-            .orElseThrow { PeriodNotFoundException("Period with id $id not found") }
+        val period = repository.findByIdForUpdate(id)
+            ?: throw PeriodNotFoundException("Period with id $id not found")
 
         period.reopen()
         
         val savedPeriod = repository.save(period)
+        periodStatusCache.statusChanged(savedPeriod.id, savedPeriod.status)
+        snapshotService.delete(savedPeriod.id)
+
         return mapper.toResponse(savedPeriod)
     }
 
@@ -12,22 +12,22 @@ import java.util.UUID
 
 @Service
 class ProfessionalCategoryService(
-    private val repository: ProfessionalCategoryRepository
+    private val repository: ProfessionalCategoryRepository,
+    private val referenceDataCache: ReferenceDataCache
 ) {
-    @Transactional(readOnly = true)
     fun listAll(): List<ProfessionalCategoryResponse> {
-        return repository.findAll().map { toResponse(it) }
+        return referenceDataCache.allProfessionalCategories()
     }
 
-    @Transactional(readOnly = true)
     fun listActive(): List<ProfessionalCategoryResponse> {
-        return repository.findAllByActiveTrue().map { toResponse(it) }
+        return referenceDataCache.allProfessionalCategories().filter { it.active }
     }
 
     @Transactional
     fun create(request: CreateProfessionalCategoryRequest): ProfessionalCategoryResponse {
         val entity = ProfessionalCategory(name = request.name)
         val saved = repository.save(entity)
+        referenceDataCache.invalidateProfessionalCategories()
         return toResponse(saved)
     }
 
@@ -40,6 +40,7 @@ class ProfessionalCategoryService(
         request.active?.let { entity.active = it }
         
         val saved = repository.save(entity)
+        referenceDataCache.invalidateProfessionalCategories()
         return toResponse(saved)
     }
 
@@ -49,6 +50,7 @@ class ProfessionalCategoryService(
             throw ResourceNotFoundException("Professional Category not found with id: $id")
         }
         repository.deleteById(id)
+        referenceDataCache.invalidateProfessionalCategories()
     }
 
     private fun toResponse(entity: ProfessionalCategory) = ProfessionalCategoryResponse(
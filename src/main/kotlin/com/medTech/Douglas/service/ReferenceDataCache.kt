@@ -0,0 +1,123 @@
+package com.medTech.Douglas.service
+
+import com.github.benmanes.caffeine.cache.Caffeine
+import com.github.benmanes.caffeine.cache.LoadingCache
+import com.medTech.Douglas.api.dto.classification.ClassificationResponse
+import com.medTech.Douglas.api.dto.professionalcategory.ProfessionalCategoryResponse
+import com.medTech.Douglas.repository.NotificationClassificationRepository
+import com.medTech.Douglas.repository.ProfessionalCategoryRepository
+import io.micrometer.core.instrument.FunctionCounter
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.binder.MeterBinder
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.time.Duration
+import java.util.UUID
+import java.util.concurrent.atomic.AtomicLong
+import java.util.concurrent.atomic.LongAdder
+
+/**
+ * Process-wide dictionaries of notification classifications and professional categories.
+ *
+ * Both tables hold a few dozen rows, so each one is loaded whole and kept as an id -> DTO map.
+ * NotificationClassificationService and ProfessionalCategoryService invalidate their map after
+ * every write; the TTL only bounds how long another instance's writes can go unseen. An unknown
+ * id reloads the map at most once per [MISS_RELOAD_INTERVAL], so a stale id that keeps coming
+ * back does not reach the database on every lookup.
+ *
+ * Id lookups are published as `cache.gets` (result hit or miss) and the number of ids as
+ * `cache.size`, tagged with the dictionary name (see [bindTo]).
+ */
+@Component
+class ReferenceDataCache(
+    private val classificationRepository: NotificationClassificationRepository,
+    private val professionalCategoryRepository: ProfessionalCategoryRepository
+) : MeterBinder {
+
+    private class Dictionary<T>(val name: String, loader: () -> Map<UUID, T>) {
+        val cache: LoadingCache<String, Map<UUID, T>> = Caffeine.newBuilder()
+            .expireAfterWrite(TTL)
+            .build { loader() }
+
+        val hits = LongAdder()
+        val misses = LongAdder()
+
+        // System.nanoTime() before which an unknown id does not trigger another reload
+        private val nextMissReload = AtomicLong(System.nanoTime())
+
+        fun all(): Map<UUID, T> = cache.get(KEY)
+
+        fun lookup(id: UUID): T? {
+            val found = all()[id] ?: reloadFor(id)
+            if (found != null) hits.increment() else misses.increment()
+            return found
+        }
+
+        // The row may have been created by another instance. Only the caller that wins the
+        // slot reloads; the others answer from the current map.
+        private fun reloadFor(id: UUID): T? {
+            val now = System.nanoTime()
+            val next = nextMissReload.get()
+            if (now - next < 0 || !nextMissReload.compareAndSet(next, now + MISS_RELOAD_INTERVAL.toNanos())) {
+                return null
+            }
+            cache.refresh(KEY).join()
+            return all()[id]
+        }
+    }
+
+    private val classifications = Dictionary("referenceData.classifications") {
+        classificationRepository.findAll().associate { it.id to ClassificationResponse(it.id, it.name, it.active) }
+    }
+
+    private val professionalCategories = Dictionary("referenceData.professionalCategories") {
+        professionalCategoryRepository.findAll().associate { it.id to ProfessionalCategoryResponse(it.id, it.name, it.active) }
+    }
+
+    fun allClassifications(): List<ClassificationResponse> = classifications.all().values.toList()
+
+    fun allProfessionalCategories(): List<ProfessionalCategoryResponse> = professionalCategories.all().values.toList()
+
+    fun classification(id: UUID): ClassificationResponse? = classifications.lookup(id)
+
+    fun professionalCategory(id: UUID): ProfessionalCategoryResponse? = professionalCategories.lookup(id)
+
+    fun invalidateClassifications() = invalidate(classifications.cache)
+
+    fun invalidateProfessionalCategories() = invalidate(professionalCategories.cache)
+
+    override fun bindTo(registry: MeterRegistry) {
+        listOf(classifications, professionalCategories).forEach { dictionary ->
+            FunctionCounter.builder("cache.gets", dictionary.hits) { it.sum().toDouble() }
+                .tags("cache", dictionary.name, "result", "hit")
+                .register(registry)
+            FunctionCounter.builder("cache.gets", dictionary.misses) { it.sum().toDouble() }
+                .tags("cache", dictionary.name, "result", "miss")
+                .register(registry)
+            Gauge.builder("cache.size", dictionary) { (it.cache.getIfPresent(KEY)?.size ?: 0).toDouble() }
+                .tag("cache", dictionary.name)
+                .register(registry)
+        }
+    }
+
+    private fun invalidate(cache: LoadingCache<String, *>) {
+        cache.invalidateAll()
+
+        // A read between our write and its commit would cache the old rows again
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+                override fun afterCommit() {
+                    cache.invalidateAll()
+                }
+            })
+        }
+    }
+
+    companion object {
+        private const val KEY = "all"
+        private val TTL: Duration = Duration.ofMinutes(10)
+        private val MISS_RELOAD_INTERVAL: Duration = Duration.ofSeconds(5)
+    }
+}
@@ -0,0 +1,37 @@
+package com.medTech.Douglas.service
+
+import com.medTech.Douglas.config.SyncProperties
+import org.slf4j.LoggerFactory
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.scheduling.annotation.Scheduled
+import org.springframework.stereotype.Component
+import java.time.LocalDateTime
+
+/**
+ * Deletes sync tombstones older than [SyncProperties.tombstoneRetentionDays]. Clients whose
+ * watermark is older than that are told to reload everything, so they never miss the purged ones.
+ */
+@Component
+class SyncTombstonePurger(
+    private val jdbcTemplate: JdbcTemplate,
+    private val properties: SyncProperties
+) {
+
+    private val logger = LoggerFactory.getLogger(SyncTombstonePurger::class.java)
+
+    @Scheduled(
+        initialDelayString = "\${sync.purge-interval-ms:3600000}",
+        fixedDelayString = "\${sync.purge-interval-ms:3600000}"
+    )
+    fun purge() {
+        try {
+            val cutoff = LocalDateTime.now().minusDays(properties.tombstoneRetentionDays)
+            val deleted = jdbcTemplate.update("DELETE FROM sync_tombstones WHERE deleted_at < ?", cutoff)
+            if (deleted > 0) {
+                logger.info("Purged {} sync tombstones older than {}", deleted, cutoff)
+            }
+        } catch (e: Exception) {
+            logger.error("Sync tombstone purge failed", e)
+        }
+    }
+}
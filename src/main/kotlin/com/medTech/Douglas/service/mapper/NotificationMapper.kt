@@ -5,27 +5,25 @@ import com.medTech.Douglas.api.dto.notification.CreateNotificationRequest
 import com.medTech.Douglas.api.dto.notification.NotificationResponse
 import com.medTech.Douglas.api.dto.professionalcategory.ProfessionalCategoryResponse
 import com.medTech.Douglas.domain.entity.Notification
+import com.medTech.Douglas.domain.entity.NotificationClassification
+import com.medTech.Douglas.domain.entity.ProfessionalCategory
 import com.medTech.Douglas.repository.NotificationClassificationRepository
 import com.medTech.Douglas.repository.ProfessionalCategoryRepository
 import com.medTech.Douglas.exception.ResourceNotFoundException
+import com.medTech.Douglas.service.ReferenceDataCache
+import org.hibernate.Hibernate
 import org.springframework.stereotype.Component
 import java.util.UUID
 
 @Component
 class NotificationMapper(
     private val classificationRepository: NotificationClassificationRepository,
-    private val professionalCategoryRepository: ProfessionalCategoryRepository
+    private val professionalCategoryRepository: ProfessionalCategoryRepository,
+    private val referenceDataCache: ReferenceDataCache
 ) {
     fun toDomain(request: CreateNotificationRequest, userId: UUID? = null): Notification {
-        val classification = request.classificationId?.let {
-            classificationRepository.findById(it)
-                .orElseThrow { ResourceNotFoundException("Classification not found") }
-        }
-        
-        val professionalCategory = request.professionalCategoryId?.let {
-            professionalCategoryRepository.findById(it)
-                .orElseThrow { ResourceNotFoundException("Professional Category not found") }
-        }
+        val classification = request.classificationId?.let { classificationReference(it) }
+        val professionalCategory = request.professionalCategoryId?.let { professionalCategoryReference(it) }
 
         return Notification(
             periodId = request.periodId,
@@ -48,10 +46,10 @@ class NotificationMapper(
             id = domain.id,
             periodId = domain.periodId,
             sectorId = domain.sectorId,
-            classification = domain.classification?.let { ClassificationResponse(it.id, it.name, it.active) },
+            classification = domain.classification?.let { classificationResponse(it) },
             classificationText = domain.classificationText,
             description = domain.description,
-            professionalCategory = domain.professionalCategory?.let { ProfessionalCategoryResponse(it.id, it.name, it.active) },
+            professionalCategory = domain.professionalCategory?.let { professionalCategoryResponse(it) },
             professionalCategoryText = domain.professionalCategoryText,
             quantityClassification = domain.quantityClassification,
             quantityCategory = domain.quantityCategory,
@@ -61,4 +59,32 @@ class NotificationMapper(
             createdAt = domain.createdAt
         )
     }
+
+    // Existence is checked against the reference-data cache; the association itself is an
+    // uninitialized proxy, which is all Hibernate needs to write the foreign key.
+    fun classificationReference(id: UUID): NotificationClassification {
+        referenceDataCache.classification(id) ?: throw ResourceNotFoundException("Classification not found")
+        return classificationRepository.getReferenceById(id)
+    }
+
+    fun professionalCategoryReference(id: UUID): ProfessionalCategory {
+        referenceDataCache.professionalCategory(id) ?: throw ResourceNotFoundException("Professional Category not found")
+        return professionalCategoryRepository.getReferenceById(id)
+    }
+
+    // Reading the id of a proxy does not initialize it, so names come from the cache without a
+    // select. Fetch-joined associations are used as-is.
+    private fun classificationResponse(classification: NotificationClassification): ClassificationResponse? {
+        if (Hibernate.isInitialized(classification)) {
+            return ClassificationResponse(classification.id, classification.name, classification.active)
+        }
+        return referenceDataCache.classification(classification.id)
+    }
+
+    private fun professionalCategoryResponse(category: ProfessionalCategory): ProfessionalCategoryResponse? {
+        if (Hibernate.isInitialized(category)) {
+            return ProfessionalCategoryResponse(category.id, category.name, category.active)
+        }
+        return referenceDataCache.professionalCategory(category.id)
+    }
 }
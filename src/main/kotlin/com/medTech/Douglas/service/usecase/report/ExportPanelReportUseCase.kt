@@ -0,0 +1,183 @@
+package com.medTech.Douglas.service.usecase.report
+
+import com.medTech.Douglas.domain.enums.ExportFormat
+import com.medTech.Douglas.exception.ValidationException
+import io.micrometer.core.annotation.Timed
+import org.apache.poi.xssf.streaming.SXSSFWorkbook
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.RowCallbackHandler
+import org.springframework.jdbc.core.namedparam.MapSqlParameterSource
+import org.springframework.jdbc.core.namedparam.NamedParameterJdbcTemplate
+import org.springframework.stereotype.Component
+import org.springframework.transaction.annotation.Transactional
+import java.io.BufferedWriter
+import java.io.OutputStream
+import java.io.OutputStreamWriter
+import java.nio.charset.StandardCharsets
+import java.sql.ResultSet
+import java.time.LocalDate
+import java.util.UUID
+import javax.sql.DataSource
+
+/**
+ * Exports the monthly panel of one or more sectors as one row per period.
+ *
+ * Rows are read through a forward-only cursor (fetch size inside a read-only transaction,
+ * which is what makes the PostgreSQL driver stream) and written to the output as they
+ * arrive. CSV is written line by line; XLSX uses POI's SXSSF workbook, which keeps only a
+ * small window of rows in memory and flushes the rest to a temporary file.
+ */
+@Component
+class ExportPanelReportUseCase(
+    dataSource: DataSource
+) {
+
+    private val jdbcTemplate = NamedParameterJdbcTemplate(JdbcTemplate(dataSource).apply { fetchSize = FETCH_SIZE })
+
+    private interface RowWriter {
+        fun header(columns: List<String>)
+        fun row(values: List<Any?>)
+        fun finish()
+    }
+
+    @Timed(value = "report.generation", extraTags = ["report", "export"], histogram = true)
+    @Transactional(readOnly = true)
+    fun execute(sectorIds: List<UUID>, startDate: LocalDate, endDate: LocalDate, format: ExportFormat, out: OutputStream) {
+        if (sectorIds.isEmpty()) {
+            throw ValidationException("At least one sector must be informed")
+        }
+        if (startDate.isAfter(endDate)) {
+            throw ValidationException("Start date must be before end date")
+        }
+
+        val params = MapSqlParameterSource()
+            .addValue("sectorIds", sectorIds)
+            .addValue("startKey", startDate.year * 12 + startDate.monthValue)
+            .addValue("endKey", endDate.year * 12 + endDate.monthValue)
+
+        val writer = when (format) {
+            ExportFormat.CSV -> CsvRowWriter(out)
+            ExportFormat.XLSX -> XlsxRowWriter(out)
+        }
+
+        writer.header(COLUMNS)
+        jdbcTemplate.query(EXPORT_SQL, params, RowCallbackHandler { rs: ResultSet ->
+            writer.row(COLUMNS.map { rs.getObject(it) })
+        })
+        writer.finish()
+    }
+
+    private class CsvRowWriter(out: OutputStream) : RowWriter {
+        private val writer = BufferedWriter(OutputStreamWriter(out, StandardCharsets.UTF_8))
+
+        override fun header(columns: List<String>) {
+            // BOM so spreadsheet apps detect UTF-8 (sector names have accents)
+            writer.write("\uFEFF")
+            row(columns)
+        }
+
+        override fun row(values: List<Any?>) {
+            writer.write(values.joinToString(",") { escape(it) })
+            writer.write("\r\n")
+        }
+
+        override fun finish() {
+            writer.flush()
+        }
+
+        private fun escape(value: Any?): String {
+            val text = value?.toString() ?: return ""
+            if (text.none { it == ',' || it == '"' || it == '\n' || it == '\r' }) return text
+            return "\"" + text.replace("\"", "\"\"") + "\""
+        }
+    }
+
+    private class XlsxRowWriter(private val out: OutputStream) : RowWriter {
+        private val workbook = SXSSFWorkbook(XLSX_ROW_WINDOW).apply { setCompressTempFiles(true) }
+        private val sheet = workbook.createSheet("Painel")
+        private var rowIndex = 0
+
+        override fun header(columns: List<String>) {
+            row(columns)
+        }
+
+        override fun row(values: List<Any?>) {
+            val row = sheet.createRow(rowIndex++)
+            values.forEachIndexed { i, value ->
+                when (value) {
+                    null -> Unit
+                    is Number -> row.createCell(i).setCellValue(value.toDouble())
+                    else -> row.createCell(i).setCellValue(value.toString())
+                }
+            }
+        }
+
+        override fun finish() {
+            try {
+                workbook.write(out)
+                out.flush()
+            } finally {
+                workbook.dispose()
+                workbook.close()
+            }
+        }
+    }
+
+    companion object {
+        private const val FETCH_SIZE = 500
+        private const val XLSX_ROW_WINDOW = 100
+
+        private val COLUMNS = listOf(
+            "sector_name", "sector_code", "year", "month", "status",
+            "complete_wristband", "patient_communication", "medication_identified",
+            "hand_hygiene_adherence", "fall_risk_assessment", "pressure_injury_risk_assessment",
+            "hand_hygiene_percentage",
+            "fall_risk_total_patients", "fall_risk_assessed_on_admission", "fall_risk_high",
+            "fall_risk_medium", "fall_risk_low", "fall_risk_not_assessed",
+            "pressure_injury_total_patients", "pressure_injury_assessed_on_admission", "pressure_injury_very_high",
+            "pressure_injury_high", "pressure_injury_medium", "pressure_injury_low", "pressure_injury_not_assessed",
+            "self_notification_quantity", "self_notification_percentage",
+            "meta_goal_value", "meta_percentage", "medication_percentage",
+            "adverse_event_cases", "adverse_event_notifications", "notification_quantity"
+        )
+
+        // One row per period: every indicator table holds at most one row per period_id
+        // (UNIQUE), while adverse events and notifications are summed per period.
+        private const val EXPORT_SQL = """
+            SELECT s.name AS sector_name, s.code AS sector_code, p.year, p.month, p.status,
+                   ci.complete_wristband, ci.patient_communication, ci.medication_identified,
+                   ci.hand_hygiene_adherence, ci.fall_risk_assessment, ci.pressure_injury_risk_assessment,
+                   hh.compliance_percentage AS hand_hygiene_percentage,
+                   fr.total_patients AS fall_risk_total_patients,
+                   fr.assessed_on_admission AS fall_risk_assessed_on_admission,
+                   fr.high_risk AS fall_risk_high, fr.medium_risk AS fall_risk_medium,
+                   fr.low_risk AS fall_risk_low, fr.not_assessed AS fall_risk_not_assessed,
+                   pir.total_patients AS pressure_injury_total_patients,
+                   pir.assessed_on_admission AS pressure_injury_assessed_on_admission,
+                   pir.very_high AS pressure_injury_very_high, pir.high_risk AS pressure_injury_high,
+                   pir.medium_risk AS pressure_injury_medium, pir.low_risk AS pressure_injury_low,
+                   pir.not_assessed AS pressure_injury_not_assessed,
+                   sn.quantity AS self_notification_quantity, sn.percentage AS self_notification_percentage,
+                   mc.goal_value AS meta_goal_value, mc.percentage AS meta_percentage,
+                   md.percentage AS medication_percentage,
+                   ae.cases AS adverse_event_cases, ae.notifications AS adverse_event_notifications,
+                   nt.quantity AS notification_quantity
+            FROM periods p
+            JOIN sectors s ON s.id = p.sector_id
+            LEFT JOIN compliance_indicators ci ON ci.period_id = p.id
+            LEFT JOIN hand_hygiene_assessments hh ON hh.period_id = p.id
+            LEFT JOIN fall_risk_assessments fr ON fr.period_id = p.id
+            LEFT JOIN pressure_injury_risk_assessments pir ON pir.period_id = p.id
+            LEFT JOIN self_notifications sn ON sn.period_id = p.id
+            LEFT JOIN meta_compliance mc ON mc.period_id = p.id
+            LEFT JOIN medication_compliance md ON md.period_id = p.id
+            LEFT JOIN LATERAL (SELECT SUM(quantity_cases) AS cases, SUM(quantity_notifications) AS notifications
+                               FROM adverse_events WHERE period_id = p.id AND sector_id = p.sector_id) ae ON TRUE
+            LEFT JOIN LATERAL (SELECT SUM(quantity) AS quantity
+                               FROM notifications WHERE period_id = p.id AND sector_id = p.sector_id) nt ON TRUE
+            WHERE p.sector_id IN (:sectorIds)
+              AND (p.year * 12 + p.month) BETWEEN :startKey AND :endKey
+            ORDER BY s.name, p.year, p.month
+        """
+    }
+}
@@ -2,11 +2,13 @@ package com.medTech.Douglas.service.usecase.report
 
 import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
 import com.medTech.Douglas.repository.*
+import com.medTech.Douglas.service.PanelReportSnapshotService
 import com.medTech.Douglas.service.mapper.AdverseEventMapper
 import com.medTech.Douglas.service.mapper.IndicatorMapper
 import com.medTech.Douglas.service.mapper.NewComplianceMapper
 import com.medTech.Douglas.service.mapper.NotificationMapper
 import com.medTech.Douglas.service.mapper.SelfNotificationMapper
+import io.micrometer.core.annotation.Timed
 import org.springframework.stereotype.Component
 import org.springframework.transaction.annotation.Transactional
 import java.time.LocalDate
@@ -28,16 +30,24 @@ class GenerateCompletePanelReportUseCase(
     private val adverseEventMapper: AdverseEventMapper,
     private val notificationMapper: NotificationMapper,
     private val selfNotificationMapper: SelfNotificationMapper,
-    private val newComplianceMapper: NewComplianceMapper
+    private val newComplianceMapper: NewComplianceMapper,
+    private val snapshotService: PanelReportSnapshotService
 ) {
 
+    @Timed(value = "report.generation", extraTags = ["report", "complete"], histogram = true)
     @Transactional(readOnly = true)
     fun execute(
         periodId: UUID, 
         sectorId: UUID, 
         startDate: LocalDate? = null, 
-        endDate: LocalDate? = null
+        endDate: LocalDate? = null,
+        useSnapshot: Boolean = true
     ): CompletePanelReportResponse {
+        // Closed periods are frozen: serve the snapshot written by PeriodService.close()
+        if (useSnapshot && startDate == null && endDate == null) {
+            snapshotService.find(periodId, sectorId)?.let { return it }
+        }
+
         val compliance = complianceRepository.findByPeriodId(periodId)
             ?.let { indicatorMapper.toResponse(it) }
 
@@ -1,25 +1,35 @@
 package com.medTech.Douglas.service.usecase.report
 
-import com.medTech.Douglas.api.dto.adverseevent.AdverseEventResponse
-import com.medTech.Douglas.api.dto.compliance.MedicationComplianceResponse
-import com.medTech.Douglas.api.dto.compliance.MetaComplianceResponse
-import com.medTech.Douglas.api.dto.indicator.*
-import com.medTech.Douglas.api.dto.notification.NotificationResponse
-import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
+import com.medTech.Douglas.api.dto.report.*
 import com.medTech.Douglas.domain.enums.ReportPeriodicity
+import com.medTech.Douglas.repository.*
+import com.medTech.Douglas.service.mapper.AdverseEventMapper
+import com.medTech.Douglas.service.mapper.NotificationMapper
+import io.micrometer.core.annotation.Timed
 import org.springframework.stereotype.Component
-import java.math.BigDecimal
-import java.math.RoundingMode
+import org.springframework.transaction.annotation.Transactional
 import java.time.LocalDate
 import java.util.UUID
 
-import com.medTech.Douglas.api.dto.selfnotification.SelfNotificationResponse
-
 @Component
 class GenerateCumulativePanelReportUseCase(
-    private val generatePanelReportByRangeUseCase: GeneratePanelReportByRangeUseCase
+    private val complianceRepository: ComplianceIndicatorRepository,
+    private val handHygieneRepository: HandHygieneAssessmentRepository,
+    private val fallRiskRepository: FallRiskAssessmentRepository,
+    private val pressureInjuryRepository: PressureInjuryRiskAssessmentRepository,
+    private val selfNotificationRepository: SelfNotificationRepository,
+    private val metaRepository: MetaComplianceRepository,
+    private val medicationRepository: MedicationComplianceRepository,
+    private val adverseEventRepository: AdverseEventRepository,
+    private val notificationRepository: NotificationRepository,
+    private val userRepository: UserRepository,
+    private val adverseEventMapper: AdverseEventMapper,
+    private val notificationMapper: NotificationMapper,
+    private val totalsAssembler: PanelTotalsAssembler
 ) {
 
+    @Timed(value = "report.generation", extraTags = ["report", "cumulative"], histogram = true)
+    @Transactional(readOnly = true)
     fun execute(
         sectorId: UUID,
         periodicity: ReportPeriodicity,
@@ -28,15 +38,27 @@ class GenerateCumulativePanelReportUseCase(
         customStartDate: LocalDate?,
         customEndDate: LocalDate?
     ): CompletePanelReportResponse {
+        return executeForSectors(listOf(sectorId), periodicity, year, period, customStartDate, customEndDate)
+            .getValue(sectorId)
+    }
 
-        val (startDate, endDate) = calculateDateRange(periodicity, year, period, customStartDate, customEndDate)
-        val reports = generatePanelReportByRangeUseCase.execute(sectorId, startDate, endDate)
-
-        if (reports.isEmpty()) {
-            return createEmptyReport()
-        }
+    /**
+     * Same report for several sectors. Every table is read once for all sectors and the
+     * rows are then split per sector. Returns one report per sector id, in the order given.
+     */
+    @Transactional(readOnly = true)
+    fun executeForSectors(
+        sectorIds: List<UUID>,
+        periodicity: ReportPeriodicity,
+        year: Int?,
+        period: Int?,
+        customStartDate: LocalDate?,
+        customEndDate: LocalDate?
+    ): Map<UUID, CompletePanelReportResponse> {
+        if (sectorIds.isEmpty()) return emptyMap()
 
-        return aggregateReports(reports)
+        val (startDate, endDate) = calculateDateRange(periodicity, year, period, customStartDate, customEndDate)
+        return aggregateRange(sectorIds.distinct(), periodKey(startDate), periodKey(endDate))
     }
 
     private fun calculateDateRange(
@@ -83,203 +105,41 @@ class GenerateCumulativePanelReportUseCase(
         }
     }
 
-    private fun aggregateReports(reports: List<CompletePanelReportResponse>): CompletePanelReportResponse {
-        val compliance = aggregateCompliance(reports.mapNotNull { it.complianceIndicator })
-        val handHygiene = aggregateHandHygiene(reports.mapNotNull { it.handHygieneAssessment })
-        val fallRisk = aggregateFallRisk(reports.mapNotNull { it.fallRiskAssessment })
-        val pressureInjury = aggregatePressureInjury(reports.mapNotNull { it.pressureInjuryRiskAssessment })
-        val selfNotification = aggregateSelfNotification(reports.mapNotNull { it.selfNotification })
-        val metaCompliance = aggregateMetaCompliance(reports.mapNotNull { it.metaCompliance })
-        val medicationCompliance = aggregateMedicationCompliance(reports.mapNotNull { it.medicationCompliance })
-        val adverseEvents = reports.flatMap { it.adverseEvents }.sortedByDescending { it.eventDate }
-        val notifications = reports.flatMap { it.notifications }.sortedByDescending { it.createdAt } // Sort by creation date as notificationDate is removed
-
-        return CompletePanelReportResponse(
-            complianceIndicator = compliance,
-            handHygieneAssessment = handHygiene,
-            fallRiskAssessment = fallRisk,
-            pressureInjuryRiskAssessment = pressureInjury,
-            selfNotification = selfNotification,
-            metaCompliance = metaCompliance,
-            medicationCompliance = medicationCompliance,
-            adverseEvents = adverseEvents,
-            notifications = notifications
-        )
-    }
-
-    private fun aggregateMetaCompliance(indicators: List<MetaComplianceResponse>): MetaComplianceResponse? {
-        if (indicators.isEmpty()) return null
-        
-        // Average goal and percentage
-        val avgGoal = indicators.map { it.goalValue }.reduce { acc, dec -> acc.add(dec) }
-            .divide(BigDecimal(indicators.size), 2, RoundingMode.HALF_UP)
-            
-        val avgPercentage = indicators.map { it.percentage }.reduce { acc, dec -> acc.add(dec) }
-            .divide(BigDecimal(indicators.size), 2, RoundingMode.HALF_UP)
-
-        return MetaComplianceResponse(
-            id = UUID.randomUUID(),
-            periodId = UUID.randomUUID(),
-            sectorId = indicators.first().sectorId,
-            goalValue = avgGoal,
-            percentage = avgPercentage,
-            createdBy = null
-        )
-    }
-
-    private fun aggregateMedicationCompliance(indicators: List<MedicationComplianceResponse>): MedicationComplianceResponse? {
-        if (indicators.isEmpty()) return null
-        
-        // Average percentage
-        val avgPercentage = indicators.map { it.percentage }.reduce { acc, dec -> acc.add(dec) }
-            .divide(BigDecimal(indicators.size), 2, RoundingMode.HALF_UP)
-
-        return MedicationComplianceResponse(
-            id = UUID.randomUUID(),
-            periodId = UUID.randomUUID(),
-            sectorId = indicators.first().sectorId,
-            percentage = avgPercentage,
-            createdBy = null
-        )
-    }
-
-    private fun aggregateSelfNotification(indicators: List<SelfNotificationResponse>): SelfNotificationResponse? {
-        if (indicators.isEmpty()) return null
-
-        val totalQuantity = indicators.sumOf { it.quantity }
-        
-        // Weighted average for percentage
-        val weightedSum = indicators.fold(BigDecimal.ZERO) { acc, curr ->
-            acc.add(curr.percentage.multiply(BigDecimal(curr.quantity)))
+    // Sums and weighted averages are computed by PostgreSQL (one GROUP BY sector query per indicator table);
+    // only the final division and rounding happen here.
+    private fun aggregateRange(sectorIds: List<UUID>, startKey: Int, endKey: Int): Map<UUID, CompletePanelReportResponse> {
+        val compliance = complianceRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+        val observations = complianceRepository.findObservationsByPeriodRange(sectorIds, startKey, endKey)
+            .groupBy({ it.sectorId }, { it.observations })
+        val handHygiene = handHygieneRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+        val fallRisk = fallRiskRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+        val pressureInjury = pressureInjuryRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+        val selfNotification = selfNotificationRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+        val metaCompliance = metaRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+        val medicationCompliance = medicationRepository.aggregateByPeriodRange(sectorIds, startKey, endKey).associateBy { it.sectorId }
+
+        val adverseEventsDomain = adverseEventRepository.findBySectorIdInAndPeriodRange(sectorIds, startKey, endKey)
+        val aeUserIds = adverseEventsDomain.mapNotNull { it.createdBy }.distinct()
+        val aeUsers = if (aeUserIds.isEmpty()) emptyMap() else userRepository.findAllById(aeUserIds).associateBy { it.id }
+        val adverseEvents = adverseEventsDomain.groupBy { it.sectorId }
+
+        val notifications = notificationRepository.findBySectorIdInAndPeriodRange(sectorIds, startKey, endKey)
+            .groupBy { it.sectorId }
+
+        return sectorIds.associateWith { sectorId ->
+            CompletePanelReportResponse(
+                complianceIndicator = compliance[sectorId]?.let { totalsAssembler.toCompliance(it, observations[sectorId].orEmpty()) },
+                handHygieneAssessment = handHygiene[sectorId]?.let { totalsAssembler.toHandHygiene(it) },
+                fallRiskAssessment = fallRisk[sectorId]?.let { totalsAssembler.toFallRisk(it) },
+                pressureInjuryRiskAssessment = pressureInjury[sectorId]?.let { totalsAssembler.toPressureInjury(it) },
+                selfNotification = selfNotification[sectorId]?.let { totalsAssembler.toSelfNotification(it) },
+                metaCompliance = metaCompliance[sectorId]?.let { totalsAssembler.toMetaCompliance(it) },
+                medicationCompliance = medicationCompliance[sectorId]?.let { totalsAssembler.toMedicationCompliance(it) },
+                adverseEvents = adverseEvents[sectorId].orEmpty().map { adverseEventMapper.toResponse(it, aeUsers) },
+                notifications = notifications[sectorId].orEmpty().map { notificationMapper.toResponse(it) }
+            )
         }
-        
-        val avgPercentage = if (totalQuantity == 0) BigDecimal.ZERO 
-            else weightedSum.divide(BigDecimal(totalQuantity), 2, RoundingMode.HALF_UP)
-
-        return SelfNotificationResponse(
-            id = UUID.randomUUID(), // Mock ID for aggregated
-            periodId = UUID.randomUUID(), // Mock ID
-            sectorId = indicators.first().sectorId,
-            quantity = totalQuantity,
-            percentage = avgPercentage,
-            createdBy = null
-        )
     }
 
-    private fun aggregateCompliance(indicators: List<ComplianceIndicatorResponse>): ComplianceIndicatorResponse? {
-        if (indicators.isEmpty()) return null
-
-        // Helper to recalculate average percentage
-        fun avg(selector: (ComplianceIndicatorResponse) -> BigDecimal): BigDecimal {
-            if (indicators.isEmpty()) return BigDecimal.ZERO
-            val sum = indicators.sumOf { selector(it) }
-            return sum.divide(BigDecimal(indicators.size), 2, RoundingMode.HALF_UP)
-        }
-
-        val observations = indicators.mapNotNull { it.observations }.joinToString("\n---\n")
-
-        return ComplianceIndicatorResponse(
-            id = "aggregated",
-            periodId = "aggregated",
-            sectorId = indicators.first().sectorId,
-            completeWristband = avg { it.completeWristband },
-            patientCommunication = avg { it.patientCommunication },
-            medicationIdentified = avg { it.medicationIdentified },
-            handHygieneAdherence = avg { it.handHygieneAdherence },
-            fallRiskAssessment = avg { it.fallRiskAssessment },
-            pressureInjuryRiskAssessment = avg { it.pressureInjuryRiskAssessment },
-            observations = if (observations.isBlank()) null else observations,
-            createdAt = LocalDate.now().toString()
-        )
-    }
-
-    private fun aggregateHandHygiene(assessments: List<HandHygieneResponse>): HandHygieneResponse? {
-        if (assessments.isEmpty()) return null
-
-        val sumPercentage = assessments.sumOf { it.compliancePercentage }
-        val avgPercentage = sumPercentage.divide(BigDecimal(assessments.size), 2, RoundingMode.HALF_UP)
-
-        return HandHygieneResponse(
-            id = "aggregated",
-            periodId = "aggregated",
-            sectorId = assessments.first().sectorId,
-            compliancePercentage = avgPercentage,
-            createdAt = LocalDate.now().toString()
-        )
-    }
-
-    private fun aggregateFallRisk(assessments: List<FallRiskResponse>): FallRiskResponse? {
-        if (assessments.isEmpty()) return null
-
-        val total = assessments.sumOf { it.totalPatients }
-        val assessed = assessments.sumOf { it.assessedOnAdmission }
-        val high = assessments.sumOf { it.highRisk }
-        val medium = assessments.sumOf { it.mediumRisk }
-        val low = assessments.sumOf { it.lowRisk }
-        val notAssessed = assessments.sumOf { it.notAssessed }
-
-        fun calcPerc(value: Int, total: Int): BigDecimal {
-            if (total == 0) return BigDecimal.ZERO
-            return BigDecimal(value).multiply(BigDecimal(100)).divide(BigDecimal(total), 2, RoundingMode.HALF_UP)
-        }
-
-        return FallRiskResponse(
-            id = "aggregated",
-            periodId = "aggregated",
-            sectorId = assessments.first().sectorId,
-            totalPatients = total,
-            assessedOnAdmission = assessed,
-            assessmentPercentage = calcPerc(assessed, total),
-            highRisk = high,
-            mediumRisk = medium,
-            lowRisk = low,
-            notAssessed = notAssessed,
-            highRiskPercentage = calcPerc(high, total),
-            mediumRiskPercentage = calcPerc(medium, total),
-            lowRiskPercentage = calcPerc(low, total),
-            notAssessedPercentage = calcPerc(notAssessed, total),
-            createdAt = LocalDate.now().toString()
-        )
-    }
-
-    private fun aggregatePressureInjury(assessments: List<PressureInjuryRiskResponse>): PressureInjuryRiskResponse? {
-        if (assessments.isEmpty()) return null
-
-        val total = assessments.sumOf { it.totalPatients }
-        val assessed = assessments.sumOf { it.assessedOnAdmission }
-        val veryHigh = assessments.sumOf { it.veryHigh }
-        val high = assessments.sumOf { it.highRisk }
-        val medium = assessments.sumOf { it.mediumRisk }
-        val low = assessments.sumOf { it.lowRisk }
-        val notAssessed = assessments.sumOf { it.notAssessed }
-
-        fun calcPerc(value: Int, total: Int): BigDecimal {
-            if (total == 0) return BigDecimal.ZERO
-            return BigDecimal(value).multiply(BigDecimal(100)).divide(BigDecimal(total), 2, RoundingMode.HALF_UP)
-        }
-
-        return PressureInjuryRiskResponse(
-            id = "aggregated",
-            periodId = "aggregated",
-            sectorId = assessments.first().sectorId,
-            totalPatients = total,
-            assessedOnAdmission = assessed,
-            assessmentPercentage = calcPerc(assessed, total),
-            veryHigh = veryHigh,
-            highRisk = high,
-            mediumRisk = medium,
-            lowRisk = low,
-            notAssessed = notAssessed,
-            veryHighPercentage = calcPerc(veryHigh, total),
-            highRiskPercentage = calcPerc(high, total),
-            mediumRiskPercentage = calcPerc(medium, total),
-            lowRiskPercentage = calcPerc(low, total),
-            notAssessedPercentage = calcPerc(notAssessed, total),
-            createdAt = LocalDate.now().toString()
-        )
-    }
-
-    private fun createEmptyReport(): CompletePanelReportResponse {
-        return CompletePanelReportResponse(null, null, null, null, null, null, null, emptyList(), emptyList())
-    }
+    private fun periodKey(date: LocalDate): Int = date.year * 12 + date.monthValue
 }
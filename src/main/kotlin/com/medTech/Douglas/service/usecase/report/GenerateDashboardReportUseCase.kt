@@ -0,0 +1,53 @@
+package com.medTech.Douglas.service.usecase.report
+
+import com.medTech.Douglas.api.dto.report.SectorPanelReportResponse
+import com.medTech.Douglas.domain.enums.ReportPeriodicity
+import com.medTech.Douglas.exception.ResourceNotFoundException
+import com.medTech.Douglas.repository.SectorRepository
+import io.micrometer.core.annotation.Timed
+import org.springframework.stereotype.Component
+import org.springframework.transaction.annotation.Transactional
+import java.time.LocalDate
+import java.util.UUID
+
+/**
+ * Hospital-wide cumulative panel: one report per sector, built in a single request.
+ * When no sector ids are given, every active sector is included.
+ */
+@Component
+class GenerateDashboardReportUseCase(
+    private val sectorRepository: SectorRepository,
+    private val generateCumulativePanelReportUseCase: GenerateCumulativePanelReportUseCase
+) {
+
+    @Timed(value = "report.generation", extraTags = ["report", "dashboard"], histogram = true)
+    @Transactional(readOnly = true)
+    fun execute(
+        sectorIds: List<UUID>?,
+        periodicity: ReportPeriodicity,
+        year: Int?,
+        period: Int?,
+        customStartDate: LocalDate?,
+        customEndDate: LocalDate?
+    ): List<SectorPanelReportResponse> {
+        val sectors = if (sectorIds.isNullOrEmpty()) {
+            sectorRepository.findAllByActiveTrue().sortedBy { it.name }
+        } else {
+            val found = sectorRepository.findAllById(sectorIds).associateBy { it.id }
+            sectorIds.distinct().map { id -> found[id] ?: throw ResourceNotFoundException("Sector not found with id: $id") }
+        }
+
+        val reports = generateCumulativePanelReportUseCase.executeForSectors(
+            sectors.map { it.id }, periodicity, year, period, customStartDate, customEndDate
+        )
+
+        return sectors.map { sector ->
+            SectorPanelReportResponse(
+                sectorId = sector.id,
+                sectorName = sector.name,
+                sectorCode = sector.code,
+                report = reports.getValue(sector.id)
+            )
+        }
+    }
+}
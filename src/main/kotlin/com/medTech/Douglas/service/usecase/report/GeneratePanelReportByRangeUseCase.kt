@@ -2,6 +2,7 @@ package com.medTech.Douglas.service.usecase.report
 
 import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
 import com.medTech.Douglas.repository.PeriodRepository
+import io.micrometer.core.annotation.Timed
 import org.springframework.stereotype.Component
 import org.springframework.transaction.annotation.Transactional
 import java.time.LocalDate
@@ -10,9 +11,10 @@ import java.util.UUID
 @Component
 class GeneratePanelReportByRangeUseCase(
     private val periodRepository: PeriodRepository,
-    private val generateCompletePanelReportUseCase: GenerateCompletePanelReportUseCase
+    private val panelReportBatchLoader: PanelReportBatchLoader
 ) {
 
+    @Timed(value = "report.generation", extraTags = ["report", "range"], histogram = true)
     @Transactional(readOnly = true)
     fun execute(
         sectorId: UUID,
@@ -33,22 +35,8 @@ class GeneratePanelReportByRangeUseCase(
             !periodDate.isBefore(startMonth) && !periodDate.isAfter(endMonth)
         }.sortedBy { LocalDate.of(it.year, it.month, 1) } // Sort ascending for the report
 
-        // Generate report for each period
-        return periodsInRange.map { period ->
-            generateCompletePanelReportUseCase.execute(
-                periodId = period.id,
-                sectorId = sectorId,
-                // We pass null for start/end date to the single report generator 
-                // because we want the standard monthly data for that period.
-                // If we passed the full range, it might fetch events from other months if the logic wasn't strict.
-                // The current logic fetches events by periodId AND date range if provided.
-                // To be safe and get strictly the period's data, we can either pass null (gets whole period)
-                // or pass the specific start/end of that month.
-                // Let's pass null to let the "Period" definition drive the data scope, 
-                // which matches the dashboard requirement of "Jan", "Feb", "Mar" columns.
-                startDate = null, 
-                endDate = null
-            )
-        }
+        // Load every period in one pass. Each period keeps its standard monthly scope
+        // (no date filter), which matches the dashboard's "Jan", "Feb", "Mar" columns.
+        return panelReportBatchLoader.load(periodsInRange.map { it.id }, sectorId)
     }
 }
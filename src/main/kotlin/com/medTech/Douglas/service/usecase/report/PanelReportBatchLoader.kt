@@ -0,0 +1,91 @@
+package com.medTech.Douglas.service.usecase.report
+
+import com.medTech.Douglas.api.dto.report.CompletePanelReportResponse
+import com.medTech.Douglas.repository.*
+import com.medTech.Douglas.service.PanelReportSnapshotService
+import com.medTech.Douglas.service.mapper.AdverseEventMapper
+import com.medTech.Douglas.service.mapper.IndicatorMapper
+import com.medTech.Douglas.service.mapper.NewComplianceMapper
+import com.medTech.Douglas.service.mapper.NotificationMapper
+import com.medTech.Douglas.service.mapper.SelfNotificationMapper
+import org.springframework.stereotype.Component
+import org.springframework.transaction.annotation.Transactional
+import java.util.UUID
+
+/**
+ * Builds the monthly panel for several periods of one sector at once.
+ *
+ * Closed periods are served from their snapshot. The remaining periods read every table
+ * with a single `period_id IN (...)` query and the rows are grouped in memory, so the
+ * number of queries does not grow with the number of periods. All of them run in the caller's
+ * read-only transaction, so a report reads every table on one connection.
+ */
+@Component
+class PanelReportBatchLoader(
+    private val complianceRepository: ComplianceIndicatorRepository,
+    private val handHygieneRepository: HandHygieneAssessmentRepository,
+    private val fallRiskRepository: FallRiskAssessmentRepository,
+    private val pressureInjuryRepository: PressureInjuryRiskAssessmentRepository,
+    private val adverseEventRepository: AdverseEventRepository,
+    private val notificationRepository: NotificationRepository,
+    private val selfNotificationRepository: SelfNotificationRepository,
+    private val metaRepository: MetaComplianceRepository,
+    private val medicationRepository: MedicationComplianceRepository,
+    private val userRepository: UserRepository,
+    private val indicatorMapper: IndicatorMapper,
+    private val adverseEventMapper: AdverseEventMapper,
+    private val notificationMapper: NotificationMapper,
+    private val selfNotificationMapper: SelfNotificationMapper,
+    private val newComplianceMapper: NewComplianceMapper,
+    private val snapshotService: PanelReportSnapshotService
+) {
+
+    /**
+     * Returns one report per period id, in the same order as [periodIds].
+     */
+    @Transactional(readOnly = true)
+    fun load(periodIds: List<UUID>, sectorId: UUID): List<CompletePanelReportResponse> {
+        if (periodIds.isEmpty()) return emptyList()
+
+        val snapshots = snapshotService.findAll(periodIds, sectorId)
+        val livePeriodIds = periodIds.filterNot { snapshots.containsKey(it) }
+        val live = loadLive(livePeriodIds, sectorId)
+
+        return periodIds.map { snapshots[it] ?: live.getValue(it) }
+    }
+
+    private fun loadLive(periodIds: List<UUID>, sectorId: UUID): Map<UUID, CompletePanelReportResponse> {
+        if (periodIds.isEmpty()) return emptyMap()
+
+        val compliance = complianceRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+        val handHygiene = handHygieneRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+        val fallRisk = fallRiskRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+        val pressureInjury = pressureInjuryRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+        val selfNotification = selfNotificationRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+        val metaCompliance = metaRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+        val medicationCompliance = medicationRepository.findByPeriodIdIn(periodIds).associateBy { it.periodId }
+
+        val adverseEventsDomain = adverseEventRepository.findByPeriodIdInAndSectorId(periodIds, sectorId)
+        val aeUserIds = adverseEventsDomain.mapNotNull { it.createdBy }.distinct()
+        val aeUsers = if (aeUserIds.isEmpty()) emptyMap() else userRepository.findAllById(aeUserIds).associateBy { it.id }
+        val adverseEvents = adverseEventsDomain.groupBy { it.periodId }
+
+        // Associations are fetched with the rows, so mapping them triggers no lazy loads
+        val notifications = notificationRepository.findByPeriodIdInAndSectorId(periodIds, sectorId)
+            .groupBy { it.periodId }
+
+        return periodIds.associateWith { periodId ->
+            CompletePanelReportResponse(
+                complianceIndicator = compliance[periodId]?.let { indicatorMapper.toResponse(it) },
+                handHygieneAssessment = handHygiene[periodId]?.let { indicatorMapper.toResponse(it) },
+                fallRiskAssessment = fallRisk[periodId]?.let { indicatorMapper.toResponse(it) },
+                pressureInjuryRiskAssessment = pressureInjury[periodId]?.let { indicatorMapper.toResponse(it) },
+                selfNotification = selfNotification[periodId]?.let { selfNotificationMapper.toResponse(it) },
+                metaCompliance = metaCompliance[periodId]?.let { newComplianceMapper.toResponse(it) },
+                medicationCompliance = medicationCompliance[periodId]?.let { newComplianceMapper.toResponse(it) },
+                adverseEvents = adverseEvents[periodId].orEmpty().map { adverseEventMapper.toResponse(it, aeUsers) },
+                notifications = notifications[periodId].orEmpty().map { notificationMapper.toResponse(it) }
+            )
+        }
+    }
+}
@@ -0,0 +1,142 @@
+package com.medTech.Douglas.service.usecase.report
+
+import com.medTech.Douglas.api.dto.compliance.MedicationComplianceResponse
+import com.medTech.Douglas.api.dto.compliance.MetaComplianceResponse
+import com.medTech.Douglas.api.dto.indicator.*
+import com.medTech.Douglas.api.dto.report.*
+import com.medTech.Douglas.api.dto.selfnotification.SelfNotificationResponse
+import org.springframework.stereotype.Component
+import java.math.BigDecimal
+import java.math.RoundingMode
+import java.time.LocalDate
+import java.util.UUID
+
+/**
+ * Turns the per-sector sums returned by the aggregate queries into the panel responses:
+ * the final divisions, percentages and rounding of the cumulative report.
+ */
+@Component
+class PanelTotalsAssembler {
+
+    private fun avg(sum: BigDecimal?, rows: Long): BigDecimal {
+        if (sum == null || rows == 0L) return BigDecimal.ZERO
+        return sum.divide(BigDecimal.valueOf(rows), 2, RoundingMode.HALF_UP)
+    }
+
+    private fun calcPerc(value: Long?, total: Long?): BigDecimal {
+        if (value == null || total == null || total == 0L) return BigDecimal.ZERO
+        return BigDecimal.valueOf(value).multiply(BigDecimal(100)).divide(BigDecimal.valueOf(total), 2, RoundingMode.HALF_UP)
+    }
+
+    fun toMetaCompliance(totals: MetaComplianceTotals): MetaComplianceResponse {
+        return MetaComplianceResponse(
+            id = UUID.randomUUID(),
+            periodId = UUID.randomUUID(),
+            sectorId = totals.sectorId,
+            goalValue = avg(totals.goalValue, totals.rows),
+            percentage = avg(totals.percentage, totals.rows),
+            createdBy = null
+        )
+    }
+
+    fun toMedicationCompliance(totals: MedicationComplianceTotals): MedicationComplianceResponse {
+        return MedicationComplianceResponse(
+            id = UUID.randomUUID(),
+            periodId = UUID.randomUUID(),
+            sectorId = totals.sectorId,
+            percentage = avg(totals.percentage, totals.rows),
+            createdBy = null
+        )
+    }
+
+    fun toSelfNotification(totals: SelfNotificationTotals): SelfNotificationResponse {
+        val totalQuantity = totals.quantity ?: 0L
+
+        // Weighted average for percentage
+        val avgPercentage = if (totalQuantity == 0L || totals.weightedPercentage == null) BigDecimal.ZERO
+            else totals.weightedPercentage.divide(BigDecimal.valueOf(totalQuantity), 2, RoundingMode.HALF_UP)
+
+        return SelfNotificationResponse(
+            id = UUID.randomUUID(), // Mock ID for aggregated
+            periodId = UUID.randomUUID(), // Mock ID
+            sectorId = totals.sectorId,
+            quantity = totalQuantity.toInt(),
+            percentage = avgPercentage,
+            createdBy = null
+        )
+    }
+
+    fun toCompliance(totals: ComplianceTotals, observations: List<String>): ComplianceIndicatorResponse {
+        val joined = observations.joinToString("\n---\n")
+
+        return ComplianceIndicatorResponse(
+            id = "aggregated",
+            periodId = "aggregated",
+            sectorId = totals.sectorId.toString(),
+            completeWristband = avg(totals.completeWristband, totals.rows),
+            patientCommunication = avg(totals.patientCommunication, totals.rows),
+            medicationIdentified = avg(totals.medicationIdentified, totals.rows),
+            handHygieneAdherence = avg(totals.handHygieneAdherence, totals.rows),
+            fallRiskAssessment = avg(totals.fallRiskAssessment, totals.rows),
+            pressureInjuryRiskAssessment = avg(totals.pressureInjuryRiskAssessment, totals.rows),
+            observations = if (joined.isBlank()) null else joined,
+            createdAt = LocalDate.now().toString()
+        )
+    }
+
+    fun toHandHygiene(totals: HandHygieneTotals): HandHygieneResponse {
+        return HandHygieneResponse(
+            id = "aggregated",
+            periodId = "aggregated",
+            sectorId = totals.sectorId.toString(),
+            compliancePercentage = avg(totals.compliancePercentage, totals.rows),
+            createdAt = LocalDate.now().toString()
+        )
+    }
+
+    fun toFallRisk(totals: FallRiskTotals): FallRiskResponse {
+        val total = totals.totalPatients
+
+        return FallRiskResponse(
+            id = "aggregated",
+            periodId = "aggregated",
+            sectorId = totals.sectorId.toString(),
+            totalPatients = (total ?: 0L).toInt(),
+            assessedOnAdmission = (totals.assessedOnAdmission ?: 0L).toInt(),
+            assessmentPercentage = calcPerc(totals.assessedOnAdmission, total),
+            highRisk = (totals.highRisk ?: 0L).toInt(),
+            mediumRisk = (totals.mediumRisk ?: 0L).toInt(),
+            lowRisk = (totals.lowRisk ?: 0L).toInt(),
+            notAssessed = (totals.notAssessed ?: 0L).toInt(),
+            highRiskPercentage = calcPerc(totals.highRisk, total),
+            mediumRiskPercentage = calcPerc(totals.mediumRisk, total),
+            lowRiskPercentage = calcPerc(totals.lowRisk, total),
+            notAssessedPercentage = calcPerc(totals.notAssessed, total),
+            createdAt = LocalDate.now().toString()
+        )
+    }
+
+    fun toPressureInjury(totals: PressureInjuryTotals): PressureInjuryRiskResponse {
+        val total = totals.totalPatients
+
+        return PressureInjuryRiskResponse(
+            id = "aggregated",
+            periodId = "aggregated",
+            sectorId = totals.sectorId.toString(),
+            totalPatients = (total ?: 0L).toInt(),
+            assessedOnAdmission = (totals.assessedOnAdmission ?: 0L).toInt(),
+            assessmentPercentage = calcPerc(totals.assessedOnAdmission, total),
+            veryHigh = (totals.veryHigh ?: 0L).toInt(),
+            highRisk = (totals.highRisk ?: 0L).toInt(),
+            mediumRisk = (totals.mediumRisk ?: 0L).toInt(),
+            lowRisk = (totals.lowRisk ?: 0L).toInt(),
+            notAssessed = (totals.notAssessed ?: 0L).toInt(),
+            veryHighPercentage = calcPerc(totals.veryHigh, total),
+            highRiskPercentage = calcPerc(totals.highRisk, total),
+            mediumRiskPercentage = calcPerc(totals.mediumRisk, total),
+            lowRiskPercentage = calcPerc(totals.lowRisk, total),
+            notAssessedPercentage = calcPerc(totals.notAssessed, total),
+            createdAt = LocalDate.now().toString()
+        )
+    }
+}
@@ -0,0 +1,142 @@
+package com.medTech.Douglas.service.usecase.sync
+
+import com.medTech.Douglas.api.dto.sync.SyncChangesResponse
+import com.medTech.Douglas.api.dto.sync.SyncTombstone
+import com.medTech.Douglas.config.SyncProperties
+import com.medTech.Douglas.repository.*
+import com.medTech.Douglas.service.mapper.AdverseEventMapper
+import com.medTech.Douglas.service.mapper.IndicatorMapper
+import com.medTech.Douglas.service.mapper.NewComplianceMapper
+import com.medTech.Douglas.service.mapper.NotificationMapper
+import com.medTech.Douglas.service.mapper.SelfNotificationMapper
+import org.springframework.jdbc.core.namedparam.MapSqlParameterSource
+import org.springframework.jdbc.core.namedparam.NamedParameterJdbcTemplate
+import org.springframework.stereotype.Component
+import org.springframework.transaction.annotation.Transactional
+import java.time.LocalDateTime
+import java.time.temporal.ChronoUnit
+import java.util.UUID
+import javax.sql.DataSource
+
+/**
+ * Records of one sector created, updated or deleted since a client's watermark, so polling
+ * dashboards fetch only what changed instead of every list.
+ *
+ * The window is (since, watermark], with the watermark trailing the clock by
+ * [SyncProperties.commitLagMs]: updated_at is stamped before the transaction commits, so a
+ * row becomes visible a little after its timestamp. Each change is returned in exactly one
+ * window. A single count over the (sector_id, updated_at) indexes, restricted to the period
+ * when one is given, answers the usual "nothing changed" poll; the tables themselves are only
+ * read when it finds something.
+ *
+ * Without a watermark, with one older than the tombstone retention, or with more than
+ * [SyncProperties.maxChanges] pending changes the response only carries a new watermark and
+ * resetRequired; the client then reloads the full lists and continues from that watermark.
+ */
+@Component
+class GetChangesSinceUseCase(
+    private val notificationRepository: NotificationRepository,
+    private val adverseEventRepository: AdverseEventRepository,
+    private val complianceRepository: ComplianceIndicatorRepository,
+    private val handHygieneRepository: HandHygieneAssessmentRepository,
+    private val fallRiskRepository: FallRiskAssessmentRepository,
+    private val pressureInjuryRepository: PressureInjuryRiskAssessmentRepository,
+    private val selfNotificationRepository: SelfNotificationRepository,
+    private val metaRepository: MetaComplianceRepository,
+    private val medicationRepository: MedicationComplianceRepository,
+    private val userRepository: UserRepository,
+    private val notificationMapper: NotificationMapper,
+    private val adverseEventMapper: AdverseEventMapper,
+    private val indicatorMapper: IndicatorMapper,
+    private val selfNotificationMapper: SelfNotificationMapper,
+    private val newComplianceMapper: NewComplianceMapper,
+    private val properties: SyncProperties,
+    dataSource: DataSource
+) {
+
+    private val jdbcTemplate = NamedParameterJdbcTemplate(dataSource)
+
+    @Transactional(readOnly = true)
+    fun execute(sectorId: UUID, periodId: UUID?, since: LocalDateTime?): SyncChangesResponse {
+        val now = LocalDateTime.now()
+        val watermark = now.minus(properties.commitLagMs, ChronoUnit.MILLIS)
+
+        if (since == null || since.isBefore(now.minusDays(properties.tombstoneRetentionDays))) {
+            return SyncChangesResponse(watermark = watermark, resetRequired = true)
+        }
+        if (!since.isBefore(watermark)) {
+            return SyncChangesResponse(watermark = since)
+        }
+
+        val params = MapSqlParameterSource()
+            .addValue("sectorId", sectorId)
+            .addValue("periodId", periodId)
+            .addValue("since", since)
+            .addValue("until", watermark)
+
+        val pending = jdbcTemplate.queryForObject(countSql(periodId != null), params, Long::class.java) ?: 0L
+        if (pending == 0L) {
+            return SyncChangesResponse(watermark = watermark)
+        }
+        if (pending > properties.maxChanges) {
+            return SyncChangesResponse(watermark = watermark, resetRequired = true)
+        }
+
+        val adverseEvents = adverseEventRepository.findChanged(sectorId, periodId, since, watermark)
+        val users = userRepository.findAllById(adverseEvents.mapNotNull { it.createdBy }.distinct()).associateBy { it.id }
+
+        val deleted = jdbcTemplate.query(tombstonesSql(periodId != null), params) { rs, _ ->
+            SyncTombstone(
+                resource = rs.getString("resource"),
+                id = rs.getObject("record_id", UUID::class.java),
+                periodId = rs.getObject("period_id", UUID::class.java),
+                deletedAt = rs.getObject("deleted_at", LocalDateTime::class.java)
+            )
+        }
+
+        return SyncChangesResponse(
+            watermark = watermark,
+            notifications = notificationRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { notificationMapper.toResponse(it) },
+            adverseEvents = adverseEvents.map { adverseEventMapper.toResponse(it, users) },
+            complianceIndicators = complianceRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { indicatorMapper.toResponse(it) },
+            handHygieneAssessments = handHygieneRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { indicatorMapper.toResponse(it) },
+            fallRiskAssessments = fallRiskRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { indicatorMapper.toResponse(it) },
+            pressureInjuryRiskAssessments = pressureInjuryRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { indicatorMapper.toResponse(it) },
+            selfNotifications = selfNotificationRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { selfNotificationMapper.toResponse(it) },
+            metaCompliance = metaRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { newComplianceMapper.toResponse(it) },
+            medicationCompliance = medicationRepository.findChanged(sectorId, periodId, since, watermark)
+                .map { newComplianceMapper.toResponse(it) },
+            deleted = deleted
+        )
+    }
+
+    companion object {
+        private val TABLES = listOf(
+            "notifications", "adverse_events", "compliance_indicators", "hand_hygiene_assessments",
+            "fall_risk_assessments", "pressure_injury_risk_assessments", "self_notifications",
+            "meta_compliance", "medication_compliance"
+        )
+
+        // The period condition is only added when a period was given, so the sector-wide
+        // variant stays a plain range scan on (sector_id, updated_at)
+        private fun window(column: String, withPeriod: Boolean) =
+            "sector_id = :sectorId AND $column > :since AND $column <= :until" +
+                if (withPeriod) " AND period_id = :periodId" else ""
+
+        private fun countSql(withPeriod: Boolean) =
+            TABLES.joinToString(" + ", prefix = "SELECT ") { table ->
+                "(SELECT COUNT(*) FROM $table WHERE ${window("updated_at", withPeriod)})"
+            } + " + (SELECT COUNT(*) FROM sync_tombstones WHERE ${window("deleted_at", withPeriod)})"
+
+        private fun tombstonesSql(withPeriod: Boolean) =
+            "SELECT resource, record_id, period_id, deleted_at FROM sync_tombstones " +
+                "WHERE ${window("deleted_at", withPeriod)} ORDER BY deleted_at"
+    }
+}
@@ -1,5 +1,6 @@
 package com.medTech.Douglas.service.usecase.user
 
+import com.medTech.Douglas.config.security.PrincipalCache
 import com.medTech.Douglas.api.dto.user.ChangeUserPasswordRequest
 import com.medTech.Douglas.exception.ResourceNotFoundException
 import com.medTech.Douglas.repository.UserRepository
@@ -11,7 +12,8 @@ import java.util.UUID
 @Component
 class ChangeUserPasswordUseCase(
     private val userRepository: UserRepository,
-    private val passwordHashingService: PasswordHashingService
+    private val passwordHashingService: PasswordHashingService,
+    private val principalCache: PrincipalCache
 ) {
     @Transactional
     fun execute(userId: UUID, request: ChangeUserPasswordRequest) {
@@ -22,5 +24,6 @@ class ChangeUserPasswordUseCase(
         user.changePassword(hashedPassword)
         
         userRepository.save(user)
+        principalCache.evict(user.email)
     }
 }
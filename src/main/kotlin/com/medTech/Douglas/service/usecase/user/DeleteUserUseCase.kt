@@ -1,5 +1,6 @@
 package com.medTech.Douglas.service.usecase.user
 
+import com.medTech.Douglas.config.security.PrincipalCache
 import com.medTech.Douglas.repository.UserRepository
 import com.medTech.Douglas.exception.ResourceNotFoundException
 import org.springframework.stereotype.Component
@@ -8,7 +9,8 @@ import java.util.UUID
 
 @Component
 class DeleteUserUseCase(
-    private val userRepository: UserRepository
+    private val userRepository: UserRepository,
+    private val principalCache: PrincipalCache
 ) {
     @Transactional
     fun execute(id: UUID) {
@@ -17,5 +19,6 @@ class DeleteUserUseCase(
         
         user.deactivate()
         userRepository.save(user)
+        principalCache.evict(user.email)
     }
 }
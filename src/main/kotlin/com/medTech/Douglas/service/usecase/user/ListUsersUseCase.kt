@@ -4,7 +4,9 @@ import com.medTech.Douglas.api.dto.user.UserResponse
 import com.medTech.Douglas.domain.entity.User
 import com.medTech.Douglas.domain.enums.JobTitle
 import com.medTech.Douglas.domain.enums.Role
+import com.medTech.Douglas.repository.LIKE_ESCAPE
 import com.medTech.Douglas.repository.UserRepository
+import com.medTech.Douglas.repository.containsPattern
 import jakarta.persistence.criteria.Predicate
 import org.springframework.data.jpa.domain.Specification
 import org.springframework.stereotype.Service
@@ -21,11 +23,11 @@ class ListUsersUseCase(
             val predicates = mutableListOf<Predicate>()
 
             if (!name.isNullOrBlank()) {
-                predicates.add(cb.like(cb.lower(root.get("name")), "%${name.lowercase()}%"))
+                predicates.add(cb.like(cb.lower(root.get("name")), containsPattern(name.lowercase()), LIKE_ESCAPE))
             }
 
             if (!email.isNullOrBlank()) {
-                predicates.add(cb.like(cb.lower(root.get("email")), "%${email.lowercase()}%"))
+                predicates.add(cb.like(cb.lower(root.get("email")), containsPattern(email.lowercase()), LIKE_ESCAPE))
             }
 
             if (role != null) {
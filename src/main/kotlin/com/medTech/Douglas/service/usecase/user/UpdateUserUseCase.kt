@@ -1,5 +1,6 @@
 package com.medTech.Douglas.service.usecase.user
 
+import com.medTech.Douglas.config.security.PrincipalCache
 import com.medTech.Douglas.api.dto.user.UpdateUserRequest
 import com.medTech.Douglas.api.dto.user.UserResponse
 import com.medTech.Douglas.repository.UserRepository
@@ -10,7 +11,8 @@ import java.util.UUID
 
 @Component
 class UpdateUserUseCase(
-    private val userRepository: UserRepository
+    private val userRepository: UserRepository,
+    private val principalCache: PrincipalCache
 ) {
     @Transactional
     fun execute(id: UUID, request: UpdateUserRequest): UserResponse {
@@ -38,6 +40,7 @@ class UpdateUserUseCase(
         user.updatedAt = java.time.LocalDateTime.now()
         
         val updatedUser = userRepository.save(user)
+        principalCache.evict(updatedUser.email)
 
         return UserResponse(
             id = updatedUser.id,
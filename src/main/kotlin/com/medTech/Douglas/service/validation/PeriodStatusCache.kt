@@ -0,0 +1,79 @@
+package com.medTech.Douglas.service.validation
+
+import com.github.benmanes.caffeine.cache.CacheLoader
+import com.github.benmanes.caffeine.cache.Caffeine
+import com.github.benmanes.caffeine.cache.LoadingCache
+import com.medTech.Douglas.config.PeriodStatusCacheProperties
+import com.medTech.Douglas.domain.enums.PeriodStatus
+import com.medTech.Douglas.repository.PeriodRepository
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.binder.MeterBinder
+import io.micrometer.core.instrument.binder.cache.CaffeineCacheMetrics
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.time.Duration
+import java.util.UUID
+
+/**
+ * In-process cache of period statuses used by [PeriodValidator].
+ *
+ * PeriodService.close and reopen update the entry once their transaction commits, so this
+ * instance sees a transition immediately. Transitions made by other instances are picked up
+ * when the entry expires, which is why the TTL is kept short. Unknown periods are not cached.
+ * The cache only rejects writes early: an accepted write still share-locks the period row and
+ * re-reads its status in its own transaction.
+ */
+@Component
+class PeriodStatusCache(
+    private val periodRepository: PeriodRepository,
+    properties: PeriodStatusCacheProperties
+) : MeterBinder {
+
+    private val statuses: LoadingCache<UUID, PeriodStatus> = Caffeine.newBuilder()
+        .expireAfterWrite(Duration.ofMillis(properties.ttlMs))
+        .maximumSize(properties.maxSize)
+        .recordStats()
+        .build(object : CacheLoader<UUID, PeriodStatus> {
+            override fun load(key: UUID): PeriodStatus? {
+                return periodRepository.findById(key).orElse(null)?.status
+            }
+
+            override fun loadAll(keys: Set<UUID>): Map<UUID, PeriodStatus> {
+                return periodRepository.findAllById(keys).associate { it.id to it.status }
+            }
+        })
+
+    fun get(periodId: UUID): PeriodStatus? = statuses.get(periodId)
+
+    fun getAll(periodIds: Collection<UUID>): Map<UUID, PeriodStatus> = statuses.getAll(periodIds)
+
+    /**
+     * Records a status change made in the current transaction. The entry is dropped right
+     * away (readers fall back to the database, which still has the committed status) and set
+     * to [status] after commit.
+     */
+    fun statusChanged(periodId: UUID, status: PeriodStatus) {
+        statuses.invalidate(periodId)
+
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+                override fun afterCommit() {
+                    statuses.put(periodId, status)
+                }
+
+                override fun afterCompletion(completionStatus: Int) {
+                    if (completionStatus != TransactionSynchronization.STATUS_COMMITTED) {
+                        statuses.invalidate(periodId)
+                    }
+                }
+            })
+        } else {
+            statuses.put(periodId, status)
+        }
+    }
+
+    override fun bindTo(registry: MeterRegistry) {
+        CaffeineCacheMetrics.monitor(registry, statuses, "periodStatus")
+    }
+}
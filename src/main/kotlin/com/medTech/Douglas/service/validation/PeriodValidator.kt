@@ -9,14 +9,57 @@ import java.util.UUID
 
 @Component
 class PeriodValidator(
+    private val periodStatusCache: PeriodStatusCache,
     private val periodRepository: PeriodRepository
 ) {
+    /**
+     * Must be called inside the writing transaction. The cache rejects closed periods without
+     * a query; an open one is then share-locked until the transaction ends, so a concurrent
+     * close waits for this write and its panel snapshot includes it.
+     */
     fun validatePeriodIsOpen(periodId: UUID) {
-        val period = periodRepository.findById(periodId)
-            .orElseThrow { PeriodNotFoundException("Period not found with id: $periodId") }
-        
-        if (period.status != PeriodStatus.OPEN) {
+        val status = periodStatusCache.get(periodId)
+            ?: throw PeriodNotFoundException("Period not found with id: $periodId")
+
+        if (status != PeriodStatus.OPEN) {
             throw ClosedPeriodException("Cannot insert/update data in a closed period")
         }
+
+        lockOpenPeriods(listOf(periodId))
+    }
+
+    /**
+     * Share-locks the periods for the rest of the current transaction and re-checks their
+     * committed status, which the cache may not reflect yet when another instance closed them.
+     */
+    fun lockOpenPeriods(periodIds: Collection<UUID>) {
+        val ids = periodIds.distinct()
+        val periods = periodRepository.findAllForShare(ids)
+
+        if (periods.size != ids.size) {
+            val missing = ids - periods.map { it.id }.toSet()
+            throw PeriodNotFoundException("Period not found with id: ${missing.first()}")
+        }
+        if (periods.any { it.status != PeriodStatus.OPEN }) {
+            throw ClosedPeriodException("Cannot insert/update data in a closed period")
+        }
+    }
+
+    /**
+     * Checks several periods with one query. Returns an error message for every id that
+     * does not exist or is not open; ids missing from the result are open.
+     */
+    fun findPeriodsNotOpen(periodIds: Collection<UUID>): Map<UUID, String> {
+        if (periodIds.isEmpty()) return emptyMap()
+
+        val statuses = periodStatusCache.getAll(periodIds)
+        return periodIds.mapNotNull { periodId ->
+            val status = statuses[periodId]
+            when {
+                status == null -> periodId to "Period not found with id: $periodId"
+                status != PeriodStatus.OPEN -> periodId to "Cannot insert/update data in a closed period"
+                else -> null
+            }
+        }.toMap()
     }
 }
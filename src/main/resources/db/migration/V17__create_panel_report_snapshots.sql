@@ -0,0 +1,11 @@
+-- V17__create_panel_report_snapshots.sql
+
+-- Frozen monthly panel, written when a period is closed and removed when it is reopened.
+CREATE TABLE panel_report_snapshots (
+    period_id UUID PRIMARY KEY,
+    sector_id UUID NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+    CONSTRAINT fk_panel_report_snapshots_period FOREIGN KEY (period_id) REFERENCES periods(id) ON DELETE CASCADE,
+    CONSTRAINT fk_panel_report_snapshots_sector FOREIGN KEY (sector_id) REFERENCES sectors(id)
+);
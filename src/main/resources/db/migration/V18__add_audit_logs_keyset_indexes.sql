@@ -0,0 +1,10 @@
+-- V18__add_audit_logs_keyset_indexes.sql
+
+-- Keyset pagination walks (created_at, id) in descending order. Each optional equality
+-- filter gets its own composite index so the date bounds and the cursor stay a range scan.
+DROP INDEX IF EXISTS idx_audit_logs_created_at;
+DROP INDEX IF EXISTS idx_audit_logs_resource;
+
+CREATE INDEX idx_audit_logs_created_at_id ON audit_logs(created_at DESC, id DESC);
+CREATE INDEX idx_audit_logs_action_created_at_id ON audit_logs(action, created_at DESC, id DESC);
+CREATE INDEX idx_audit_logs_resource_created_at_id ON audit_logs(resource, created_at DESC, id DESC);
@@ -0,0 +1,6 @@
+-- V19__add_notifications_listing_indexes.sql
+
+-- Paged notification listings filter by sector or period and sort by created_at (default),
+-- with id as tie-breaker. These let the first pages come straight off the index.
+CREATE INDEX idx_notifications_sector_created_at_id ON notifications(sector_id, created_at DESC, id DESC);
+CREATE INDEX idx_notifications_period_created_at_id ON notifications(period_id, created_at DESC, id DESC);
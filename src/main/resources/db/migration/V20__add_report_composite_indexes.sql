@@ -0,0 +1,22 @@
+-- V20__add_report_composite_indexes.sql
+
+-- periods: PeriodRepository.search filters by sector (optionally status/year) and sorts by
+-- year, month; the range reports filter by sector and the (year * 12 + month) key and only
+-- need the id, so that index carries it for index-only scans.
+CREATE INDEX idx_periods_sector_year_month ON periods(sector_id, year DESC, month DESC);
+CREATE INDEX idx_periods_sector_period_key ON periods(sector_id, ((year * 12 + month))) INCLUDE (id);
+DROP INDEX IF EXISTS idx_periods_sector_id;
+
+-- adverse_events: findByPeriodIdAndSectorId, findByPeriodIdAndSectorIdAndEventDateBetween and
+-- the range reports (ORDER BY event_date) all lead with period_id and sector_id.
+CREATE INDEX idx_adverse_events_period_sector_date ON adverse_events(period_id, sector_id, event_date);
+DROP INDEX IF EXISTS idx_adverse_events_period_id;
+
+-- notifications: findByPeriodIdAndSectorId and the batched panel query.
+-- The plain period_id index is a prefix of idx_notifications_period_created_at_id (V19).
+CREATE INDEX idx_notifications_period_sector ON notifications(period_id, sector_id);
+DROP INDEX IF EXISTS idx_notifications_period_id;
+
+-- compliance_indicators.period_id is UNIQUE, which already creates an index; this one duplicated it.
+-- (hand_hygiene, fall_risk and pressure_injury are covered the same way by their UNIQUE constraint.)
+DROP INDEX IF EXISTS idx_compliance_period_id;
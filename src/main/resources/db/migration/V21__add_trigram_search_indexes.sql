@@ -0,0 +1,13 @@
+-- V21__add_trigram_search_indexes.sql
+
+-- Substring filters (LIKE '%term%') cannot use B-tree indexes. Trigram GIN indexes can, for
+-- any term of three or more characters. Each index matches the exact expression the
+-- searches use: AuditLogService filters user_email as-is and details through lower(),
+-- ListUsersUseCase filters lower(name) and lower(email).
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_audit_logs_user_email_trgm ON audit_logs USING gin (user_email gin_trgm_ops);
+CREATE INDEX idx_audit_logs_details_trgm ON audit_logs USING gin (lower(details) gin_trgm_ops);
+
+CREATE INDEX idx_users_name_trgm ON users USING gin (lower(name) gin_trgm_ops);
+CREATE INDEX idx_users_email_trgm ON users USING gin (lower(email) gin_trgm_ops);
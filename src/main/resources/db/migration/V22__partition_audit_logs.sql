@@ -0,0 +1,87 @@
+-- V22__partition_audit_logs.sql
+
+-- audit_logs becomes a table partitioned by month on created_at. Keyset searches with date
+-- bounds only touch the matching months, each month's indexes stay small, and expired months
+-- can be detached and dropped instead of deleted row by row (see AuditLogPartitionMaintenance).
+--
+-- The primary key of a partitioned table must contain the partition key, so it becomes
+-- (id, created_at); ids are still random UUIDs and the entity keeps mapping id alone.
+
+ALTER TABLE audit_logs RENAME TO audit_logs_legacy;
+ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey;
+DROP INDEX IF EXISTS idx_audit_logs_created_at_id;
+DROP INDEX IF EXISTS idx_audit_logs_action_created_at_id;
+DROP INDEX IF EXISTS idx_audit_logs_resource_created_at_id;
+DROP INDEX IF EXISTS idx_audit_logs_user_email_trgm;
+DROP INDEX IF EXISTS idx_audit_logs_details_trgm;
+
+CREATE TABLE audit_logs (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    user_id UUID,
+    user_email VARCHAR(255),
+    action VARCHAR(50) NOT NULL,
+    resource VARCHAR(100) NOT NULL,
+    resource_id VARCHAR(255),
+    details TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catches rows for months whose partition does not exist yet, so an insert never fails.
+-- The maintenance job moves them into their monthly partition once it creates it.
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+-- Same indexes as V18 and V21, declared on the parent so every partition gets its own copy
+CREATE INDEX idx_audit_logs_created_at_id ON audit_logs(created_at DESC, id DESC);
+CREATE INDEX idx_audit_logs_action_created_at_id ON audit_logs(action, created_at DESC, id DESC);
+CREATE INDEX idx_audit_logs_resource_created_at_id ON audit_logs(resource, created_at DESC, id DESC);
+CREATE INDEX idx_audit_logs_user_email_trgm ON audit_logs USING gin (user_email gin_trgm_ops);
+CREATE INDEX idx_audit_logs_details_trgm ON audit_logs USING gin (lower(details) gin_trgm_ops);
+
+-- Creates the partition audit_logs_YYYY_MM for the month containing p_month, if missing.
+-- Rows already sitting in the default partition for that month are moved into it first;
+-- attaching would otherwise fail because they fall inside the new bounds.
+CREATE OR REPLACE FUNCTION ensure_audit_log_partition(p_month DATE) RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::date;
+    v_end DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::date;
+    v_name TEXT := 'audit_logs_' || to_char(p_month, 'YYYY_MM');
+BEGIN
+    IF to_regclass(v_name) IS NOT NULL THEN
+        RETURN v_name;
+    END IF;
+
+    EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', v_name);
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM audit_logs_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        v_start, v_end, v_name);
+    EXECUTE format('ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)', v_name, v_start, v_end);
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- One partition per month that has rows, through a few months ahead
+DO $$
+DECLARE
+    v_month DATE;
+    v_last DATE := (date_trunc('month', NOW()) + INTERVAL '3 months')::date;
+BEGIN
+    SELECT COALESCE(date_trunc('month', MIN(created_at)), date_trunc('month', NOW()))::date
+    INTO v_month
+    FROM audit_logs_legacy;
+
+    WHILE v_month <= v_last LOOP
+        PERFORM ensure_audit_log_partition(v_month);
+        v_month := (v_month + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$;
+
+INSERT INTO audit_logs (id, user_id, user_email, action, resource, resource_id, details, created_at)
+SELECT id, user_id, user_email, action, resource, resource_id, details, created_at
+FROM audit_logs_legacy;
+
+DROP TABLE audit_logs_legacy;
+
+ANALYZE audit_logs;
@@ -0,0 +1,121 @@
+-- V23__create_notification_category_rollup.sql
+
+-- Professional-category ranking, pre-aggregated per period and sector. The ranking endpoint
+-- sums these rows instead of grouping the whole notifications table on every call.
+--
+-- The rollup keeps the category id rather than its name, so renaming a category needs no
+-- maintenance; free-text categories keep their text. category_key is the non-null form of
+-- the pair used in the primary key. There are no foreign keys on purpose: deleting a period
+-- cascades to its notifications, and the triggers below then remove the matching rows.
+CREATE TABLE notification_category_rollup (
+    period_id UUID NOT NULL,
+    sector_id UUID NOT NULL,
+    professional_category_id UUID,
+    category_text VARCHAR(255),
+    category_key TEXT GENERATED ALWAYS AS (
+        COALESCE(professional_category_id::text, 'text:' || category_text, '')
+    ) STORED,
+    total BIGINT NOT NULL,
+    notifications BIGINT NOT NULL,
+    PRIMARY KEY (period_id, sector_id, category_key)
+);
+
+CREATE INDEX idx_notification_category_rollup_sector ON notification_category_rollup(sector_id);
+
+-- Statement-level triggers with transition tables: a batched insert (bulk import, synthetic
+-- data) applies one grouped upsert instead of one per row. Rows are upserted in key order so
+-- concurrent writers touching the same keys lock them in the same order.
+CREATE OR REPLACE FUNCTION apply_notification_category_rollup() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO notification_category_rollup AS r
+            (period_id, sector_id, professional_category_id, category_text, total, notifications)
+        SELECT period_id, sector_id, professional_category_id,
+               CASE WHEN professional_category_id IS NULL THEN professional_category_text END,
+               SUM(quantity_professional), COUNT(*)
+        FROM new_rows
+        GROUP BY 1, 2, 3, 4
+        ORDER BY 1, 2, 3, 4
+        ON CONFLICT (period_id, sector_id, category_key) DO UPDATE
+            SET total = r.total + EXCLUDED.total, notifications = r.notifications + EXCLUDED.notifications;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'UPDATE' THEN
+        INSERT INTO notification_category_rollup AS r
+            (period_id, sector_id, professional_category_id, category_text, total, notifications)
+        SELECT period_id, sector_id, professional_category_id, category_text, SUM(total), SUM(notifications)
+        FROM (
+            SELECT period_id, sector_id, professional_category_id,
+                   CASE WHEN professional_category_id IS NULL THEN professional_category_text END AS category_text,
+                   quantity_professional::bigint AS total, 1::bigint AS notifications
+            FROM new_rows
+            UNION ALL
+            SELECT period_id, sector_id, professional_category_id,
+                   CASE WHEN professional_category_id IS NULL THEN professional_category_text END,
+                   -quantity_professional::bigint, -1::bigint
+            FROM old_rows
+        ) delta
+        GROUP BY 1, 2, 3, 4
+        HAVING SUM(total) <> 0 OR SUM(notifications) <> 0
+        ORDER BY 1, 2, 3, 4
+        ON CONFLICT (period_id, sector_id, category_key) DO UPDATE
+            SET total = r.total + EXCLUDED.total, notifications = r.notifications + EXCLUDED.notifications;
+    ELSE
+        INSERT INTO notification_category_rollup AS r
+            (period_id, sector_id, professional_category_id, category_text, total, notifications)
+        SELECT period_id, sector_id, professional_category_id,
+               CASE WHEN professional_category_id IS NULL THEN professional_category_text END,
+               -SUM(quantity_professional), -COUNT(*)
+        FROM old_rows
+        GROUP BY 1, 2, 3, 4
+        ORDER BY 1, 2, 3, 4
+        ON CONFLICT (period_id, sector_id, category_key) DO UPDATE
+            SET total = r.total + EXCLUDED.total, notifications = r.notifications + EXCLUDED.notifications;
+    END IF;
+
+    DELETE FROM notification_category_rollup r
+    USING (SELECT DISTINCT period_id, sector_id FROM old_rows) o
+    WHERE r.period_id = o.period_id AND r.sector_id = o.sector_id AND r.notifications = 0;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_notification_category_rollup_insert
+    AFTER INSERT ON notifications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_notification_category_rollup();
+
+CREATE TRIGGER trg_notification_category_rollup_update
+    AFTER UPDATE ON notifications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_notification_category_rollup();
+
+CREATE TRIGGER trg_notification_category_rollup_delete
+    AFTER DELETE ON notifications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_notification_category_rollup();
+
+-- Recomputes the whole rollup from notifications (backfills, or after writes made with the
+-- triggers disabled). Notification writes wait until the calling transaction ends; reads do not.
+CREATE OR REPLACE FUNCTION rebuild_notification_category_rollup() RETURNS BIGINT AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    LOCK TABLE notifications IN SHARE MODE;
+    DELETE FROM notification_category_rollup;
+    INSERT INTO notification_category_rollup
+        (period_id, sector_id, professional_category_id, category_text, total, notifications)
+    SELECT period_id, sector_id, professional_category_id,
+           CASE WHEN professional_category_id IS NULL THEN professional_category_text END,
+           SUM(quantity_professional), COUNT(*)
+    FROM notifications
+    GROUP BY 1, 2, 3, 4;
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rebuild_notification_category_rollup();
+
+ANALYZE notification_category_rollup;
@@ -0,0 +1,74 @@
+-- V24__add_delta_sync_support.sql
+
+-- Delta sync (GET /api/v1/sync/changes) asks each table for the rows of one sector whose
+-- updated_at falls in (since, watermark]. With these indexes that is a short range scan,
+-- and an empty one when nothing changed.
+CREATE INDEX idx_notifications_sector_updated_at ON notifications(sector_id, updated_at);
+CREATE INDEX idx_adverse_events_sector_updated_at ON adverse_events(sector_id, updated_at);
+CREATE INDEX idx_compliance_indicators_sector_updated_at ON compliance_indicators(sector_id, updated_at);
+CREATE INDEX idx_hand_hygiene_assessments_sector_updated_at ON hand_hygiene_assessments(sector_id, updated_at);
+CREATE INDEX idx_fall_risk_assessments_sector_updated_at ON fall_risk_assessments(sector_id, updated_at);
+CREATE INDEX idx_pressure_injury_risk_assessments_sector_updated_at ON pressure_injury_risk_assessments(sector_id, updated_at);
+CREATE INDEX idx_self_notifications_sector_updated_at ON self_notifications(sector_id, updated_at);
+CREATE INDEX idx_meta_compliance_sector_updated_at ON meta_compliance(sector_id, updated_at);
+CREATE INDEX idx_medication_compliance_sector_updated_at ON medication_compliance(sector_id, updated_at);
+
+-- Deleted rows leave a tombstone so clients can drop them too. They are written by triggers,
+-- which also covers rows removed by ON DELETE CASCADE, and purged after the retention window
+-- (sync.tombstone-retention-days).
+CREATE TABLE sync_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    resource VARCHAR(50) NOT NULL,
+    record_id UUID NOT NULL,
+    period_id UUID NOT NULL,
+    sector_id UUID NOT NULL,
+    deleted_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_sync_tombstones_sector_deleted_at ON sync_tombstones(sector_id, deleted_at);
+CREATE INDEX idx_sync_tombstones_deleted_at ON sync_tombstones(deleted_at);
+
+-- TG_ARGV[0] is the resource name reported to clients
+CREATE OR REPLACE FUNCTION record_sync_tombstones() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO sync_tombstones (resource, record_id, period_id, sector_id)
+    SELECT TG_ARGV[0], id, period_id, sector_id FROM old_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_notifications_sync_tombstones
+    AFTER DELETE ON notifications REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('Notification');
+
+CREATE TRIGGER trg_adverse_events_sync_tombstones
+    AFTER DELETE ON adverse_events REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('AdverseEvent');
+
+CREATE TRIGGER trg_compliance_indicators_sync_tombstones
+    AFTER DELETE ON compliance_indicators REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('ComplianceIndicator');
+
+CREATE TRIGGER trg_hand_hygiene_assessments_sync_tombstones
+    AFTER DELETE ON hand_hygiene_assessments REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('HandHygieneAssessment');
+
+CREATE TRIGGER trg_fall_risk_assessments_sync_tombstones
+    AFTER DELETE ON fall_risk_assessments REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('FallRiskAssessment');
+
+CREATE TRIGGER trg_pressure_injury_risk_assessments_sync_tombstones
+    AFTER DELETE ON pressure_injury_risk_assessments REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('PressureInjuryRiskAssessment');
+
+CREATE TRIGGER trg_self_notifications_sync_tombstones
+    AFTER DELETE ON self_notifications REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('SelfNotification');
+
+CREATE TRIGGER trg_meta_compliance_sync_tombstones
+    AFTER DELETE ON meta_compliance REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('MetaCompliance');
+
+CREATE TRIGGER trg_medication_compliance_sync_tombstones
+    AFTER DELETE ON medication_compliance REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_sync_tombstones('MedicationCompliance');
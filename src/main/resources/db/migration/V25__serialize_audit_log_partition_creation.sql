@@ -0,0 +1,31 @@
+-- V25__serialize_audit_log_partition_creation.sql
+
+-- ensure_audit_log_partition (V22) can be called concurrently: by the maintenance job of
+-- each instance and by the synthetic data generator. Two callers for the same month could
+-- both see it missing and the second CREATE TABLE would fail. Creation now happens under a
+-- transaction-level advisory lock and the check is repeated once it is held; the common
+-- "already exists" case still returns without locking.
+CREATE OR REPLACE FUNCTION ensure_audit_log_partition(p_month DATE) RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::date;
+    v_end DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::date;
+    v_name TEXT := 'audit_logs_' || to_char(p_month, 'YYYY_MM');
+BEGIN
+    IF to_regclass(v_name) IS NOT NULL THEN
+        RETURN v_name;
+    END IF;
+
+    PERFORM pg_advisory_xact_lock(hashtext('ensure_audit_log_partition'));
+    IF to_regclass(v_name) IS NOT NULL THEN
+        RETURN v_name;
+    END IF;
+
+    EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', v_name);
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM audit_logs_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        v_start, v_end, v_name);
+    EXECUTE format('ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)', v_name, v_start, v_end);
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,119 @@
+import requests
+import json
+import uuid
+import time
+import datetime
+
+BASE_URL = "http://localhost:8080/api/v1"
+run_id = str(uuid.uuid4())[:8]
+session = requests.Session()
+
+def log(msg, status=None):
+    if status:
+        print(f"[{status}] {msg}")
+    else:
+        print(f"{msg}")
+
+def check(response, expected_codes=[200, 201], msg=""):
+    if response.status_code in expected_codes:
+        log(f"PASS: {msg} ({response.status_code})", "OK")
+        return True
+    else:
+        log(f"FAIL: {msg} ({response.status_code}) - {response.text}", "ERR")
+        return False
+
+def expect(condition, msg, detail=None):
+    if condition:
+        log(f"PASS: {msg}", "OK")
+    else:
+        log(f"FAIL: {msg} - {detail}", "ERR")
+    return condition
+
+def setup_auth():
+    admin_email = "admin@douglas.com"
+    admin_pass = "admin123"
+    res = session.post(f"{BASE_URL}/auth/login", json={"email": admin_email, "password": admin_pass})
+    if res.status_code == 200:
+        token = res.json()['data']['token']
+        session.headers.update({'Authorization': f'Bearer {token}'})
+        return True
+    return False
+
+def test_audit_log_cursor_paging():
+    log("\n--- Testing Audit Log Cursor Paging ---")
+
+    res = session.post(f"{BASE_URL}/sectors", json={"name": f"Audit {run_id}", "code": f"AUD_{run_id}", "active": True})
+    if not check(res, [201], "Create Sector"): return
+    sector_id = res.json()['data']['id']
+    res = session.post(f"{BASE_URL}/periods", json={"sectorId": sector_id, "month": 5, "year": 2031})
+    if not check(res, [201], "Create Period"): return
+    period_id = res.json()['data']['id']
+
+    # Each create writes one CREATE/AdverseEvent audit entry
+    created = []
+    for n in range(7):
+        res = session.post(f"{BASE_URL}/adverse-events", json={
+            "periodId": period_id,
+            "sectorId": sector_id,
+            "eventDate": datetime.date.today().isoformat(),
+            "eventType": "FALL",
+            "description": f"Audit paging {n}",
+            "quantityCases": 1,
+            "quantityNotifications": 1
+        })
+        if not check(res, [201], f"Create Adverse Event {n}"): return
+        created.append(res.json()['data']['id'])
+
+    # Audit entries are written in the background in batches
+    time.sleep(2)
+
+    page_size = 3
+    params = {"action": "CREATE", "resource": "AdverseEvent", "size": page_size}
+    seen = []
+    found = set()
+    cursor = None
+    pages = 0
+    while pages < 50:
+        if cursor:
+            params["cursor"] = cursor
+        res = session.get(f"{BASE_URL}/audit-logs", params=params)
+        if not check(res, [200], f"Fetch page {pages + 1}"): return
+        body = res.json()
+        items = body['data']
+        pages += 1
+
+        if not expect(len(items) <= page_size, f"Page {pages} holds at most {page_size} entries", len(items)): return
+        seen.extend(items)
+        found.update(item['resourceId'] for item in items if item['resourceId'] in created)
+
+        cursor = body.get('nextCursor')
+        if not cursor or len(found) == len(created):
+            break
+        if not expect(len(items) == page_size, "Only the last page is short", len(items)): return
+
+    ids = [item['id'] for item in seen]
+    expect(len(ids) == len(set(ids)), "No entry appears on two pages")
+    timestamps = [item['createdAt'] for item in seen]
+    expect(all(a >= b for a, b in zip(timestamps, timestamps[1:])), "Entries are ordered newest first")
+    expect(len(found) == len(created), f"All {len(created)} new entries reached through the cursor", f"{len(found)} found in {pages} pages")
+
+    # Newest first: the first page must start with the last adverse event created (unless other writes raced in)
+    first = seen[0]['resourceId'] if seen else None
+    if first != created[-1]:
+        log("First entry is not the last event created; other writes may have happened meanwhile", "WARN")
+
+    res = session.get(f"{BASE_URL}/audit-logs", params={"cursor": "not-a-cursor"})
+    check(res, [400], "Invalid cursor is rejected")
+
+    res = session.get(f"{BASE_URL}/audit-logs", params={"size": 1000})
+    if check(res, [200], "Oversized page request"):
+        expect(len(res.json()['data']) <= 200, "Page size is capped at 200", len(res.json()['data']))
+
+def run():
+    if setup_auth():
+        test_audit_log_cursor_paging()
+    else:
+        log("Login failed", "FATAL")
+
+if __name__ == "__main__":
+    run()
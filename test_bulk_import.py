@@ -0,0 +1,193 @@
+import requests
+import json
+import uuid
+import datetime
+
+BASE_URL = "http://localhost:8080/api/v1"
+run_id = str(uuid.uuid4())[:8]
+session = requests.Session()
+
+# Rows are written in chunks of this size (BulkImportService.CHUNK_SIZE)
+CHUNK_SIZE = 500
+
+def log(msg, status=None):
+    if status:
+        print(f"[{status}] {msg}")
+    else:
+        print(f"{msg}")
+
+def check(response, expected_codes=[200, 201], msg=""):
+    if response.status_code in expected_codes:
+        log(f"PASS: {msg} ({response.status_code})", "OK")
+        return True
+    else:
+        log(f"FAIL: {msg} ({response.status_code}) - {response.text}", "ERR")
+        return False
+
+def expect(condition, msg, detail=None):
+    if condition:
+        log(f"PASS: {msg}", "OK")
+    else:
+        log(f"FAIL: {msg} - {detail}", "ERR")
+    return condition
+
+def setup_auth():
+    admin_email = "admin@douglas.com"
+    admin_pass = "admin123"
+    res = session.post(f"{BASE_URL}/auth/login", json={"email": admin_email, "password": admin_pass})
+    if res.status_code == 200:
+        token = res.json()['data']['token']
+        session.headers.update({'Authorization': f'Bearer {token}'})
+        return True
+    return False
+
+def create_period(sector_id, month, year):
+    res = session.post(f"{BASE_URL}/periods", json={"sectorId": sector_id, "month": month, "year": year})
+    if not check(res, [201], f"Create Period {month}/{year}"):
+        return None
+    return res.json()['data']['id']
+
+def notification(period_id, sector_id, n):
+    return {
+        "type": "NOTIFICATION",
+        "data": {
+            "periodId": period_id,
+            "sectorId": sector_id,
+            "classificationText": "Incidente sem dano",
+            "description": f"Bulk notification {n}",
+            "professionalCategoryText": "Enfermeiro",
+            "quantityClassification": 1,
+            "quantityCategory": 1,
+            "quantityProfessional": 1,
+            "quantity": 1
+        }
+    }
+
+def hand_hygiene(period_id, sector_id, percentage):
+    return {"type": "HAND_HYGIENE", "data": {"periodId": period_id, "sectorId": sector_id, "compliancePercentage": percentage}}
+
+def adverse_event(period_id, sector_id):
+    return {
+        "type": "ADVERSE_EVENT",
+        "data": {
+            "periodId": period_id,
+            "sectorId": sector_id,
+            "eventDate": datetime.date.today().isoformat(),
+            "eventType": "FALL",
+            "description": "Bulk adverse event",
+            "quantityCases": 1,
+            "quantityNotifications": 1
+        }
+    }
+
+def post_json(records):
+    return session.post(f"{BASE_URL}/bulk-import", json=records)
+
+def post_ndjson(records):
+    body = "\n".join(json.dumps(r) for r in records)
+    return session.post(f"{BASE_URL}/bulk-import", data=body.encode("utf-8"), headers={"Content-Type": "application/x-ndjson"})
+
+def test_valid_file(sector_id):
+    log("\n--- Bulk Import: Valid File (NDJSON, several chunks) ---")
+    period_id = create_period(sector_id, 1, 2031)
+    if not period_id: return
+
+    count = CHUNK_SIZE * 2 + 200
+    records = [notification(period_id, sector_id, n) for n in range(count)]
+    records.append(hand_hygiene(period_id, sector_id, 87.5))
+    records.append(adverse_event(period_id, sector_id))
+
+    res = post_ndjson(records)
+    if not check(res, [200], "Import valid NDJSON file"): return
+    data = res.json()['data']
+    expect(data['total'] == len(records) and data['created'] == len(records) and data['failed'] == 0,
+           f"All {len(records)} rows created", data and {k: data[k] for k in ('total', 'created', 'failed')})
+    expect([r['index'] for r in data['results']] == list(range(len(records))), "Results are in input order")
+    expect(all(r.get('id') for r in data['results']), "Every created row reports its id")
+
+    res = session.get(f"{BASE_URL}/notifications/page", params={"periodId": period_id, "size": 1, "includeTotal": "true"})
+    if check(res, [200], "Count imported notifications"):
+        total = res.json()['data'].get('totalElements')
+        expect(total == count, f"{count} notifications stored", total)
+
+def test_mixed_file(sector_id):
+    log("\n--- Bulk Import: Valid and Invalid Rows Mixed (JSON array) ---")
+    period_id = create_period(sector_id, 2, 2031)
+    if not period_id: return
+
+    records = [
+        notification(period_id, sector_id, 0),                          # 0 ok
+        {"type": "UNKNOWN_TYPE", "data": {}},                            # 1 unknown type
+        notification(str(uuid.uuid4()), sector_id, 2),                   # 2 period does not exist
+        hand_hygiene(period_id, sector_id, 90),                          # 3 ok
+        hand_hygiene(period_id, sector_id, 91),                          # 4 duplicate (UNIQUE period_id), fails in the database
+        {"type": "NOTIFICATION", "data": {"periodId": period_id}},       # 5 missing required fields
+        adverse_event(period_id, sector_id),                             # 6 ok
+    ]
+    expected_ok = {0, 3, 6}
+
+    res = post_json(records)
+    if not check(res, [200], "Import mixed JSON array"): return
+    data = res.json()['data']
+    expect(data['total'] == len(records), "Every row reported", data['total'])
+    expect(data['created'] == len(expected_ok) and data['failed'] == len(records) - len(expected_ok),
+           f"{len(expected_ok)} created, {len(records) - len(expected_ok)} failed", {k: data[k] for k in ('created', 'failed')})
+
+    by_index = {r['index']: r for r in data['results']}
+    for i in range(len(records)):
+        row = by_index.get(i)
+        if row is None:
+            log(f"FAIL: Row {i} missing from results", "ERR")
+        elif i in expected_ok:
+            expect(row['success'] and row.get('id'), f"Row {i} created", row)
+        else:
+            expect(not row['success'] and row.get('error'), f"Row {i} rejected with an error: {row.get('error')}", row)
+
+    # The duplicate failed the whole chunk; the row-by-row retry must still have kept the valid rows
+    res = session.get(f"{BASE_URL}/notifications/page", params={"periodId": period_id, "includeTotal": "true"})
+    if check(res, [200], "List notifications of the period"):
+        expect(res.json()['data'].get('totalElements') == 1, "Only the valid notification was stored", res.json()['data'])
+
+def test_closed_period(sector_id):
+    log("\n--- Bulk Import: Closed Period ---")
+    period_id = create_period(sector_id, 3, 2031)
+    if not period_id: return
+    res = session.post(f"{BASE_URL}/periods/{period_id}/close")
+    if not check(res, [200], "Close Period"): return
+
+    records = [notification(period_id, sector_id, n) for n in range(3)] + [hand_hygiene(period_id, sector_id, 80)]
+    res = post_json(records)
+    if not check(res, [200], "Import into closed period"): return
+    data = res.json()['data']
+    expect(data['created'] == 0 and data['failed'] == len(records), "No rows created", {k: data[k] for k in ('created', 'failed')})
+    expect(all('closed' in (r.get('error') or '') for r in data['results']), "Every row reports the closed period",
+           [r.get('error') for r in data['results']])
+
+def test_malformed_body(sector_id):
+    log("\n--- Bulk Import: Malformed JSON ---")
+    period_id = create_period(sector_id, 4, 2031)
+    if not period_id: return
+
+    body = json.dumps(notification(period_id, sector_id, 0)) + "\n{\"type\": \"NOTIFICATION\", \"data\": "
+    res = session.post(f"{BASE_URL}/bulk-import", data=body.encode("utf-8"), headers={"Content-Type": "application/x-ndjson"})
+    if not check(res, [200], "Import truncated NDJSON"): return
+    data = res.json()['data']
+    expect(data['created'] == 1, "Rows before the malformed one are kept", data['created'])
+    expect(any((r.get('error') or '').startswith("Malformed input") for r in data['results']), "Malformed input reported")
+
+def run():
+    if not setup_auth():
+        log("Login failed", "FATAL")
+        return
+
+    res = session.post(f"{BASE_URL}/sectors", json={"name": f"Bulk {run_id}", "code": f"BLK_{run_id}", "active": True})
+    if not check(res, [201], "Create Sector"): return
+    sector_id = res.json()['data']['id']
+
+    test_valid_file(sector_id)
+    test_mixed_file(sector_id)
+    test_closed_period(sector_id)
+    test_malformed_body(sector_id)
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,131 @@
+import requests
+import json
+import uuid
+
+BASE_URL = "http://localhost:8080/api/v1"
+run_id = str(uuid.uuid4())[:8]
+session = requests.Session()
+
+def log(msg, status=None):
+    if status:
+        print(f"[{status}] {msg}")
+    else:
+        print(f"{msg}")
+
+def check(response, expected_codes=[200, 201], msg=""):
+    if response.status_code in expected_codes:
+        log(f"PASS: {msg} ({response.status_code})", "OK")
+        return True
+    else:
+        log(f"FAIL: {msg} ({response.status_code}) - {response.text}", "ERR")
+        return False
+
+def expect(condition, msg, detail=None):
+    if condition:
+        log(f"PASS: {msg}", "OK")
+    else:
+        log(f"FAIL: {msg} - {detail}", "ERR")
+    return condition
+
+def setup_auth():
+    admin_email = "admin@douglas.com"
+    admin_pass = "admin123"
+    res = session.post(f"{BASE_URL}/auth/login", json={"email": admin_email, "password": admin_pass})
+    if res.status_code == 200:
+        token = res.json()['data']['token']
+        session.headers.update({'Authorization': f'Bearer {token}'})
+        return True
+    return False
+
+def get_page(**params):
+    return session.get(f"{BASE_URL}/notifications/page", params=params)
+
+def test_notification_paging():
+    log("\n--- Testing Paged Notification Listing ---")
+
+    res = session.post(f"{BASE_URL}/sectors", json={"name": f"Paging {run_id}", "code": f"PAG_{run_id}", "active": True})
+    if not check(res, [201], "Create Sector"): return
+    sector_id = res.json()['data']['id']
+    res = session.post(f"{BASE_URL}/periods", json={"sectorId": sector_id, "month": 6, "year": 2031})
+    if not check(res, [201], "Create Period"): return
+    period_id = res.json()['data']['id']
+    res = session.post(f"{BASE_URL}/notification-classifications", json={"name": f"Paging {run_id}", "active": True})
+    if not check(res, [200, 201], "Create Classification"): return
+    classification_id = res.json()['data']['id']
+
+    # quantity 1..11; every third one carries the classification
+    total = 11
+    classified = 0
+    for n in range(total):
+        with_class = n % 3 == 0
+        classified += with_class
+        res = session.post(f"{BASE_URL}/notifications", json={
+            "periodId": period_id,
+            "sectorId": sector_id,
+            "classificationId": classification_id if with_class else None,
+            "classificationText": None if with_class else "Sem classificação",
+            "description": f"Paging {n}",
+            "professionalCategoryText": "Enfermeiro",
+            "quantityClassification": 1,
+            "quantityCategory": 1,
+            "quantityProfessional": 1,
+            "quantity": n + 1
+        })
+        if not check(res, [201], f"Create Notification {n}"): return
+
+    # Walk all pages sorted by quantity
+    size = 4
+    quantities = []
+    ids = []
+    page = 0
+    while True:
+        res = get_page(periodId=period_id, page=page, size=size, sort="quantity", direction="ASC")
+        if not check(res, [200], f"Fetch page {page}"): return
+        data = res.json()['data']
+        expect(data['page'] == page and data['size'] == size, f"Page {page} echoes page and size", data)
+        expect('totalElements' not in data, "No total unless requested")
+        quantities.extend(item['quantity'] for item in data['items'])
+        ids.extend(item['id'] for item in data['items'])
+        if not data['hasNext']:
+            break
+        page += 1
+        if page > 10:
+            log("FAIL: hasNext never became false", "ERR")
+            return
+
+    expect(page == (total - 1) // size, f"{page + 1} pages for {total} rows", page + 1)
+    expect(quantities == list(range(1, total + 1)), "Rows come in quantity order across pages", quantities)
+    expect(len(set(ids)) == total, "No row repeated across pages")
+
+    res = get_page(periodId=period_id, size=size, includeTotal="true")
+    if check(res, [200], "Page with total"):
+        data = res.json()['data']
+        expect(data.get('totalElements') == total and data.get('totalPages') == (total + size - 1) // size,
+               "totalElements and totalPages", data)
+
+    res = get_page(periodId=period_id, size=size, sort="quantity", direction="DESC")
+    if check(res, [200], "Descending sort"):
+        expect([i['quantity'] for i in res.json()['data']['items']] == [11, 10, 9, 8], "Largest quantities first")
+
+    res = get_page(periodId=period_id, classificationId=classification_id, includeTotal="true")
+    if check(res, [200], "Filter by classification"):
+        data = res.json()['data']
+        expect(data.get('totalElements') == classified, f"{classified} classified notifications", data.get('totalElements'))
+        expect(all(i['classificationId'] == classification_id for i in data['items']), "Only the classification requested")
+
+    res = get_page(sectorId=sector_id, size=200, includeTotal="true")
+    if check(res, [200], "List by sector"):
+        expect(res.json()['data'].get('totalElements') == total, "Sector listing holds all rows")
+
+    check(get_page(periodId=period_id, sort="description"), [400], "Unknown sort field is rejected")
+    check(get_page(periodId=period_id, direction="SIDEWAYS"), [400], "Unknown direction is rejected")
+    check(get_page(), [400], "periodId or sectorId is required")
+
+def run():
+    if setup_auth():
+        test_notification_paging()
+    else:
+        log("Login failed", "FATAL")
+
+if __name__ == "__main__":
+    run()
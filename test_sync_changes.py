@@ -0,0 +1,138 @@
+import requests
+import json
+import uuid
+import time
+import datetime
+
+BASE_URL = "http://localhost:8080/api/v1"
+run_id = str(uuid.uuid4())[:8]
+session = requests.Session()
+
+# Must match sync.commit-lag-ms: changes only show up once the watermark has passed them
+COMMIT_LAG_SECONDS = 15
+
+def log(msg, status=None):
+    if status:
+        print(f"[{status}] {msg}")
+    else:
+        print(f"{msg}")
+
+def check(response, expected_codes=[200, 201], msg=""):
+    if response.status_code in expected_codes:
+        log(f"PASS: {msg} ({response.status_code})", "OK")
+        return True
+    else:
+        log(f"FAIL: {msg} ({response.status_code}) - {response.text}", "ERR")
+        return False
+
+def expect(condition, msg, detail=None):
+    if condition:
+        log(f"PASS: {msg}", "OK")
+    else:
+        log(f"FAIL: {msg} - {detail}", "ERR")
+    return condition
+
+def setup_auth():
+    admin_email = "admin@douglas.com"
+    admin_pass = "admin123"
+    res = session.post(f"{BASE_URL}/auth/login", json={"email": admin_email, "password": admin_pass})
+    if res.status_code == 200:
+        token = res.json()['data']['token']
+        session.headers.update({'Authorization': f'Bearer {token}'})
+        return True
+    return False
+
+def changes(**params):
+    res = session.get(f"{BASE_URL}/sync/changes", params=params)
+    if not check(res, [200], f"Sync changes {sorted(params)}"):
+        return None
+    return res.json()['data']
+
+def create_notification(period_id, sector_id, description):
+    res = session.post(f"{BASE_URL}/notifications", json={
+        "periodId": period_id,
+        "sectorId": sector_id,
+        "classificationText": "Incidente sem dano",
+        "description": description,
+        "professionalCategoryText": "Enfermeiro",
+        "quantityClassification": 1,
+        "quantityCategory": 1,
+        "quantityProfessional": 1,
+        "quantity": 1
+    })
+    if not check(res, [201], f"Create Notification '{description}'"):
+        return None
+    return res.json()['data']['id']
+
+def test_sync_changes():
+    log("\n--- Testing Delta Sync ---")
+
+    res = session.post(f"{BASE_URL}/sectors", json={"name": f"Sync {run_id}", "code": f"SYN_{run_id}", "active": True})
+    if not check(res, [201], "Create Sector"): return
+    sector_id = res.json()['data']['id']
+    period_ids = []
+    for month in (7, 8):
+        res = session.post(f"{BASE_URL}/periods", json={"sectorId": sector_id, "month": month, "year": 2031})
+        if not check(res, [201], f"Create Period {month}/2031"): return
+        period_ids.append(res.json()['data']['id'])
+    period_a, period_b = period_ids
+
+    # 1. No watermark yet: the client must load everything and start from the returned one
+    data = changes(sectorId=sector_id)
+    if data is None: return
+    expect(data['resetRequired'], "First call asks for a full reload")
+    start = data['watermark']
+
+    data = changes(sectorId=sector_id, since=start)
+    if data is None: return
+    expect(not data['resetRequired'] and not data['notifications'] and not data['deleted'], "Nothing changed yet", data)
+
+    # 2. Changes in both periods, plus one record created and deleted again
+    kept_a = create_notification(period_a, sector_id, "Sync A")
+    kept_b = create_notification(period_b, sector_id, "Sync B")
+    removed = create_notification(period_a, sector_id, "Sync removed")
+    if not (kept_a and kept_b and removed): return
+    res = session.post(f"{BASE_URL}/indicators/hand-hygiene", json={"periodId": period_a, "sectorId": sector_id, "compliancePercentage": 82.5})
+    if not check(res, [201], "Create Hand Hygiene"): return
+    hand_hygiene_id = res.json()['data']['id']
+    res = session.delete(f"{BASE_URL}/notifications/{removed}")
+    if not check(res, [200, 204], "Delete Notification"): return
+
+    log(f"Waiting {COMMIT_LAG_SECONDS + 2}s for the watermark to pass the changes...")
+    time.sleep(COMMIT_LAG_SECONDS + 2)
+
+    # 3. Whole sector
+    data = changes(sectorId=sector_id, since=start)
+    if data is None: return
+    notification_ids = {n['id'] for n in data['notifications']}
+    expect(notification_ids == {kept_a, kept_b}, "Both remaining notifications returned", notification_ids)
+    expect([h['id'] for h in data['handHygieneAssessments']] == [hand_hygiene_id], "Hand hygiene returned")
+    deleted = [(d['resource'], d['id']) for d in data['deleted']]
+    expect(deleted == [("Notification", removed)], "Deleted notification reported as a tombstone", deleted)
+    next_watermark = data['watermark']
+
+    # 4. One period only: the filter applies to the records and to the tombstones
+    data = changes(sectorId=sector_id, periodId=period_b, since=start)
+    if data is None: return
+    expect({n['id'] for n in data['notifications']} == {kept_b}, "Period filter keeps only period B", data['notifications'])
+    expect(not data['handHygieneAssessments'] and not data['deleted'], "Nothing from period A", data)
+
+    # 5. From the new watermark nothing is pending
+    data = changes(sectorId=sector_id, since=next_watermark)
+    if data is None: return
+    expect(not data['resetRequired'] and not data['notifications'] and not data['deleted'], "Each change is returned once", data)
+
+    # 6. A watermark older than the tombstone retention forces a reload
+    old = (datetime.datetime.now() - datetime.timedelta(days=365)).isoformat(timespec="seconds")
+    data = changes(sectorId=sector_id, since=old)
+    if data is None: return
+    expect(data['resetRequired'], "Stale watermark asks for a full reload")
+
+def run():
+    if setup_auth():
+        test_sync_changes()
+    else:
+        log("Login failed", "FATAL")
+
+if __name__ == "__main__":
+    run()